@@ -1,14 +1,26 @@
 """Alembic environment configuration."""
 from logging.config import fileConfig
 
-from alembic import context
 from sqlalchemy import engine_from_config, pool
 
+from alembic import context
 from app.config import settings
 from app.db.base import Base
 
 # Import all models to ensure they are registered with SQLAlchemy
-from app.db.models import Document, LLMLog, Project, User, WorkflowState  # noqa: F401
+from app.db.models import (  # noqa: F401
+    Document,
+    DocumentBlob,
+    DocumentVersion,
+    IdeaFingerprint,
+    LLMLog,
+    PlanStage,
+    PlanTask,
+    Project,
+    User,
+    WorkflowState,
+    WorkflowTimeline,
+)
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
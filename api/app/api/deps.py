@@ -1,11 +1,11 @@
 """API dependencies."""
 from typing import AsyncGenerator
+from uuid import UUID
 
-from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.auth import verify_admin_token
-from app.db.session import get_db
+from app.db.session import get_db, read_session_factory, session_scope
 
 # Re-export for convenience
 __all__ = ["get_db", "verify_admin_token"]
@@ -15,3 +15,17 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
     """Get database session dependency."""
     async for session in get_db():
         yield session
+
+
+async def get_read_db_session(project_id: UUID) -> AsyncGenerator[AsyncSession, None]:
+    """Get a session for a read-only project endpoint.
+
+    Reads go to the replica (DATABASE_READ_URL) unless the project was
+    updated recently, in which case the primary is used.
+
+    Args:
+        project_id: Project UUID (path parameter)
+
+    """
+    async with session_scope(await read_session_factory(project_id)) as session:
+        yield session
@@ -0,0 +1,325 @@
+"""Admin API endpoints."""
+import logging
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_db_session, verify_admin_token
+from app.core.security import limiter
+from app.db.session import (
+    AsyncSessionLocal,
+    engine,
+    pool_metrics,
+    read_engine,
+    replica_pool_metrics,
+)
+from app.schemas.admin import (
+    ArchiveJobResponse,
+    ArchiveRequest,
+    DatabasePoolResponse,
+    IdeaBackfillResponse,
+    ModelCatalogResponse,
+    RestoreResponse,
+    SchedulerMetricsResponse,
+    SearchBackfillResponse,
+)
+from app.services.archive_service import (
+    ArchiveConflictError,
+    InvalidArchiveError,
+    archive_selected,
+    restore_project,
+    select_archivable_projects,
+)
+from app.services.idea_similarity_service import backfill_idea_fingerprints
+from app.services.log_export_service import (
+    LOG_EXPORT_FORMATS,
+    llm_log_query,
+    stream_rows,
+    workflow_state_query,
+)
+from app.services.model_catalog import ModelCatalogError, model_catalog
+from app.services.search_service import backfill_search_vectors
+from app.workflow.scheduler import workflow_scheduler
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+
+@router.get(
+    "/scheduler",
+    response_model=SchedulerMetricsResponse,
+    dependencies=[Depends(verify_admin_token)],
+)
+@limiter.limit("30/minute")
+async def get_scheduler_metrics(request: Request) -> SchedulerMetricsResponse:
+    """Get workflow scheduler metrics.
+
+    Returns:
+        Global and per-user running/queued workflow counts and queue wait times
+
+    """
+    return SchedulerMetricsResponse.model_validate(workflow_scheduler.metrics())
+
+
+@router.get(
+    "/db-pool",
+    response_model=DatabasePoolResponse,
+    dependencies=[Depends(verify_admin_token)],
+)
+@limiter.limit("30/minute")
+async def get_db_pool_metrics(request: Request) -> DatabasePoolResponse:
+    """Get database connection pool metrics.
+
+    Returns:
+        Pool limits, connections in use and checkout wait times (primary and replica)
+
+    """
+    metrics = pool_metrics.snapshot(engine.pool)
+    if read_engine is not None:
+        metrics["replica"] = replica_pool_metrics.snapshot(read_engine.pool)
+    return DatabasePoolResponse.model_validate(metrics)
+
+
+@router.post(
+    "/archive",
+    response_model=ArchiveJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    dependencies=[Depends(verify_admin_token)],
+)
+@limiter.limit("5/minute")
+async def archive_old_projects(
+    request: Request,
+    archive_request: ArchiveRequest,
+    background_tasks: BackgroundTasks,
+) -> ArchiveJobResponse:
+    """Archive completed projects older than N days to cold storage.
+
+    Projects are selected immediately and archived in a background job;
+    progress is reported in the logs.
+
+    Args:
+        archive_request: Age threshold, batch limit and dry-run flag
+        background_tasks: FastAPI background tasks
+
+    Returns:
+        Selected projects and whether an archive job was queued
+
+    """
+    selected = await select_archivable_projects(
+        older_than_days=archive_request.older_than_days,
+        limit=archive_request.limit,
+    )
+    queued = bool(selected) and not archive_request.dry_run
+    if queued:
+        background_tasks.add_task(archive_selected, selected)
+        logger.info(f"Queued archive job for {len(selected)} projects")
+
+    return ArchiveJobResponse(selected=selected, dry_run=archive_request.dry_run, queued=queued)
+
+
+@router.post(
+    "/archive/{project_id}/restore",
+    response_model=RestoreResponse,
+    dependencies=[Depends(verify_admin_token)],
+)
+@limiter.limit("10/minute")
+async def restore_archived_project(request: Request, project_id: UUID) -> RestoreResponse:
+    """Restore an archived project into the database.
+
+    Args:
+        project_id: Project UUID
+
+    Returns:
+        Restored row counts per table
+
+    Raises:
+        HTTPException: If no archive exists (404), the project is already present (409)
+            or the archive is unreadable (422)
+
+    """
+    try:
+        rows = await restore_project(project_id)
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
+    except ArchiveConflictError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e)) from e
+    except InvalidArchiveError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e)) from e
+
+    return RestoreResponse(project_id=project_id, rows=rows)
+
+
+@router.get(
+    "/llm-logs/export",
+    dependencies=[Depends(verify_admin_token)],
+    responses={200: {"content": {"application/x-ndjson": {}, "text/csv": {}}}},
+)
+@limiter.limit("5/minute")
+async def export_llm_logs(
+    request: Request,
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$", description="Output format"),
+    start: Optional[datetime] = Query(None, description="Only logs created at or after this time"),
+    end: Optional[datetime] = Query(None, description="Only logs created before this time"),
+    model: Optional[str] = Query(None, description="Only logs for this model"),
+    phase: Optional[str] = Query(None, description="Only logs for this phase"),
+    project_id: Optional[UUID] = Query(None, description="Only logs for this project"),
+) -> StreamingResponse:
+    """Stream LLM logs across all projects as NDJSON or CSV.
+
+    Args:
+        format: Output format (ndjson or csv)
+        start: Start of the date range (inclusive)
+        end: End of the date range (exclusive)
+        model: Model filter
+        phase: Phase filter
+        project_id: Project filter
+
+    Returns:
+        Streaming response backed by a server-side cursor
+
+    """
+    query = llm_log_query(start=start, end=end, model=model, phase=phase, project_id=project_id)
+    return StreamingResponse(
+        stream_rows(AsyncSessionLocal, query, format),
+        media_type=LOG_EXPORT_FORMATS[format],
+        headers={"Content-Disposition": f'attachment; filename="llm-logs.{format}"'},
+    )
+
+
+@router.get(
+    "/workflow-states/export",
+    dependencies=[Depends(verify_admin_token)],
+    responses={200: {"content": {"application/x-ndjson": {}, "text/csv": {}}}},
+)
+@limiter.limit("5/minute")
+async def export_workflow_states(
+    request: Request,
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$", description="Output format"),
+    start: Optional[datetime] = Query(None, description="Only states created at or after this time"),
+    end: Optional[datetime] = Query(None, description="Only states created before this time"),
+    phase: Optional[str] = Query(None, description="Only states for this phase"),
+    state_status: Optional[str] = Query(None, alias="status", description="Only states with this status"),
+    project_id: Optional[UUID] = Query(None, description="Only states for this project"),
+    include_data: bool = Query(False, description="Include input/output JSON payloads"),
+) -> StreamingResponse:
+    """Stream workflow states across all projects as NDJSON or CSV.
+
+    Args:
+        format: Output format (ndjson or csv)
+        start: Start of the date range (inclusive)
+        end: End of the date range (exclusive)
+        phase: Phase filter
+        state_status: Status filter
+        project_id: Project filter
+        include_data: Whether to include the input/output payloads
+
+    Returns:
+        Streaming response backed by a server-side cursor
+
+    """
+    query = workflow_state_query(
+        start=start,
+        end=end,
+        phase=phase,
+        status=state_status,
+        project_id=project_id,
+        include_data=include_data,
+    )
+    return StreamingResponse(
+        stream_rows(AsyncSessionLocal, query, format),
+        media_type=LOG_EXPORT_FORMATS[format],
+        headers={"Content-Disposition": f'attachment; filename="workflow-states.{format}"'},
+    )
+
+
+@router.post(
+    "/search/backfill",
+    response_model=SearchBackfillResponse,
+    dependencies=[Depends(verify_admin_token)],
+)
+@limiter.limit("5/minute")
+async def backfill_document_search(
+    request: Request,
+    db: AsyncSession = Depends(get_db_session),
+) -> SearchBackfillResponse:
+    """Index documents saved before full-text search was maintained.
+
+    Args:
+        db: Database session
+
+    Returns:
+        Number of indexed documents
+
+    """
+    return SearchBackfillResponse(updated=await backfill_search_vectors(db))
+
+
+@router.post(
+    "/ideas/backfill",
+    response_model=IdeaBackfillResponse,
+    dependencies=[Depends(verify_admin_token)],
+)
+@limiter.limit("5/minute")
+async def backfill_ideas(
+    request: Request,
+    db: AsyncSession = Depends(get_db_session),
+) -> IdeaBackfillResponse:
+    """Fingerprint project ideas created before near-duplicate detection.
+
+    Args:
+        db: Database session
+
+    Returns:
+        Number of fingerprinted projects
+
+    """
+    return IdeaBackfillResponse(indexed=await backfill_idea_fingerprints(db))
+
+
+@router.get(
+    "/models",
+    response_model=ModelCatalogResponse,
+    dependencies=[Depends(verify_admin_token)],
+)
+@limiter.limit("30/minute")
+async def get_model_catalog(request: Request) -> ModelCatalogResponse:
+    """Get the active model catalog.
+
+    Returns:
+        Models with pricing and capabilities, and the per-phase routing
+
+    """
+    return ModelCatalogResponse.model_validate(model_catalog.summary())
+
+
+@router.post(
+    "/models/reload",
+    response_model=ModelCatalogResponse,
+    dependencies=[Depends(verify_admin_token)],
+)
+@limiter.limit("10/minute")
+async def reload_model_catalog(request: Request) -> ModelCatalogResponse:
+    """Reload the model catalog file now (it is also reloaded when it changes).
+
+    Returns:
+        The reloaded catalog
+
+    Raises:
+        HTTPException: If the file is invalid (the previous catalog stays active)
+
+    """
+    try:
+        model_catalog.load()
+    except ModelCatalogError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e),
+        ) from e
+
+    logger.info(f"Model catalog reloaded from {model_catalog.path}")
+    return ModelCatalogResponse.model_validate(model_catalog.summary())
@@ -0,0 +1,74 @@
+"""Documents API endpoints (across projects)."""
+import logging
+from dataclasses import asdict
+from typing import Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_db_session, verify_admin_token
+from app.core.security import limiter
+from app.schemas.document import DocumentSearchHit, DocumentSearchResponse
+from app.services.search_service import search_documents
+from app.workflow.state_machine import DocumentType
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+
+@router.get(
+    "/search",
+    response_model=DocumentSearchResponse,
+    dependencies=[Depends(verify_admin_token)],
+)
+@limiter.limit("60/minute")
+async def search(
+    request: Request,
+    q: str = Query(..., min_length=2, max_length=500, description="Search query (web-search syntax)"),
+    type: Optional[str] = Query(None, description="Document type filter"),
+    user_id: Optional[UUID] = Query(None, description="Only documents of this user's projects"),
+    limit: int = Query(20, ge=1, le=100, description="Page size"),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page"),
+    db: AsyncSession = Depends(get_db_session),
+) -> DocumentSearchResponse:
+    """Full-text search across all generated documents.
+
+    Args:
+        q: Search query, e.g. ``kafka -rabbitmq`` or ``"event sourcing"``
+        type: Document type filter (EVENT_STORMING, PRD, TECH_STACK, EXECUTION_PLAN)
+        user_id: Project owner filter
+        limit: Page size
+        cursor: Keyset pagination cursor
+        db: Database session
+
+    Returns:
+        Ranked results with snippets
+
+    Raises:
+        HTTPException: If the document type or cursor is invalid
+
+    """
+    document_type = None
+    if type:
+        try:
+            document_type = DocumentType[type.upper()].value
+        except KeyError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid document type: {type}. Valid types: EVENT_STORMING, PRD, TECH_STACK, EXECUTION_PLAN",
+            ) from None
+
+    try:
+        hits, next_cursor = await search_documents(
+            db, q, limit=limit, cursor=cursor, document_type=document_type, user_id=user_id
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+
+    return DocumentSearchResponse(
+        query=q,
+        results=[DocumentSearchHit(**asdict(hit)) for hit in hits],
+        next_cursor=next_cursor,
+    )
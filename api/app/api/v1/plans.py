@@ -0,0 +1,157 @@
+"""Execution plan stages and tasks API endpoints."""
+import logging
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Path, Request, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_db_session, verify_admin_token
+from app.core.security import limiter
+from app.db.repository import ProjectNotFoundError
+from app.schemas.plan import (
+    PlanStageResponse,
+    PlanStagesResponse,
+    PlanStageTasksResponse,
+    PlanTaskResponse,
+    PlanTaskUpdate,
+)
+from app.workflow.plan_storage import get_stage_tasks, list_plan_stages, set_task_completed
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+
+@router.get(
+    "/{project_id}/plan/stages",
+    response_model=PlanStagesResponse,
+    dependencies=[Depends(verify_admin_token)],
+)
+@limiter.limit("60/minute")
+async def get_plan_stages(
+    request: Request,
+    project_id: UUID,
+    db: AsyncSession = Depends(get_db_session),
+) -> PlanStagesResponse:
+    """List the stages of a project's execution plan with progress counts.
+
+    Args:
+        project_id: Project UUID
+        db: Database session
+
+    Returns:
+        Stages in plan order (empty until the execution plan is generated)
+
+    Raises:
+        HTTPException: If project not found
+
+    """
+    try:
+        stages = await list_plan_stages(db, project_id)
+    except ProjectNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
+
+    return PlanStagesResponse(
+        project_id=project_id,
+        stages=[
+            PlanStageResponse(
+                position=stage.position,
+                number=stage.number,
+                title=stage.title,
+                total_tasks=total,
+                completed_tasks=completed,
+            )
+            for stage, total, completed in stages
+        ],
+    )
+
+
+@router.get(
+    "/{project_id}/plan/stages/{position}/tasks",
+    response_model=PlanStageTasksResponse,
+    dependencies=[Depends(verify_admin_token)],
+)
+@limiter.limit("60/minute")
+async def get_plan_stage_tasks(
+    request: Request,
+    project_id: UUID,
+    position: int = Path(..., ge=1, description="Stage position (1-based)"),
+    db: AsyncSession = Depends(get_db_session),
+) -> PlanStageTasksResponse:
+    """Get the tasks of one execution plan stage.
+
+    Args:
+        project_id: Project UUID
+        position: Stage position (1-based)
+        db: Database session
+
+    Returns:
+        Stage with its tasks in plan order
+
+    Raises:
+        HTTPException: If project or stage not found
+
+    """
+    try:
+        stage_tasks = await get_stage_tasks(db, project_id, position)
+    except ProjectNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
+    if stage_tasks is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Stage {position} not found for project {project_id}",
+        )
+
+    stage, tasks = stage_tasks
+    return PlanStageTasksResponse(
+        project_id=project_id,
+        stage=PlanStageResponse(
+            position=stage.position,
+            number=stage.number,
+            title=stage.title,
+            total_tasks=len(tasks),
+            completed_tasks=sum(1 for task in tasks if task.completed),
+        ),
+        tasks=[PlanTaskResponse.model_validate(task) for task in tasks],
+    )
+
+
+@router.patch(
+    "/{project_id}/plan/tasks/{task_id}",
+    response_model=PlanTaskResponse,
+    dependencies=[Depends(verify_admin_token)],
+)
+@limiter.limit("120/minute")
+async def update_plan_task(
+    request: Request,
+    project_id: UUID,
+    task_id: UUID,
+    task_update: PlanTaskUpdate,
+    db: AsyncSession = Depends(get_db_session),
+) -> PlanTaskResponse:
+    """Mark an execution plan task as completed or not.
+
+    Updates the task row only; the plan document is not re-parsed or rewritten.
+
+    Args:
+        project_id: Project UUID
+        task_id: Task UUID
+        task_update: New completion state
+        db: Database session
+
+    Returns:
+        Updated task
+
+    Raises:
+        HTTPException: If task not found
+
+    """
+    task = await set_task_completed(db, project_id, task_id, task_update.completed)
+    if task is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Task {task_id} not found for project {project_id}",
+        )
+
+    logger.info(f"Task {task_id} of project {project_id} marked completed={task.completed}")
+    return PlanTaskResponse.model_validate(task)
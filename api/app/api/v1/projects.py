@@ -1,26 +1,84 @@
 """Projects API endpoints."""
+import asyncio
 import logging
-from typing import List
+from datetime import datetime
+from typing import List, Optional, Tuple
 from uuid import UUID
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, status
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from fastapi.responses import StreamingResponse
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_db_session, verify_admin_token
+from app.api.deps import get_db_session, get_read_db_session, verify_admin_token
+from app.core.json_encoding import FastJSONResponse
+from app.core.ranges import RangeNotSatisfiableError, content_range, parse_byte_range
 from app.core.security import limiter
-from app.db.models import LLMLog, Project
-from app.schemas.document import DocumentResponse, DocumentsResponse
+from app.core.websocket_manager import manager as ws_manager
+from app.db.models import Document, Project, WorkflowTimeline
+from app.db.repository import (
+    ProjectNotFoundError,
+    load_project_document,
+    load_project_documents,
+    load_project_llm_logs,
+)
+from app.db.session import read_session_factory, session_scope
+from app.schemas.document import (
+    DocumentDiffResponse,
+    DocumentResponse,
+    DocumentSection,
+    DocumentSectionResponse,
+    DocumentSectionsResponse,
+    DocumentsResponse,
+    DocumentVersionContentResponse,
+    DocumentVersionResponse,
+    DocumentVersionsResponse,
+    document_payload,
+)
 from app.schemas.project import (
     CostBreakdownItem,
+    ProjectCancelRequest,
+    ProjectCancelResponse,
     ProjectCostResponse,
     ProjectCreate,
     ProjectCreateResponse,
     ProjectResponse,
     ProjectStartWorkflowResponse,
+    SimilarProjectInfo,
+)
+from app.schemas.workflow import WorkflowTimelineResponse
+from app.services.export_service import (
+    EXPORT_FORMATS,
+    export_etag,
+    get_export_documents,
+    stream_export,
+)
+from app.services.idea_similarity_service import (
+    build_fingerprint,
+    compute_signature,
+    find_similar_project,
+)
+from app.workflow.cancellation import workflow_registry
+from app.workflow.deltas import diff_documents
+from app.workflow.document_storage import (
+    get_document_version,
+    get_section_index,
+    list_document_versions,
+    load_blob_content,
+    read_document_bytes,
 )
-from app.workflow.document_storage import get_all_documents, get_document
 from app.workflow.engine import WorkflowEngine
+from app.workflow.profiler import critical_path, critical_path_breakdown
+from app.workflow.scheduler import workflow_scheduler
 from app.workflow.state_machine import DocumentType, WorkflowStatus
 
 logger = logging.getLogger(__name__)
@@ -28,18 +86,32 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
-async def execute_workflow_background(project_id: UUID, db: AsyncSession) -> None:
+async def execute_workflow_background(project_id: UUID, user_id: UUID) -> None:
     """Execute workflow in background.
 
+    The workflow waits for a fair execution slot for its user before it starts.
+    It runs after the response is sent, when the request's session is already
+    closed, so the engine opens its own sessions.
+
     Args:
         project_id: Project UUID
-        db: Database session
+        user_id: Owner user UUID (scheduling tenant)
 
     """
+    engine = WorkflowEngine(project_id)
+    workflow_registry.register(project_id)
     try:
-        logger.info(f"Starting background workflow for project {project_id}")
-        engine = WorkflowEngine(db, project_id)
-        success = await engine.execute_workflow()
+        logger.info(f"Scheduling background workflow for project {project_id}")
+        try:
+            success = await workflow_scheduler.run(str(user_id), engine.execute_workflow)
+        except asyncio.CancelledError:
+            # Cancelled while waiting for an execution slot
+            reason = workflow_registry.cancel_reason(project_id)
+            if reason is None:
+                raise
+            asyncio.current_task().uncancel()
+            await engine.handle_cancellation(reason)
+            success = False
 
         if success:
             logger.info(f"Workflow completed successfully for project {project_id}")
@@ -48,6 +120,8 @@ async def execute_workflow_background(project_id: UUID, db: AsyncSession) -> Non
 
     except Exception as e:
         logger.error(f"Background workflow error for project {project_id}: {e}", exc_info=True)
+    finally:
+        workflow_registry.unregister(project_id)
 
 
 @router.post(
@@ -77,10 +151,21 @@ async def create_project(
         user_id=project_data.user_id,
         idea=project_data.idea,
         status=WorkflowStatus.CREATED.value,
-        metadata={},
+        metadata=project_data.model_dump(include={"variants", "variant_models", "budget_usd"}, exclude_defaults=True),
     )
 
     db.add(project)
+    await db.flush()
+
+    # Fingerprint the idea and look for a completed near-duplicate to offer for reuse
+    signature = await compute_signature(project.idea)
+    db.add(build_fingerprint(project, signature))
+    similar = await find_similar_project(
+        db, project.idea, signature, project.user_id, exclude_project_id=project.id
+    )
+    if similar:
+        project.metadata = {**project.metadata, "similar_project": similar.to_dict()}
+
     await db.commit()
     await db.refresh(project)
 
@@ -90,6 +175,7 @@ async def create_project(
         project_id=project.id,
         status=project.status,
         created_at=project.created_at,
+        similar_project=SimilarProjectInfo(**similar.to_dict()) if similar else None,
     )
 
 
@@ -103,6 +189,10 @@ async def start_workflow(
     request: Request,
     project_id: UUID,
     background_tasks: BackgroundTasks,
+    reuse_similar: bool = Query(
+        False,
+        description="Seed Smart Detection and Event Storming from a completed project with a near-duplicate idea",
+    ),
     db: AsyncSession = Depends(get_db_session),
 ) -> ProjectStartWorkflowResponse:
     """Start workflow for a project.
@@ -110,6 +200,8 @@ async def start_workflow(
     Args:
         project_id: Project UUID
         background_tasks: FastAPI background tasks
+        reuse_similar: Whether to reuse the outputs of a similar completed project
+            (the workflow runs every phase if none is found)
         db: Database session
 
     Returns:
@@ -136,12 +228,30 @@ async def start_workflow(
             detail=f"Project is already {project.status.lower()}",
         )
 
+    # Look the match up again: the project offered at creation may be gone by now
+    similar = None
+    if reuse_similar:
+        similar = await find_similar_project(
+            db,
+            project.idea,
+            await compute_signature(project.idea),
+            project.user_id,
+            exclude_project_id=project.id,
+        )
+    metadata = {key: value for key, value in project.metadata.items() if key not in ("reuse", "cancelled")}
+    if similar:
+        metadata["reuse"] = {
+            "source_project_id": str(similar.project_id),
+            "similarity": round(similar.similarity, 4),
+        }
+    project.metadata = metadata
+
     # Update status to processing
     project.status = WorkflowStatus.PROCESSING.value
     await db.commit()
 
     # Start workflow in background
-    background_tasks.add_task(execute_workflow_background, project_id, db)
+    background_tasks.add_task(execute_workflow_background, project_id, project.user_id)
 
     logger.info(f"Started workflow for project {project_id}")
 
@@ -150,7 +260,86 @@ async def start_workflow(
         status=WorkflowStatus.PROCESSING.value,
         current_phase="SMART_DETECTION",
         websocket_url=f"/api/v1/projects/{project_id}/progress",
+        reused_from=SimilarProjectInfo(**similar.to_dict()) if similar else None,
+    )
+
+
+@router.post(
+    "/{project_id}/cancel",
+    response_model=ProjectCancelResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    dependencies=[Depends(verify_admin_token)],
+)
+@limiter.limit("10/minute")
+async def cancel_workflow(
+    request: Request,
+    project_id: UUID,
+    body: Optional[ProjectCancelRequest] = None,
+    db: AsyncSession = Depends(get_db_session),
+) -> ProjectCancelResponse:
+    """Cancel a running or queued workflow.
+
+    A workflow running in this process is cancelled immediately: the in-flight
+    LLM request is aborted and the engine marks the project CANCELLED. A
+    workflow running in another process is marked CANCELLED here and stops at
+    its next phase transition.
+
+    Args:
+        project_id: Project UUID
+        body: Optional cancellation reason
+        db: Database session
+
+    Returns:
+        Cancellation confirmation
+
+    Raises:
+        HTTPException: If project not found or not processing
+
+    """
+    result = await db.execute(select(Project).where(Project.id == project_id))
+    project = result.scalar_one_or_none()
+
+    if not project:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Project {project_id} not found",
+        )
+
+    if project.status != WorkflowStatus.PROCESSING.value:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Project is not processing (status: {project.status})",
+        )
+
+    reason = body.reason if body and body.reason else "Cancelled by user"
+    if workflow_registry.cancel(project_id, reason):
+        return ProjectCancelResponse(project_id=project.id, status="CANCELLING", reason=reason)
+
+    # Running elsewhere (or its task is gone): record the cancellation for the engine to notice
+    project.status = WorkflowStatus.CANCELLED.value
+    project.metadata = {
+        **project.metadata,
+        "cancelled": {
+            "reason": reason,
+            "phase": project.current_phase,
+            "cancelled_at": datetime.utcnow().isoformat(),
+        },
+    }
+    project.updated_at = datetime.utcnow()
+    await db.commit()
+
+    await ws_manager.broadcast(
+        project_id,
+        {
+            "type": "workflow_cancelled",
+            "reason": reason,
+            "phase": project.current_phase,
+            "timestamp": datetime.utcnow().isoformat(),
+        },
     )
+    logger.info(f"Marked workflow of project {project_id} as cancelled: {reason}")
+
+    return ProjectCancelResponse(project_id=project.id, status=WorkflowStatus.CANCELLED.value, reason=reason)
 
 
 @router.get(
@@ -162,7 +351,7 @@ async def start_workflow(
 async def get_project(
     request: Request,
     project_id: UUID,
-    db: AsyncSession = Depends(get_db_session),
+    db: AsyncSession = Depends(get_read_db_session),
 ) -> ProjectResponse:
     """Get project by ID.
 
@@ -198,8 +387,8 @@ async def get_project(
 async def get_project_documents(
     request: Request,
     project_id: UUID,
-    db: AsyncSession = Depends(get_db_session),
-) -> DocumentsResponse:
+    db: AsyncSession = Depends(get_read_db_session),
+) -> FastJSONResponse:
     """Get all documents for a project.
 
     Args:
@@ -213,22 +402,13 @@ async def get_project_documents(
         HTTPException: If project not found
 
     """
-    # Check if project exists
-    result = await db.execute(select(Project).where(Project.id == project_id))
-    project = result.scalar_one_or_none()
-
-    if not project:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Project {project_id} not found",
-        )
-
-    # Get all documents
-    documents = await get_all_documents(db, project_id)
+    try:
+        documents = await load_project_documents(db, project_id)
+    except ProjectNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
 
-    return DocumentsResponse(
-        project_id=project_id,
-        documents=[DocumentResponse.model_validate(doc) for doc in documents],
+    return FastJSONResponse(
+        {"project_id": project_id, "documents": [document_payload(doc) for doc in documents]}
     )
 
 
@@ -242,8 +422,8 @@ async def get_project_document(
     request: Request,
     project_id: UUID,
     document_type: str,
-    db: AsyncSession = Depends(get_db_session),
-) -> DocumentResponse:
+    db: AsyncSession = Depends(get_read_db_session),
+) -> FastJSONResponse:
     """Get a specific document for a project.
 
     Args:
@@ -258,78 +438,486 @@ async def get_project_document(
         HTTPException: If project or document not found
 
     """
-    # Validate document type
+    document = await _get_document_or_404(db, project_id, document_type)
+    return FastJSONResponse(document_payload(document))
+
+
+def _parse_document_type(document_type: str) -> DocumentType:
+    """Parse a document type name from a request path.
+
+    Args:
+        document_type: Document type name (case-insensitive)
+
+    Returns:
+        DocumentType
+
+    Raises:
+        HTTPException: If the document type is invalid
+
+    """
     try:
-        doc_type = DocumentType[document_type.upper()]
+        return DocumentType[document_type.upper()]
     except KeyError:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Invalid document type: {document_type}. Valid types: EVENT_STORMING, PRD, TECH_STACK, EXECUTION_PLAN",
         )
 
-    # Check if project exists
-    result = await db.execute(select(Project).where(Project.id == project_id))
-    project = result.scalar_one_or_none()
 
-    if not project:
+async def _get_document_or_404(db: AsyncSession, project_id: UUID, document_type: str) -> Document:
+    """Get a project document, raising HTTP errors for invalid requests.
+
+    Args:
+        db: Database session
+        project_id: Project UUID
+        document_type: Document type name
+
+    Returns:
+        Document
+
+    Raises:
+        HTTPException: If document type is invalid or project/document not found
+
+    """
+    doc_type = _parse_document_type(document_type)
+
+    try:
+        document = await load_project_document(db, project_id, doc_type.value)
+    except ProjectNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
+    if not document:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Project {project_id} not found",
+            detail=f"Document {document_type} not found for project {project_id}",
         )
+    return document
 
-    # Get document
-    document = await get_document(db, project_id, doc_type)
 
-    if not document:
+@router.get(
+    "/{project_id}/documents/{document_type}/versions",
+    response_model=DocumentVersionsResponse,
+    dependencies=[Depends(verify_admin_token)],
+)
+@limiter.limit("30/minute")
+async def get_document_versions(
+    request: Request,
+    project_id: UUID,
+    document_type: str,
+    db: AsyncSession = Depends(get_read_db_session),
+) -> DocumentVersionsResponse:
+    """List the version history of a document.
+
+    Args:
+        project_id: Project UUID
+        document_type: Document type (EVENT_STORMING, PRD, TECH_STACK, EXECUTION_PLAN)
+        db: Database session
+
+    Returns:
+        Versions (without content), oldest first
+
+    Raises:
+        HTTPException: If project or document not found
+
+    """
+    document = await _get_document_or_404(db, project_id, document_type)
+    versions = await list_document_versions(db, document.id)
+    current_version = versions[-1][0].version if versions else None
+
+    return DocumentVersionsResponse(
+        project_id=project_id,
+        type=document.type,
+        versions=[
+            DocumentVersionResponse(
+                version=version.version,
+                content_sha256=version.content_sha256,
+                current=version.version == current_version,
+                size_bytes=blob.size_bytes,
+                stored_bytes=blob.stored_bytes,
+                storage=blob.kind,
+                attributes=version.attributes,
+                created_at=version.created_at,
+            )
+            for version, blob in versions
+        ],
+    )
+
+
+@router.get(
+    "/{project_id}/documents/{document_type}/versions/{version}",
+    response_model=DocumentVersionContentResponse,
+    dependencies=[Depends(verify_admin_token)],
+)
+@limiter.limit("30/minute")
+async def get_document_version_content(
+    request: Request,
+    project_id: UUID,
+    document_type: str,
+    version: int,
+    db: AsyncSession = Depends(get_read_db_session),
+) -> DocumentVersionContentResponse:
+    """Get the content of a single document version.
+
+    Args:
+        project_id: Project UUID
+        document_type: Document type (EVENT_STORMING, PRD, TECH_STACK, EXECUTION_PLAN)
+        version: Version number
+        db: Database session
+
+    Returns:
+        Version content
+
+    Raises:
+        HTTPException: If project, document or version not found
+
+    """
+    document = await _get_document_or_404(db, project_id, document_type)
+    document_version = await get_document_version(db, document.id, version)
+    if not document_version:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Document {document_type} not found for project {project_id}",
+            detail=f"Version {version} of document {document_type} not found",
         )
 
-    return DocumentResponse.model_validate(document)
+    return DocumentVersionContentResponse(
+        type=document.type,
+        version=document_version.version,
+        content_md=await load_blob_content(db, document_version.content_sha256),
+        attributes=document_version.attributes,
+        created_at=document_version.created_at,
+    )
 
 
 @router.get(
-    "/{project_id}/costs",
-    response_model=ProjectCostResponse,
+    "/{project_id}/documents/{document_type}/diff",
+    response_model=DocumentDiffResponse,
     dependencies=[Depends(verify_admin_token)],
 )
 @limiter.limit("30/minute")
-async def get_project_costs(
+async def get_document_diff(
     request: Request,
     project_id: UUID,
-    db: AsyncSession = Depends(get_db_session),
-) -> ProjectCostResponse:
-    """Get cost breakdown for a project.
+    document_type: str,
+    from_version: int = Query(..., ge=1, description="Older version number"),
+    to_version: Optional[int] = Query(None, ge=1, description="Newer version number (defaults to current)"),
+    db: AsyncSession = Depends(get_read_db_session),
+) -> DocumentDiffResponse:
+    """Get a unified diff between two versions of a document.
 
     Args:
         project_id: Project UUID
+        document_type: Document type (EVENT_STORMING, PRD, TECH_STACK, EXECUTION_PLAN)
+        from_version: Older version number
+        to_version: Newer version number (defaults to the current content)
         db: Database session
 
     Returns:
-        Cost breakdown by phase
+        Diff with line statistics
 
     Raises:
-        HTTPException: If project not found
+        HTTPException: If project, document or versions not found
 
     """
-    # Check if project exists
-    result = await db.execute(select(Project).where(Project.id == project_id))
-    project = result.scalar_one_or_none()
+    document = await _get_document_or_404(db, project_id, document_type)
+
+    contents = {}
+    for number in (from_version, to_version):
+        if number is None:
+            continue
+        document_version = await get_document_version(db, document.id, number)
+        if not document_version:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Version {number} of document {document_type} not found",
+            )
+        contents[number] = await load_blob_content(db, document_version.content_sha256)
+
+    if to_version is None:
+        versions = await list_document_versions(db, document.id)
+        to_version = versions[-1][0].version
+        new_content = document.content_md
+    else:
+        new_content = contents[to_version]
+
+    diff = diff_documents(
+        contents[from_version],
+        new_content,
+        f"{document.type}@v{from_version}",
+        f"{document.type}@v{to_version}",
+    )
+
+    return DocumentDiffResponse(
+        project_id=project_id,
+        type=document.type,
+        from_version=from_version,
+        to_version=to_version,
+        **diff,
+    )
+
+
+async def _get_section_index_or_404(
+    db: AsyncSession, project_id: UUID, document_type: str
+) -> Tuple[UUID, int, List[dict]]:
+    """Get the section index of a project document, raising HTTP errors for invalid requests.
+
+    Args:
+        db: Database session
+        project_id: Project UUID
+        document_type: Document type name
+
+    Returns:
+        Tuple of (document ID, content size in bytes, sections)
+
+    Raises:
+        HTTPException: If document type is invalid or project/document not found
+
+    """
+    doc_type = _parse_document_type(document_type)
+
+    try:
+        index = await get_section_index(db, project_id, doc_type)
+    except ProjectNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
+    if index is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Document {document_type} not found for project {project_id}",
+        )
+    return index
+
+
+@router.get(
+    "/{project_id}/documents/{document_type}/sections",
+    response_model=DocumentSectionsResponse,
+    dependencies=[Depends(verify_admin_token)],
+)
+@limiter.limit("60/minute")
+async def get_document_sections(
+    request: Request,
+    project_id: UUID,
+    document_type: str,
+    db: AsyncSession = Depends(get_read_db_session),
+) -> DocumentSectionsResponse:
+    """Get the section index of a document (headings with byte offsets).
+
+    The offsets can be used directly in ``Range`` requests to the raw endpoint.
+
+    Args:
+        project_id: Project UUID
+        document_type: Document type (EVENT_STORMING, PRD, TECH_STACK, EXECUTION_PLAN)
+        db: Database session
+
+    Returns:
+        Sections in document order
+
+    Raises:
+        HTTPException: If project or document not found
+
+    """
+    _, size_bytes, sections = await _get_section_index_or_404(db, project_id, document_type)
+
+    return DocumentSectionsResponse(
+        project_id=project_id,
+        type=document_type.upper(),
+        size_bytes=size_bytes,
+        sections=[DocumentSection(**section) for section in sections],
+    )
+
+
+@router.get(
+    "/{project_id}/documents/{document_type}/sections/{slug}",
+    response_model=DocumentSectionResponse,
+    dependencies=[Depends(verify_admin_token)],
+)
+@limiter.limit("60/minute")
+async def get_document_section(
+    request: Request,
+    project_id: UUID,
+    document_type: str,
+    slug: str,
+    db: AsyncSession = Depends(get_read_db_session),
+) -> DocumentSectionResponse:
+    """Get a single section of a document (including its subsections).
+
+    Only the section's bytes are read from the database.
+
+    Args:
+        project_id: Project UUID
+        document_type: Document type (EVENT_STORMING, PRD, TECH_STACK, EXECUTION_PLAN)
+        slug: Section slug from the section index
+        db: Database session
+
+    Returns:
+        Section content
+
+    Raises:
+        HTTPException: If project, document or section not found
+
+    """
+    document_id, _, sections = await _get_section_index_or_404(db, project_id, document_type)
+
+    section = next((section for section in sections if section["slug"] == slug), None)
+    if section is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Section {slug} not found in document {document_type}",
+        )
+
+    data = await read_document_bytes(db, document_id, section["start"], section["end"])
+    return DocumentSectionResponse(
+        type=document_type.upper(),
+        content_md=data.decode("utf-8"),
+        **section,
+    )
+
+
+@router.get(
+    "/{project_id}/documents/{document_type}/raw",
+    dependencies=[Depends(verify_admin_token)],
+    responses={
+        200: {"content": {"text/markdown": {}}},
+        206: {"description": "Partial content (single byte range)", "content": {"text/markdown": {}}},
+        416: {"description": "Range not satisfiable"},
+    },
+)
+@limiter.limit("60/minute")
+async def get_document_raw(
+    request: Request,
+    project_id: UUID,
+    document_type: str,
+    db: AsyncSession = Depends(get_read_db_session),
+) -> Response:
+    """Get the raw markdown of a document, honoring a single ``Range: bytes=`` header.
+
+    Args:
+        request: HTTP request (Range header)
+        project_id: Project UUID
+        document_type: Document type (EVENT_STORMING, PRD, TECH_STACK, EXECUTION_PLAN)
+        db: Database session
+
+    Returns:
+        Full content (200) or the requested byte range (206)
+
+    Raises:
+        HTTPException: If project or document not found, or the range is not satisfiable
+
+    """
+    document_id, size_bytes, _ = await _get_section_index_or_404(db, project_id, document_type)
+
+    try:
+        byte_range = parse_byte_range(request.headers.get("range"), size_bytes)
+    except RangeNotSatisfiableError:
+        raise HTTPException(
+            status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+            detail="Requested range not satisfiable",
+            headers={"Content-Range": f"bytes */{size_bytes}"},
+        ) from None
+
+    headers = {"Accept-Ranges": "bytes"}
+    if byte_range is None:
+        data = await read_document_bytes(db, document_id, 0, size_bytes)
+        return Response(content=data, media_type="text/markdown; charset=utf-8", headers=headers)
+
+    first, last = byte_range
+    data = await read_document_bytes(db, document_id, first, last + 1)
+    headers["Content-Range"] = content_range(first, last, size_bytes)
+    return Response(
+        content=data,
+        status_code=status.HTTP_206_PARTIAL_CONTENT,
+        media_type="text/markdown; charset=utf-8",
+        headers=headers,
+    )
+
+
+@router.get(
+    "/{project_id}/export",
+    dependencies=[Depends(verify_admin_token)],
+    responses={200: {"content": {"application/zip": {}, "application/gzip": {}, "text/markdown": {}}}},
+)
+@limiter.limit("10/minute")
+async def export_project(
+    request: Request,
+    project_id: UUID,
+    format: str = Query("zip", pattern="^(zip|tar\\.gz|md)$", description="Archive format"),
+) -> Response:
+    """Export all project documents with a manifest as a streamed archive.
+
+    The archive is read from the replica unless the project was updated
+    recently (see ``read_session_factory``).
+
+    Args:
+        project_id: Project UUID
+        format: Archive format (zip, tar.gz or md)
+
+    Returns:
+        Streaming archive (or 304 if the client's cached copy is current)
+
+    Raises:
+        HTTPException: If project not found or has no documents
+
+    """
+    session_factory = await read_session_factory(project_id)
+    async with session_scope(session_factory) as db:
+        project = await db.get(Project, project_id)
+        documents = await get_export_documents(db, project_id) if project else []
 
     if not project:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Project {project_id} not found",
         )
+    if not documents:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"No documents to export for project {project_id}",
+        )
 
-    # Get all LLM logs
-    result = await db.execute(
-        select(LLMLog)
-        .where(LLMLog.project_id == project_id)
-        .order_by(LLMLog.created_at)
+    media_type, extension = EXPORT_FORMATS[format]
+    headers = {"Content-Disposition": f'attachment; filename="project-{project_id}.{extension}"'}
+
+    # Completed projects no longer change, so their exports can be cached
+    if project.status == WorkflowStatus.COMPLETED.value:
+        etag = export_etag(project, documents, format)
+        headers.update({"ETag": etag, "Cache-Control": "private, max-age=86400"})
+        if etag in request.headers.get("if-none-match", ""):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    else:
+        headers["Cache-Control"] = "no-store"
+
+    return StreamingResponse(
+        stream_export(session_factory, project_id, format),
+        media_type=media_type,
+        headers=headers,
     )
-    llm_logs = result.scalars().all()
+
+
+@router.get(
+    "/{project_id}/costs",
+    response_model=ProjectCostResponse,
+    dependencies=[Depends(verify_admin_token)],
+)
+@limiter.limit("30/minute")
+async def get_project_costs(
+    request: Request,
+    project_id: UUID,
+    db: AsyncSession = Depends(get_read_db_session),
+) -> ProjectCostResponse:
+    """Get cost breakdown for a project.
+
+    Args:
+        project_id: Project UUID
+        db: Database session
+
+    Returns:
+        Cost breakdown by phase
+
+    Raises:
+        HTTPException: If project not found
+
+    """
+    try:
+        llm_logs = await load_project_llm_logs(db, project_id)
+    except ProjectNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
 
     # Build breakdown
     breakdown: List[CostBreakdownItem] = []
@@ -351,3 +939,63 @@ async def get_project_costs(
         total_cost_usd=round(total_cost, 6),
         breakdown=breakdown,
     )
+
+
+@router.get(
+    "/{project_id}/timeline",
+    response_model=WorkflowTimelineResponse,
+    dependencies=[Depends(verify_admin_token)],
+)
+@limiter.limit("30/minute")
+async def get_project_timeline(
+    request: Request,
+    project_id: UUID,
+    db: AsyncSession = Depends(get_read_db_session),
+) -> WorkflowTimelineResponse:
+    """Get the wall-clock timeline of the latest workflow execution.
+
+    Args:
+        project_id: Project UUID
+        db: Database session
+
+    Returns:
+        Profiler spans with critical-path breakdown
+
+    Raises:
+        HTTPException: If project or timeline not found
+
+    """
+    # Check if project exists
+    result = await db.execute(select(Project).where(Project.id == project_id))
+    project = result.scalar_one_or_none()
+
+    if not project:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Project {project_id} not found",
+        )
+
+    # Get latest timeline
+    result = await db.execute(
+        select(WorkflowTimeline)
+        .where(WorkflowTimeline.project_id == project_id)
+        .order_by(WorkflowTimeline.created_at.desc())
+        .limit(1)
+    )
+    timeline = result.scalar_one_or_none()
+
+    if not timeline:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"No timeline recorded for project {project_id}",
+        )
+
+    return WorkflowTimelineResponse(
+        project_id=project_id,
+        status=timeline.status,
+        total_ms=timeline.total_ms,
+        created_at=timeline.created_at,
+        spans=timeline.spans,
+        critical_path=critical_path(timeline.spans),
+        breakdown=critical_path_breakdown(timeline.spans),
+    )
@@ -3,14 +3,12 @@ import logging
 from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, WebSocket, WebSocketDisconnect, status
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, Query, WebSocket, WebSocketDisconnect, status
 
-from app.api.deps import get_db_session
 from app.config import settings
 from app.core.websocket_manager import manager
 from app.db.models import Project
+from app.db.session import session_scope
 
 logger = logging.getLogger(__name__)
 
@@ -22,7 +20,6 @@ async def project_progress(
     websocket: WebSocket,
     project_id: UUID,
     token: str = Query(..., description="Admin authentication token"),
-    db: AsyncSession = Depends(get_db_session),
 ) -> None:
     """WebSocket endpoint for real-time project progress updates.
 
@@ -32,7 +29,6 @@ async def project_progress(
         websocket: WebSocket connection
         project_id: Project UUID
         token: Admin authentication token (query parameter)
-        db: Database session
 
     """
     # Verify authentication token before accepting connection
@@ -41,9 +37,10 @@ async def project_progress(
         logger.warning(f"WebSocket authentication failed for project {project_id}")
         return
 
-    # Verify project exists before accepting connection
-    result = await db.execute(select(Project).where(Project.id == project_id))
-    project = result.scalar_one_or_none()
+    # Verify project exists before accepting connection; the session is closed
+    # right away instead of being held for the lifetime of the connection
+    async with session_scope() as db:
+        project = await db.get(Project, project_id)
 
     if not project:
         await websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason="Project not found")
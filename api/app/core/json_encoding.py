@@ -0,0 +1,51 @@
+"""Fast JSON encoding for API responses and WebSocket messages.
+
+Uses orjson when it is installed and falls back to the standard library
+encoder (with the same handling of UUIDs, datetimes and decimals)
+otherwise.
+"""
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any
+from uuid import UUID
+
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+
+def _default(value: Any) -> Any:
+    """Encode values the JSON encoder does not handle natively."""
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    """Encode content as compact UTF-8 JSON.
+
+    Args:
+        content: JSON-compatible data (may contain UUIDs, datetimes and decimals)
+
+    Returns:
+        Encoded JSON
+
+    """
+    if orjson is not None:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(content, default=_default, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered with orjson when available."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
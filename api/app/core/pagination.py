@@ -0,0 +1,42 @@
+"""Opaque cursors for keyset pagination."""
+import base64
+import binascii
+import json
+from typing import Any, Dict
+
+
+def encode_cursor(values: Dict[str, Any]) -> str:
+    """Encode the sort key of the last returned row as an opaque cursor.
+
+    Args:
+        values: JSON-serializable sort key values
+
+    Returns:
+        URL-safe cursor string
+
+    """
+    raw = json.dumps(values, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    """Decode a cursor produced by ``encode_cursor``.
+
+    Args:
+        cursor: Cursor string
+
+    Returns:
+        Sort key values
+
+    Raises:
+        ValueError: If the cursor is malformed
+
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise ValueError("Invalid cursor") from e
+    if not isinstance(values, dict):
+        raise ValueError("Invalid cursor")
+    return values
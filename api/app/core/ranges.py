@@ -0,0 +1,54 @@
+"""HTTP byte range requests (single range only)."""
+import re
+from typing import Optional, Tuple
+
+RANGE_PATTERN = re.compile(r"^\s*bytes\s*=\s*(\d*)\s*-\s*(\d*)\s*$")
+
+
+class RangeNotSatisfiableError(ValueError):
+    """Requested range lies outside the resource."""
+
+
+def parse_byte_range(header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """Parse a ``Range`` header against a resource size.
+
+    Headers that are not a single well-formed byte range (including
+    multi-range requests) are ignored, as RFC 9110 allows, so the full
+    resource is served.
+
+    Args:
+        header: Range header value
+        size: Resource size in bytes
+
+    Returns:
+        Inclusive (first, last) byte positions, or None to serve the full resource
+
+    Raises:
+        RangeNotSatisfiableError: If the range does not overlap the resource
+
+    """
+    if not header:
+        return None
+    match = RANGE_PATTERN.match(header)
+    if not match or match.group(1) == match.group(2) == "":
+        return None
+
+    first, last = match.groups()
+    if first == "":
+        # Suffix range: the last N bytes
+        length = int(last)
+        if length == 0 or size == 0:
+            raise RangeNotSatisfiableError(header)
+        return max(size - length, 0), size - 1
+
+    start = int(first)
+    if last and int(last) < start:
+        return None
+    if start >= size:
+        raise RangeNotSatisfiableError(header)
+    return start, min(int(last), size - 1) if last else size - 1
+
+
+def content_range(first: int, last: int, size: int) -> str:
+    """Format a ``Content-Range`` header value."""
+    return f"bytes {first}-{last}/{size}"
@@ -6,6 +6,8 @@ from uuid import UUID
 
 from fastapi import WebSocket
 
+from app.core.json_encoding import dumps
+
 logger = logging.getLogger(__name__)
 
 
@@ -70,11 +72,14 @@ class ConnectionManager:
         if "timestamp" not in message:
             message["timestamp"] = datetime.utcnow().isoformat()
 
+        # Encode once for all connections (sent as text frames, like send_json)
+        payload = dumps(message).decode("utf-8")
+
         # Broadcast to all connections
         dead_connections = []
         for connection in self.active_connections[project_id_str]:
             try:
-                await connection.send_json(message)
+                await connection.send_text(payload)
             except Exception as e:
                 logger.error(f"Failed to send message to WebSocket: {e}")
                 dead_connections.append(connection)
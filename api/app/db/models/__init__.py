@@ -1,8 +1,24 @@
 """Database models."""
 from app.db.models.document import Document
+from app.db.models.document_version import DocumentBlob, DocumentVersion
+from app.db.models.idea_fingerprint import IdeaFingerprint
 from app.db.models.llm_log import LLMLog
+from app.db.models.plan import PlanStage, PlanTask
 from app.db.models.project import Project
 from app.db.models.user import User
 from app.db.models.workflow_state import WorkflowState
+from app.db.models.workflow_timeline import WorkflowTimeline
 
-__all__ = ["User", "Project", "WorkflowState", "Document", "LLMLog"]
+__all__ = [
+    "User",
+    "Project",
+    "WorkflowState",
+    "Document",
+    "DocumentBlob",
+    "DocumentVersion",
+    "IdeaFingerprint",
+    "LLMLog",
+    "PlanStage",
+    "PlanTask",
+    "WorkflowTimeline",
+]
@@ -0,0 +1,51 @@
+"""Document version history models."""
+import uuid
+from datetime import datetime
+
+from sqlalchemy import (
+    Column,
+    DateTime,
+    ForeignKey,
+    Integer,
+    LargeBinary,
+    String,
+    UniqueConstraint,
+)
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.orm import relationship
+
+from app.db.base import Base
+
+
+class DocumentBlob(Base):
+    """Document blob table - content-addressed, delta-compressed document contents."""
+
+    __tablename__ = "document_blobs"
+
+    sha256 = Column(String(64), primary_key=True)  # SHA-256 of the full content
+    kind = Column(String(10), nullable=False)  # FULL, DELTA
+    base_sha256 = Column(String(64), ForeignKey("document_blobs.sha256"), nullable=True)
+    chain_depth = Column(Integer, default=0, nullable=False)  # Deltas to apply to reach a FULL blob
+    data = Column(LargeBinary, nullable=False)  # zlib-compressed JSON (text or delta ops)
+    size_bytes = Column(Integer, nullable=False)  # Size of the full content
+    stored_bytes = Column(Integer, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+
+class DocumentVersion(Base):
+    """Document version table - history of generated contents per document."""
+
+    __tablename__ = "document_versions"
+    __table_args__ = (UniqueConstraint("document_id", "version", name="uq_document_versions_version"),)
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    document_id = Column(
+        UUID(as_uuid=True), ForeignKey("documents.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    version = Column(Integer, nullable=False)
+    content_sha256 = Column(String(64), ForeignKey("document_blobs.sha256"), nullable=False)
+    attributes = Column(JSONB, default=dict, nullable=False)  # model, score, alternate, ...
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    # Relationships
+    document = relationship("Document", back_populates="versions")
@@ -0,0 +1,26 @@
+"""Idea fingerprint model."""
+from datetime import datetime
+
+from sqlalchemy import BigInteger, Column, DateTime, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
+from sqlalchemy.orm import relationship
+
+from app.db.base import Base
+
+
+class IdeaFingerprint(Base):
+    """Idea fingerprint table - MinHash signature and LSH bands of a project idea."""
+
+    __tablename__ = "idea_fingerprints"
+    __table_args__ = (Index("ix_idea_fingerprints_bands", "bands", postgresql_using="gin"),)
+
+    project_id = Column(
+        UUID(as_uuid=True), ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True
+    )
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    signature = Column(ARRAY(BigInteger), nullable=False)  # MinHash values
+    bands = Column(ARRAY(BigInteger), nullable=False)  # LSH band hashes, queried with && (overlap)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    # Relationships
+    project = relationship("Project", back_populates="idea_fingerprint")
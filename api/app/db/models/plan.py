@@ -0,0 +1,64 @@
+"""Execution plan stage and task models."""
+import uuid
+from datetime import datetime
+
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    ForeignKey,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+)
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import relationship
+
+from app.db.base import Base
+
+
+class PlanStage(Base):
+    """Plan stage table - stages extracted from the execution plan document."""
+
+    __tablename__ = "plan_stages"
+    __table_args__ = (UniqueConstraint("project_id", "position", name="uq_plan_stages_position"),)
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    project_id = Column(UUID(as_uuid=True), ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)
+    document_id = Column(
+        UUID(as_uuid=True), ForeignKey("documents.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    position = Column(Integer, nullable=False)  # 1-based, in document order
+    number = Column(Integer)  # Stage number written in the heading
+    title = Column(String(500), nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    # Relationships
+    project = relationship("Project", back_populates="plan_stages")
+    tasks = relationship(
+        "PlanTask", back_populates="stage", cascade="all, delete-orphan", order_by="PlanTask.position"
+    )
+
+
+class PlanTask(Base):
+    """Plan task table - checkbox tasks of a plan stage."""
+
+    __tablename__ = "plan_tasks"
+    __table_args__ = (UniqueConstraint("stage_id", "position", name="uq_plan_tasks_position"),)
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    stage_id = Column(UUID(as_uuid=True), ForeignKey("plan_stages.id", ondelete="CASCADE"), nullable=False)
+    project_id = Column(
+        UUID(as_uuid=True), ForeignKey("projects.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    position = Column(Integer, nullable=False)  # 1-based, within the stage
+    group_title = Column(String(500))  # Task heading/label the checkbox belongs to
+    text = Column(Text, nullable=False)
+    completed = Column(Boolean, default=False, nullable=False)
+    completed_at = Column(DateTime)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    # Relationships
+    stage = relationship("PlanStage", back_populates="tasks")
@@ -29,3 +29,10 @@ class Project(Base):
     workflow_states = relationship("WorkflowState", back_populates="project", cascade="all, delete-orphan")
     documents = relationship("Document", back_populates="project", cascade="all, delete-orphan")
     llm_logs = relationship("LLMLog", back_populates="project", cascade="all, delete-orphan")
+    timelines = relationship("WorkflowTimeline", back_populates="project", cascade="all, delete-orphan")
+    plan_stages = relationship(
+        "PlanStage", back_populates="project", cascade="all, delete-orphan", order_by="PlanStage.position"
+    )
+    idea_fingerprint = relationship(
+        "IdeaFingerprint", back_populates="project", uselist=False, cascade="all, delete-orphan"
+    )
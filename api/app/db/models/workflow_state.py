@@ -2,7 +2,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, ForeignKey, String, Text
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
 
@@ -21,6 +21,7 @@ class WorkflowState(Base):
     input_data = Column(JSONB)
     output_data = Column(JSONB)
     error_message = Column(Text)
+    attempt = Column(Integer, default=1, server_default="1", nullable=False)  # Retry attempt of the phase
     started_at = Column(DateTime)
     completed_at = Column(DateTime)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
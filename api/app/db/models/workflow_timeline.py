@@ -0,0 +1,27 @@
+"""Workflow timeline model."""
+import uuid
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, String
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.orm import relationship
+
+from app.db.base import Base
+
+
+class WorkflowTimeline(Base):
+    """Workflow timeline table - profiler spans for one workflow execution."""
+
+    __tablename__ = "workflow_timelines"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    project_id = Column(
+        UUID(as_uuid=True), ForeignKey("projects.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    status = Column(String(50), nullable=False)  # COMPLETED, FAILED
+    total_ms = Column(Integer, nullable=False)
+    spans = Column(JSONB, default=list, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    # Relationships
+    project = relationship("Project", back_populates="timelines")
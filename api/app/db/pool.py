@@ -0,0 +1,161 @@
+"""Connection pool configuration and runtime metrics."""
+import threading
+import time
+from typing import Any, Dict, Type
+
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry, NullPool, Pool, QueuePool
+
+from app.config import Settings
+
+
+class PoolMetrics:
+    """Checkout counts and wait times of an engine's connection pool."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.checked_out = 0
+        self.peak_checked_out = 0
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record_wait(self, seconds: float, timed_out: bool = False) -> None:
+        """Record how long a checkout waited for a connection.
+
+        Args:
+            seconds: Time spent in the pool
+            timed_out: Whether the checkout gave up (pool timeout)
+
+        """
+        with self._lock:
+            self.checkouts += 1
+            self.total_wait += seconds
+            self.max_wait = max(self.max_wait, seconds)
+            if timed_out:
+                self.timeouts += 1
+
+    def on_checkout(self, *args: Any) -> None:
+        """Count a connection handed out by the pool (pool ``checkout`` event)."""
+        with self._lock:
+            self.checked_out += 1
+            self.peak_checked_out = max(self.peak_checked_out, self.checked_out)
+
+    def on_checkin(self, *args: Any) -> None:
+        """Count a connection returned to the pool (pool ``checkin`` event)."""
+        with self._lock:
+            self.checked_out = max(self.checked_out - 1, 0)
+
+    def attach(self, engine: AsyncEngine) -> None:
+        """Listen to the checkout/checkin events of an engine's pool.
+
+        Args:
+            engine: Engine to observe
+
+        """
+        event.listen(engine.sync_engine, "checkout", self.on_checkout)
+        event.listen(engine.sync_engine, "checkin", self.on_checkin)
+
+    def snapshot(self, pool: Pool) -> Dict[str, Any]:
+        """Describe the pool and the metrics collected so far.
+
+        Args:
+            pool: The engine's current pool
+
+        Returns:
+            Pool mode, limits, current usage and checkout wait times
+
+        """
+        limits: Dict[str, Any]
+        if isinstance(pool, QueuePool):
+            limits = {
+                "mode": "queue",
+                "pool_size": pool.size(),
+                "max_overflow": pool._max_overflow,
+                "checked_in": pool.checkedin(),
+                "overflow": max(pool.overflow(), 0),
+            }
+        else:
+            limits = {"mode": "null", "pool_size": None, "max_overflow": None, "checked_in": None, "overflow": None}
+        with self._lock:
+            return {
+                **limits,
+                "checked_out": self.checked_out,
+                "peak_checked_out": self.peak_checked_out,
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "avg_wait_ms": round(self.total_wait / self.checkouts * 1000, 2) if self.checkouts else 0.0,
+                "max_wait_ms": round(self.max_wait * 1000, 2),
+            }
+
+
+def instrumented_pool_class(base: Type[Pool], metrics: PoolMetrics) -> Type[Pool]:
+    """Subclass a pool class so that every checkout reports its wait time.
+
+    Args:
+        base: Pool class (e.g., AsyncAdaptedQueuePool or NullPool)
+        metrics: Metrics receiving the wait times
+
+    Returns:
+        Pool class to pass as ``poolclass``
+
+    """
+
+    def _do_get(self: Pool) -> ConnectionPoolEntry:
+        started = time.perf_counter()
+        timed_out = False
+        try:
+            return base._do_get(self)
+        except PoolTimeoutError:
+            timed_out = True
+            raise
+        finally:
+            metrics.record_wait(time.perf_counter() - started, timed_out)
+
+    return type(f"Instrumented{base.__name__}", (base,), {"_do_get": _do_get})
+
+
+def engine_options(config: Settings, metrics: PoolMetrics) -> Dict[str, Any]:
+    """Build ``create_async_engine`` keyword arguments from settings.
+
+    In PgBouncer mode (transaction pooling) PgBouncer does the pooling, so
+    connections are not kept (``NullPool``), and prepared statements are not
+    cached, since consecutive statements may run on different server
+    connections.
+
+    Args:
+        config: Application settings
+        metrics: Metrics of the engine's pool
+
+    Returns:
+        Engine keyword arguments
+
+    """
+    connect_args: Dict[str, Any] = {"timeout": config.DB_CONNECT_TIMEOUT_SECONDS}
+    if config.DB_COMMAND_TIMEOUT_SECONDS:
+        connect_args["command_timeout"] = config.DB_COMMAND_TIMEOUT_SECONDS
+
+    options: Dict[str, Any] = {
+        "echo": config.DEBUG if config.DB_ECHO is None else config.DB_ECHO,
+        "future": True,
+        "connect_args": connect_args,
+    }
+
+    if config.DB_PGBOUNCER:
+        connect_args["statement_cache_size"] = 0  # asyncpg's own cache
+        connect_args["prepared_statement_cache_size"] = 0  # SQLAlchemy dialect cache
+        options["poolclass"] = instrumented_pool_class(NullPool, metrics)
+        return options
+
+    options.update(
+        poolclass=instrumented_pool_class(AsyncAdaptedQueuePool, metrics),
+        pool_size=config.DB_POOL_SIZE,
+        max_overflow=config.DB_MAX_OVERFLOW,
+        pool_timeout=config.DB_POOL_TIMEOUT_SECONDS,
+        pool_recycle=config.DB_POOL_RECYCLE_SECONDS,
+        pool_pre_ping=config.DB_POOL_PRE_PING,
+    )
+    return options
@@ -0,0 +1,148 @@
+"""Project queries that check existence and load related rows in one round trip."""
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy import and_, literal, select, update
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import Document, LLMLog, Project
+
+
+class ProjectNotFoundError(LookupError):
+    """The project does not exist."""
+
+    def __init__(self, project_id: UUID):
+        super().__init__(f"Project {project_id} not found")
+        self.project_id = project_id
+
+
+async def _load_project_rows(
+    db: AsyncSession, project_id: UUID, model: Any, *conditions: Any, order_by: Any = None
+) -> List[Any]:
+    """Load a project's child rows, joined to the project to check that it exists.
+
+    A LEFT JOIN from the project returns one row with no child when the
+    project exists but has no matching rows, and no rows when it does not
+    exist, so both questions are answered by a single query.
+
+    Args:
+        db: Database session
+        project_id: Project UUID
+        model: Child model with a ``project_id`` column
+        conditions: Extra join conditions on the child
+        order_by: Ordering of the children
+
+    Returns:
+        Child instances
+
+    Raises:
+        ProjectNotFoundError: If the project does not exist
+
+    """
+    statement = (
+        select(Project.id, model)
+        .outerjoin(model, and_(model.project_id == Project.id, *conditions))
+        .where(Project.id == project_id)
+    )
+    if order_by is not None:
+        statement = statement.order_by(order_by)
+
+    rows = (await db.execute(statement)).all()
+    if not rows:
+        raise ProjectNotFoundError(project_id)
+    return [row[1] for row in rows if row[1] is not None]
+
+
+async def load_project_documents(db: AsyncSession, project_id: UUID) -> List[Document]:
+    """Get all documents of an existing project.
+
+    Args:
+        db: Database session
+        project_id: Project UUID
+
+    Returns:
+        Documents, oldest first
+
+    Raises:
+        ProjectNotFoundError: If the project does not exist
+
+    """
+    return await _load_project_rows(db, project_id, Document, order_by=Document.created_at)
+
+
+async def load_project_document(db: AsyncSession, project_id: UUID, document_type: str) -> Optional[Document]:
+    """Get one document of an existing project.
+
+    Args:
+        db: Database session
+        project_id: Project UUID
+        document_type: Document type value
+
+    Returns:
+        Document or None if the project has no document of that type
+
+    Raises:
+        ProjectNotFoundError: If the project does not exist
+
+    """
+    documents = await _load_project_rows(db, project_id, Document, Document.type == document_type)
+    return documents[0] if documents else None
+
+
+async def load_project_llm_logs(db: AsyncSession, project_id: UUID) -> List[LLMLog]:
+    """Get the LLM calls of an existing project.
+
+    Args:
+        db: Database session
+        project_id: Project UUID
+
+    Returns:
+        LLM logs, oldest first
+
+    Raises:
+        ProjectNotFoundError: If the project does not exist
+
+    """
+    return await _load_project_rows(db, project_id, LLMLog, order_by=LLMLog.created_at)
+
+
+async def update_project(
+    db: AsyncSession,
+    project_id: UUID,
+    values: Dict[str, Any],
+    metadata: Optional[Dict[str, Any]] = None,
+    unless_status: Optional[str] = None,
+) -> Optional[Project]:
+    """Update a project and return its new state in one statement.
+
+    Metadata is merged into the stored metadata (top-level keys) by the
+    database, so the project does not need to be read first.
+
+    Args:
+        db: Database session
+        project_id: Project UUID
+        values: Column values to set (``updated_at`` is set automatically)
+        metadata: Optional metadata to merge
+        unless_status: Leave the project untouched if it has this status
+
+    Returns:
+        Updated Project, or None if the project does not exist or has ``unless_status``
+
+    """
+    projects = Project.__table__
+    values = {**values, "updated_at": datetime.utcnow()}
+    if metadata:
+        values["metadata"] = projects.c.metadata.op("||", return_type=JSONB)(literal(metadata, JSONB))
+
+    statement = update(projects).where(projects.c.id == project_id).values(**values)
+    if unless_status is not None:
+        statement = statement.where(projects.c.status != unless_status)
+
+    result = await db.execute(
+        select(Project)
+        .from_statement(statement.returning(*projects.c))
+        .execution_options(populate_existing=True)
+    )
+    return result.scalar_one_or_none()
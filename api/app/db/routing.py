@@ -0,0 +1,86 @@
+"""Read-replica routing with a read-your-writes window per project.
+
+The shared signal is ``projects.updated_at`` on the primary: writes to a
+project's rows also bump its timestamp, and reads of a project updated within
+the window go to the primary. Every API worker sees the same signal.
+"""
+from datetime import datetime, timedelta
+from typing import Any, Iterable, Optional, Set
+from uuid import UUID
+
+from sqlalchemy import Select, Update, column, select, table, update
+from sqlalchemy.orm import Session
+
+# Lightweight table construct, so routing does not depend on the ORM models
+_projects = table("projects", column("id"), column("updated_at"))
+
+
+def written_project_ids(objects: Iterable[Any]) -> Set[UUID]:
+    """Get the projects affected by flushed ORM objects.
+
+    Args:
+        objects: New, changed and deleted instances
+
+    Returns:
+        Project UUIDs (a project's own ID, or the ``project_id`` of its rows)
+
+    """
+    project_ids = set()
+    for obj in objects:
+        if getattr(obj, "__tablename__", None) == "projects":
+            project_id = obj.id
+        else:
+            project_id = getattr(obj, "project_id", None)
+        if project_id is not None:
+            project_ids.add(project_id)
+    return project_ids
+
+
+def touch_projects(project_ids: Iterable[UUID]) -> Update:
+    """Build a statement that marks projects as just written.
+
+    Args:
+        project_ids: Project UUIDs
+
+    Returns:
+        UPDATE statement setting ``updated_at`` to now
+
+    """
+    return update(_projects).where(_projects.c.id.in_(list(project_ids))).values(updated_at=datetime.utcnow())
+
+
+def project_updated_at_query(project_id: UUID) -> Select:
+    """Build a query for a project's ``updated_at``."""
+    return select(_projects.c.updated_at).where(_projects.c.id == project_id)
+
+
+def written_recently(updated_at: Optional[datetime], window_seconds: float, now: Optional[datetime] = None) -> bool:
+    """Check whether a project was written within the read-your-writes window.
+
+    Args:
+        updated_at: Project ``updated_at`` read from the primary (None if not found)
+        window_seconds: Read-your-writes window
+        now: Current UTC time (defaults to now)
+
+    Returns:
+        True if reads of the project must use the primary
+
+    """
+    if updated_at is None:
+        return True
+    now = now or datetime.utcnow()
+    return now - updated_at < timedelta(seconds=window_seconds)
+
+
+def after_flush(session: Session, flush_context: Any) -> None:
+    """Bump ``updated_at`` of projects whose child rows were flushed.
+
+    Projects flushed themselves get ``updated_at`` from the column's
+    ``onupdate``; rows such as documents, plan tasks and LLM logs only carry
+    a ``project_id``, so their project is touched in the same transaction.
+    """
+    objects = [*session.new, *session.dirty, *session.deleted]
+    flushed_projects = {obj.id for obj in objects if getattr(obj, "__tablename__", None) == "projects"}
+    project_ids = written_project_ids(objects) - flushed_projects
+    if project_ids:
+        session.connection().execute(touch_projects(project_ids))
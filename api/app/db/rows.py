@@ -0,0 +1,135 @@
+"""JSON encoding of raw table rows (Core rows, not ORM objects).
+
+Used wherever rows leave the database as JSON lines or CSV (archives, exports)
+and, for archives, must be restored with their original column types.
+"""
+import base64
+import csv
+import io
+import json
+import uuid
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Collection, Dict, Iterable, Mapping, Optional, Sequence
+
+from sqlalchemy import Column, Table
+
+
+def encode_value(value: Any) -> Any:
+    """Convert a column value to a JSON-serializable value.
+
+    Args:
+        value: Column value
+
+    Returns:
+        JSON-serializable value (UUIDs, dates and decimals as strings, bytes as base64)
+
+    """
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)  # Keeps full precision
+    if isinstance(value, (bytes, memoryview)):
+        return base64.b64encode(bytes(value)).decode("ascii")
+    return value
+
+
+def encode_row(row: Mapping[str, Any], exclude: Collection[str] = ()) -> Dict[str, Any]:
+    """Convert a table row to a JSON-serializable dict.
+
+    Args:
+        row: Row mapping (e.g., ``Row._mapping``)
+        exclude: Column names to leave out (e.g., generated columns)
+
+    Returns:
+        Dict of column name to encoded value
+
+    """
+    return {key: encode_value(value) for key, value in row.items() if key not in exclude}
+
+
+def _python_type(column: Column) -> Optional[type]:
+    """Get the Python type of a column, if the column type defines one."""
+    try:
+        return column.type.python_type
+    except NotImplementedError:
+        return None
+
+
+def decode_row(table: Table, data: Mapping[str, Any]) -> Dict[str, Any]:
+    """Convert an encoded row back to column values for insertion.
+
+    Args:
+        table: Table the row belongs to
+        data: Encoded row (as produced by ``encode_row``)
+
+    Returns:
+        Dict of column name to value; keys that are not columns are dropped
+
+    """
+    values: Dict[str, Any] = {}
+    for column in table.columns:
+        if column.name not in data:
+            continue
+        value = data[column.name]
+        python_type = _python_type(column)
+
+        if value is None or python_type is None:
+            values[column.name] = value
+        elif python_type is uuid.UUID:
+            values[column.name] = uuid.UUID(value)
+        elif python_type is datetime:
+            values[column.name] = datetime.fromisoformat(value)
+        elif python_type is date:
+            values[column.name] = date.fromisoformat(value)
+        elif python_type is Decimal:
+            values[column.name] = Decimal(value)
+        elif python_type is bytes:
+            values[column.name] = base64.b64decode(value)
+        else:
+            values[column.name] = value
+    return values
+
+
+def rows_to_ndjson(rows: Iterable[Mapping[str, Any]]) -> str:
+    """Serialize rows as newline-delimited JSON.
+
+    Args:
+        rows: Row mappings
+
+    Returns:
+        One JSON object per line
+
+    """
+    return "".join(json.dumps(encode_row(row)) + "\n" for row in rows)
+
+
+def rows_to_csv(
+    rows: Iterable[Mapping[str, Any]], columns: Sequence[str], include_header: bool = False
+) -> str:
+    """Serialize rows as CSV.
+
+    Nested values (JSON columns) are written as JSON strings.
+
+    Args:
+        rows: Row mappings
+        columns: Column order
+        include_header: Whether to write the header line first
+
+    Returns:
+        CSV text
+
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if include_header:
+        writer.writerow(columns)
+    for row in rows:
+        encoded = encode_row(row)
+        writer.writerow(
+            json.dumps(value) if isinstance(value, (dict, list)) else value
+            for value in (encoded.get(column) for column in columns)
+        )
+    return buffer.getvalue()
@@ -1,21 +1,28 @@
 """Database session management."""
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+from uuid import UUID
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import Session
 
 from app.config import settings
+from app.db.pool import PoolMetrics, engine_options
+from app.db.routing import after_flush, project_updated_at_query, written_recently
 
 # Create async engine
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    echo=settings.DEBUG,
-    future=True,
-    pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
-)
+pool_metrics = PoolMetrics()
+engine = create_async_engine(settings.DATABASE_URL, **engine_options(settings, pool_metrics))
+pool_metrics.attach(engine)
 
 # Create async session factory
-AsyncSessionLocal = sessionmaker(
+AsyncSessionLocal = async_sessionmaker(
     engine,
     class_=AsyncSession,
     expire_on_commit=False,
@@ -23,15 +30,79 @@ AsyncSessionLocal = sessionmaker(
     autoflush=False,
 )
 
+# Optional read replica for read-only endpoints
+replica_pool_metrics = PoolMetrics()
+read_engine: Optional[AsyncEngine] = None
+ReadSessionLocal = AsyncSessionLocal
+if settings.DATABASE_READ_URL:
+    read_engine = create_async_engine(
+        settings.DATABASE_READ_URL, **engine_options(settings, replica_pool_metrics)
+    )
+    replica_pool_metrics.attach(read_engine)
+    ReadSessionLocal = async_sessionmaker(
+        read_engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        autocommit=False,
+        autoflush=False,
+    )
 
-async def get_db() -> AsyncSession:
-    """Dependency to get database session."""
-    async with AsyncSessionLocal() as session:
+# Writes to a project's rows bump its updated_at, the read-your-writes signal
+event.listen(Session, "after_flush", after_flush)
+
+
+@asynccontextmanager
+async def session_scope(
+    session_factory: async_sessionmaker = AsyncSessionLocal,
+) -> AsyncIterator[AsyncSession]:
+    """Open a session for one unit of work.
+
+    The session is committed when the block succeeds, rolled back when it
+    raises, and always closed, returning its connection to the pool. Code
+    that outlives a request (background workflows, WebSockets) opens its own
+    scopes instead of holding on to the request's session.
+
+    Args:
+        session_factory: Session factory to use
+
+    Yields:
+        AsyncSession
+
+    """
+    async with session_factory() as session:
         try:
             yield session
             await session.commit()
-        except Exception:
+        except BaseException:
             await session.rollback()
             raise
-        finally:
-            await session.close()
+
+
+async def get_db() -> AsyncIterator[AsyncSession]:
+    """Dependency to get database session."""
+    async with session_scope() as session:
+        yield session
+
+
+async def read_session_factory(project_id: UUID) -> async_sessionmaker:
+    """Choose the database for a read-only request about a project.
+
+    The project's ``updated_at`` is read from the primary (a primary key
+    lookup), so the decision holds across all API workers.
+
+    Args:
+        project_id: Project UUID
+
+    Returns:
+        The replica's session factory, or the primary's if no replica is
+        configured or the project was written within READ_YOUR_WRITES_SECONDS
+
+    """
+    if read_engine is None:
+        return AsyncSessionLocal
+
+    async with engine.connect() as conn:
+        updated_at = (await conn.execute(project_updated_at_query(project_id))).scalar_one_or_none()
+    if written_recently(updated_at, settings.READ_YOUR_WRITES_SECONDS):
+        return AsyncSessionLocal
+    return ReadSessionLocal
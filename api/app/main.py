@@ -9,7 +9,10 @@ from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 
 from app.config import settings
+from app.core.json_encoding import FastJSONResponse
 from app.core.security import limiter
+from app.services.llm_service import llm_service
+from app.services.model_catalog import model_catalog
 
 # Configure logging
 logging.basicConfig(
@@ -26,10 +29,15 @@ async def lifespan(app: FastAPI):
     logger.info("Starting up AI-Driven Development Framework API")
     logger.info(f"Environment: {'development' if settings.DEBUG else 'production'}")
 
+    # Fail fast on an invalid model catalog
+    model_catalog.load()
+    llm_service.open()
+
     yield
 
     # Shutdown
     logger.info("Shutting down AI-Driven Development Framework API")
+    await llm_service.close()
 
 
 # Create FastAPI app
@@ -40,6 +48,7 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
+    default_response_class=FastJSONResponse,
     lifespan=lifespan,
 )
 
@@ -54,6 +63,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Content-Range", "Accept-Ranges"],
 )
 
 
@@ -80,7 +90,7 @@ async def root() -> dict:
 
 
 # Include routers
-from app.api.v1 import projects, websocket
+from app.api.v1 import admin, documents, plans, projects, websocket
 
 app.include_router(
     projects.router,
@@ -88,6 +98,24 @@ app.include_router(
     tags=["projects"],
 )
 
+app.include_router(
+    plans.router,
+    prefix=f"{settings.API_V1_PREFIX}/projects",
+    tags=["plans"],
+)
+
+app.include_router(
+    documents.router,
+    prefix=f"{settings.API_V1_PREFIX}/documents",
+    tags=["documents"],
+)
+
+app.include_router(
+    admin.router,
+    prefix=f"{settings.API_V1_PREFIX}/admin",
+    tags=["admin"],
+)
+
 # WebSocket router for real-time progress updates
 app.include_router(
     websocket.router,
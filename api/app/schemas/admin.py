@@ -0,0 +1,101 @@
+"""Pydantic schemas for admin endpoints."""
+from datetime import datetime
+from typing import Dict, List, Optional
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+
+class TenantQueueMetrics(BaseModel):
+    """Scheduler metrics for a single tenant (user)."""
+
+    tier: str
+    weight: float
+    max_concurrent: int
+    running: int
+    queued: int
+    started_total: int
+    avg_wait_ms: int
+    max_wait_ms: int
+
+
+class SchedulerMetricsResponse(BaseModel):
+    """Schema for workflow scheduler metrics response."""
+
+    max_concurrent: int
+    running: int
+    queued: int
+    tenants: Dict[str, TenantQueueMetrics]
+
+
+class ArchiveRequest(BaseModel):
+    """Schema for archiving old completed projects."""
+
+    older_than_days: Optional[int] = Field(
+        None, ge=0, description="Minimum age since completion (defaults to ARCHIVE_AFTER_DAYS)"
+    )
+    limit: int = Field(50, ge=1, le=500, description="Maximum number of projects to archive")
+    dry_run: bool = Field(False, description="Only list the projects that would be archived")
+
+
+class ArchiveJobResponse(BaseModel):
+    """Schema for a queued archive job."""
+
+    selected: List[UUID]
+    dry_run: bool
+    queued: bool
+
+
+class RestoreResponse(BaseModel):
+    """Schema for project restore response."""
+
+    project_id: UUID
+    rows: Dict[str, int]
+
+
+class SearchBackfillResponse(BaseModel):
+    """Schema for search index backfill response."""
+
+    updated: int
+
+
+class IdeaBackfillResponse(BaseModel):
+    """Schema for idea fingerprint backfill response."""
+
+    indexed: int
+
+
+class CatalogModel(BaseModel):
+    """Pricing and capabilities of a catalog model."""
+
+    input_price: float = Field(..., description="USD per 1M prompt tokens")
+    output_price: float = Field(..., description="USD per 1M completion tokens")
+    context_window: int
+    json_schema: bool
+    json_mode: bool
+
+
+class ModelCatalogResponse(BaseModel):
+    """Schema for the active model catalog."""
+
+    path: str
+    loaded_at: Optional[datetime] = None
+    models: Dict[str, CatalogModel]
+    routing: Dict[str, Dict[str, str]] = Field(..., description="Model per phase and role")
+
+
+class DatabasePoolResponse(BaseModel):
+    """Schema for database connection pool metrics."""
+
+    mode: str = Field(..., description="queue (app-side pool) or null (PgBouncer mode)")
+    pool_size: Optional[int] = None
+    max_overflow: Optional[int] = None
+    checked_in: Optional[int] = Field(None, description="Idle connections in the pool")
+    overflow: Optional[int] = Field(None, description="Connections open beyond pool_size")
+    checked_out: int = Field(..., description="Connections currently in use")
+    peak_checked_out: int
+    checkouts: int
+    timeouts: int = Field(..., description="Checkouts that gave up waiting for a connection")
+    avg_wait_ms: float
+    max_wait_ms: float
+    replica: Optional["DatabasePoolResponse"] = Field(None, description="Read replica pool, if configured")
@@ -1,6 +1,6 @@
 """Pydantic schemas for documents."""
 from datetime import datetime
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, Field
@@ -19,8 +19,118 @@ class DocumentResponse(BaseModel):
         from_attributes = True
 
 
+def document_payload(document: Any) -> Dict[str, Any]:
+    """Build the DocumentResponse body of a document directly from its attributes.
+
+    Large documents are encoded from this dict, skipping validation into a
+    DocumentResponse and its serialization back to a dict.
+
+    Args:
+        document: Document instance
+
+    Returns:
+        Fields of DocumentResponse
+
+    """
+    return {
+        "type": document.type,
+        "content_md": document.content_md,
+        "metadata": document.metadata or {},
+        "created_at": document.created_at,
+        "updated_at": document.updated_at,
+    }
+
+
 class DocumentsResponse(BaseModel):
     """Schema for all documents response."""
 
     project_id: UUID
     documents: list[DocumentResponse]
+
+
+class DocumentVersionResponse(BaseModel):
+    """Schema for a document version entry (without content)."""
+
+    version: int
+    content_sha256: str
+    current: bool = Field(..., description="Whether this version is the current document content")
+    size_bytes: int = Field(..., description="Size of the full content")
+    stored_bytes: int = Field(..., description="Bytes stored for this version (delta or full snapshot)")
+    storage: str = Field(..., description="FULL or DELTA")
+    attributes: Dict[str, Any] = Field(default_factory=dict)
+    created_at: datetime
+
+
+class DocumentVersionsResponse(BaseModel):
+    """Schema for a document's version history."""
+
+    project_id: UUID
+    type: str
+    versions: list[DocumentVersionResponse]
+
+
+class DocumentVersionContentResponse(BaseModel):
+    """Schema for the content of a single document version."""
+
+    type: str
+    version: int
+    content_md: str
+    attributes: Dict[str, Any] = Field(default_factory=dict)
+    created_at: datetime
+
+
+class DocumentSection(BaseModel):
+    """Schema for a section index entry (byte offsets into the UTF-8 content)."""
+
+    slug: str
+    title: str
+    level: int = Field(..., description="Heading level (1-6)")
+    start: int = Field(..., description="Byte offset of the heading line")
+    end: int = Field(..., description="Byte offset where the section ends (exclusive), subsections included")
+
+
+class DocumentSectionsResponse(BaseModel):
+    """Schema for the section index of a document."""
+
+    project_id: UUID
+    type: str
+    size_bytes: int
+    sections: list[DocumentSection]
+
+
+class DocumentSectionResponse(DocumentSection):
+    """Schema for the content of a single document section."""
+
+    type: str
+    content_md: str
+
+
+class DocumentDiffResponse(BaseModel):
+    """Schema for a diff between two document versions."""
+
+    project_id: UUID
+    type: str
+    from_version: int
+    to_version: int
+    added_lines: int
+    removed_lines: int
+    unified_diff: str
+
+
+class DocumentSearchHit(BaseModel):
+    """Schema for a single document search result."""
+
+    document_id: UUID
+    project_id: UUID
+    type: str
+    rank: float
+    snippet: str = Field(..., description="Matching fragments, with matches wrapped in **")
+    updated_at: datetime
+
+
+class DocumentSearchResponse(BaseModel):
+    """Schema for document search response."""
+
+    query: str
+    results: list[DocumentSearchHit]
+    next_cursor: Optional[str] = Field(None, description="Cursor of the next page (null on the last page)")
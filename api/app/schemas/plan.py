@@ -0,0 +1,53 @@
+"""Pydantic schemas for execution plan stages and tasks."""
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+
+# Request schemas
+class PlanTaskUpdate(BaseModel):
+    """Schema for updating a plan task."""
+
+    completed: bool = Field(..., description="Whether the task is done")
+
+
+# Response schemas
+class PlanTaskResponse(BaseModel):
+    """Schema for a plan task."""
+
+    id: UUID
+    position: int
+    group_title: Optional[str] = Field(None, description="Task heading/label the checkbox belongs to")
+    text: str
+    completed: bool
+    completed_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
+class PlanStageResponse(BaseModel):
+    """Schema for a plan stage with task counts."""
+
+    position: int = Field(..., description="1-based position in the plan")
+    number: Optional[int] = Field(None, description="Stage number written in the heading")
+    title: str
+    total_tasks: int
+    completed_tasks: int
+
+
+class PlanStagesResponse(BaseModel):
+    """Schema for the stages of a project's execution plan."""
+
+    project_id: UUID
+    stages: list[PlanStageResponse]
+
+
+class PlanStageTasksResponse(BaseModel):
+    """Schema for the tasks of a single plan stage."""
+
+    project_id: UUID
+    stage: PlanStageResponse
+    tasks: list[PlanTaskResponse]
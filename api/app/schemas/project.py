@@ -1,9 +1,11 @@
 """Pydantic schemas for projects."""
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
+
+from app.services.model_catalog import model_catalog
 
 
 # Request schemas
@@ -12,6 +14,32 @@ class ProjectCreate(BaseModel):
 
     idea: str = Field(..., min_length=10, max_length=5000, description="Project idea description")
     user_id: UUID = Field(..., description="User ID from frontend system")
+    variants: int = Field(
+        1,
+        ge=1,
+        le=5,
+        description="Number of candidate PRDs/execution plans to generate and rank",
+    )
+    variant_models: Optional[List[str]] = Field(
+        None,
+        max_length=5,
+        description="Optional models to cycle through when generating variants",
+    )
+    budget_usd: Optional[float] = Field(
+        None,
+        gt=0,
+        description="Cost ceiling of the workflow; calls that would exceed it use cheaper models",
+    )
+
+    @field_validator("variant_models")
+    @classmethod
+    def validate_variant_models(cls, value: Optional[List[str]]) -> Optional[List[str]]:
+        """Only allow models in the model catalog."""
+        if value:
+            unknown = [model for model in value if model not in model_catalog]
+            if unknown:
+                raise ValueError(f"Unknown models: {', '.join(unknown)}")
+        return value
 
 
 class ProjectStartWorkflow(BaseModel):
@@ -29,6 +57,12 @@ class ProjectRetry(BaseModel):
     )
 
 
+class ProjectCancelRequest(BaseModel):
+    """Schema for cancelling a workflow."""
+
+    reason: Optional[str] = Field(None, max_length=500, description="Why the workflow is cancelled")
+
+
 # Response schemas
 class ProjectResponse(BaseModel):
     """Schema for project response."""
@@ -46,12 +80,23 @@ class ProjectResponse(BaseModel):
         from_attributes = True
 
 
+class SimilarProjectInfo(BaseModel):
+    """Schema for a completed project with a near-duplicate idea."""
+
+    project_id: UUID
+    similarity: float = Field(..., description="Shingle Jaccard similarity of the ideas (0-1)")
+    reusable_cost_usd: float = Field(
+        ..., description="LLM cost of the Smart Detection and Event Storming outputs that can be reused"
+    )
+
+
 class ProjectCreateResponse(BaseModel):
     """Schema for project creation response."""
 
     project_id: UUID
     status: str
     created_at: datetime
+    similar_project: Optional[SimilarProjectInfo] = None
 
 
 class ProjectStartWorkflowResponse(BaseModel):
@@ -61,6 +106,15 @@ class ProjectStartWorkflowResponse(BaseModel):
     status: str
     current_phase: str
     websocket_url: str
+    reused_from: Optional[SimilarProjectInfo] = None
+
+
+class ProjectCancelResponse(BaseModel):
+    """Schema for workflow cancellation response."""
+
+    project_id: UUID
+    status: str  # CANCELLING (stopping in this process) or CANCELLED
+    reason: str
 
 
 class CostBreakdownItem(BaseModel):
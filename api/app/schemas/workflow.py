@@ -1,8 +1,9 @@
 """Pydantic schemas for workflow and WebSocket messages."""
 from datetime import datetime
-from typing import Any, Dict, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional
+from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 # WebSocket message schemas
@@ -31,6 +32,7 @@ class PhaseCompletedMessage(BaseModel):
     type: Literal["phase_completed"] = "phase_completed"
     phase: str
     duration_seconds: int
+    duration_ms: int
     cost_usd: float
     timestamp: datetime
 
@@ -45,6 +47,30 @@ class PhaseFailedMessage(BaseModel):
     timestamp: datetime
 
 
+class PhaseRetryingMessage(BaseModel):
+    """WebSocket message for a phase retried after a transient error."""
+
+    type: Literal["phase_retrying"] = "phase_retrying"
+    phase: str
+    attempt: int = Field(..., description="Number of the failed attempt")
+    max_attempts: int
+    delay_seconds: float = Field(..., description="Delay before the next attempt")
+    error: str
+    timestamp: datetime
+
+
+class ModelDowngradedMessage(BaseModel):
+    """WebSocket message for an LLM call moved to a cheaper model to stay within budget."""
+
+    type: Literal["model_downgraded"] = "model_downgraded"
+    phase: str
+    requested_model: str
+    model: str
+    projected_cost_usd: float = Field(..., description="Workflow spend including this call's estimate")
+    budget_usd: float
+    timestamp: datetime
+
+
 class WorkflowCompletedMessage(BaseModel):
     """WebSocket message for workflow completed."""
 
@@ -55,16 +81,49 @@ class WorkflowCompletedMessage(BaseModel):
     timestamp: datetime
 
 
+class WorkflowCancelledMessage(BaseModel):
+    """WebSocket message for workflow cancelled (by a user or its deadline)."""
+
+    type: Literal["workflow_cancelled"] = "workflow_cancelled"
+    reason: str
+    phase: Optional[str] = Field(None, description="Phase that was running when cancelled")
+    timestamp: datetime
+
+
 # Union type for all WebSocket messages
 WebSocketMessage = (
     PhaseStartedMessage
     | PhaseProgressMessage
     | PhaseCompletedMessage
+    | PhaseRetryingMessage
+    | ModelDowngradedMessage
     | PhaseFailedMessage
     | WorkflowCompletedMessage
+    | WorkflowCancelledMessage
 )
 
 
+# Structured LLM output schemas
+class SmartDetectionResult(BaseModel):
+    """Structured output of the Smart Detection phase."""
+
+    model_config = ConfigDict(extra="ignore")
+
+    use_event_storming: bool
+    feature_count_estimate: int
+    has_complex_business_logic: bool
+    reasoning: str
+
+
+class ApproachDetectionResult(BaseModel):
+    """Structured output of the development approach detection."""
+
+    model_config = ConfigDict(extra="ignore")
+
+    approach: Literal["HORIZONTAL", "VERTICAL"]
+    reasoning: str
+
+
 # Workflow state schemas
 class WorkflowStateResponse(BaseModel):
     """Schema for workflow state response."""
@@ -77,3 +136,38 @@ class WorkflowStateResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+# Timeline schemas
+class TimelineSpan(BaseModel):
+    """Schema for a single profiler span."""
+
+    id: int
+    name: str
+    category: str
+    phase: Optional[str] = None
+    parent_id: Optional[int] = None
+    start_ms: float
+    end_ms: float
+    duration_ms: float
+    attributes: Dict[str, Any] = Field(default_factory=dict)
+
+
+class CriticalPathBreakdown(BaseModel):
+    """Schema for time spent on the critical path, by span category."""
+
+    total_ms: float
+    by_category_ms: Dict[str, float]
+    unaccounted_ms: float
+
+
+class WorkflowTimelineResponse(BaseModel):
+    """Schema for workflow timeline response."""
+
+    project_id: UUID
+    status: str
+    total_ms: int
+    created_at: datetime
+    spans: List[TimelineSpan]
+    critical_path: List[TimelineSpan]
+    breakdown: CriticalPathBreakdown
@@ -0,0 +1,589 @@
+"""Cold storage archive of completed projects.
+
+Projects are streamed table by table through server-side cursors into one
+gzip-compressed JSONL file per project, then deleted from the hot tables in
+small batches. Archived projects can be restored on demand.
+
+Usage:
+    python -m app.services.archive_service archive --older-than-days 90
+    python -m app.services.archive_service restore <project_id>
+    python -m app.services.archive_service cleanup-blobs
+"""
+import argparse
+import asyncio
+import gzip
+import json
+import logging
+import os
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+from uuid import UUID
+
+from sqlalchemy import ColumnElement, Table, delete, exists, insert, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.config import settings
+from app.db.models import (
+    Document,
+    DocumentBlob,
+    DocumentVersion,
+    IdeaFingerprint,
+    LLMLog,
+    PlanStage,
+    PlanTask,
+    Project,
+    WorkflowState,
+    WorkflowTimeline,
+)
+from app.db.rows import decode_row, encode_row
+from app.db.session import engine
+from app.workflow.document_storage import search_vector_expression
+from app.workflow.similarity import lsh_bands, minhash_signature
+from app.workflow.state_machine import WorkflowStatus
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_FORMAT = "project-archive"
+ARCHIVE_VERSION = 1
+
+# Projects being archived by this process (guards against overlapping jobs)
+_archiving: Set[UUID] = set()
+
+projects = Project.__table__
+workflow_states = WorkflowState.__table__
+llm_logs = LLMLog.__table__
+documents = Document.__table__
+document_versions = DocumentVersion.__table__
+document_blobs = DocumentBlob.__table__
+workflow_timelines = WorkflowTimeline.__table__
+idea_fingerprints = IdeaFingerprint.__table__
+plan_stages = PlanStage.__table__
+plan_tasks = PlanTask.__table__
+
+# Derived columns (and idea fingerprints) are not archived; they are recomputed on restore
+DERIVED_COLUMNS = {"documents": {"search_vector"}}
+
+# Tables restored from archives, in insertion (foreign key) order
+RESTORE_TABLES = {
+    table.name: table
+    for table in (
+        projects,
+        workflow_states,
+        llm_logs,
+        documents,
+        document_blobs,
+        document_versions,
+        plan_stages,
+        plan_tasks,
+        workflow_timelines,
+    )
+}
+
+
+class ArchiveConflictError(ValueError):
+    """The project cannot be restored because it already exists."""
+
+
+class InvalidArchiveError(ValueError):
+    """The archive file is not a complete, readable archive of the project."""
+
+
+@dataclass
+class ArchiveResult:
+    """Outcome of archiving a single project."""
+
+    project_id: UUID
+    path: str
+    size_bytes: int
+    rows: Dict[str, int] = field(default_factory=dict)
+
+
+def archive_path(project_id: UUID) -> Path:
+    """Get the archive file path of a project.
+
+    Args:
+        project_id: Project UUID
+
+    Returns:
+        Path of the gzip-compressed JSONL archive
+
+    """
+    return Path(settings.ARCHIVE_DIR) / f"project-{project_id}.jsonl.gz"
+
+
+def _referenced_blobs(project_id: UUID) -> Any:
+    """Select the blobs used by a project's document versions, including delta bases."""
+    project_documents = select(documents.c.id).where(documents.c.project_id == project_id)
+    chain = (
+        select(document_blobs.c.sha256, document_blobs.c.base_sha256)
+        .where(
+            document_blobs.c.sha256.in_(
+                select(document_versions.c.content_sha256).where(
+                    document_versions.c.document_id.in_(project_documents)
+                )
+            )
+        )
+        .cte("blob_chain", recursive=True)
+    )
+    chain = chain.union(
+        select(document_blobs.c.sha256, document_blobs.c.base_sha256).join(
+            chain, document_blobs.c.sha256 == chain.c.base_sha256
+        )
+    )
+    # Bases first, so deltas can be restored after the blobs they reference
+    return (
+        select(document_blobs)
+        .where(document_blobs.c.sha256.in_(select(chain.c.sha256)))
+        .order_by(document_blobs.c.chain_depth)
+    )
+
+
+def _project_queries(project_id: UUID) -> List[Tuple[Table, Any]]:
+    """Build the per-table selects of a project, in restore order."""
+    project_documents = select(documents.c.id).where(documents.c.project_id == project_id)
+    return [
+        (projects, select(projects).where(projects.c.id == project_id)),
+        (workflow_states, select(workflow_states).where(workflow_states.c.project_id == project_id)),
+        (llm_logs, select(llm_logs).where(llm_logs.c.project_id == project_id)),
+        (
+            documents,
+            select(*(c for c in documents.columns if c.name not in DERIVED_COLUMNS["documents"])).where(
+                documents.c.project_id == project_id
+            ),
+        ),
+        (document_blobs, _referenced_blobs(project_id)),
+        (
+            document_versions,
+            select(document_versions).where(document_versions.c.document_id.in_(project_documents)),
+        ),
+        (plan_stages, select(plan_stages).where(plan_stages.c.project_id == project_id)),
+        (plan_tasks, select(plan_tasks).where(plan_tasks.c.project_id == project_id)),
+        (workflow_timelines, select(workflow_timelines).where(workflow_timelines.c.project_id == project_id)),
+    ]
+
+
+async def find_archivable_projects(
+    conn: AsyncConnection, older_than_days: int, limit: int
+) -> List[UUID]:
+    """Find completed projects older than the given age.
+
+    Args:
+        conn: Database connection
+        older_than_days: Minimum age since completion
+        limit: Maximum number of projects
+
+    Returns:
+        Project IDs, oldest first
+
+    """
+    cutoff = datetime.utcnow() - timedelta(days=older_than_days)
+    result = await conn.execute(
+        select(projects.c.id)
+        .where(
+            projects.c.status == WorkflowStatus.COMPLETED.value,
+            projects.c.completed_at < cutoff,
+        )
+        .order_by(projects.c.completed_at)
+        .limit(limit)
+    )
+    return list(result.scalars().all())
+
+
+def _write_records(archive: IO[str], records: Iterable[Dict[str, Any]]) -> None:
+    """Encode records as JSON lines and write them (runs in a worker thread)."""
+    archive.write("".join(json.dumps(record) + "\n" for record in records))
+
+
+def _write_rows(archive: IO[str], table_name: str, partition: Sequence[Any]) -> None:
+    """Encode a batch of table rows and write them (runs in a worker thread)."""
+    _write_records(archive, ({"table": table_name, "row": encode_row(row._mapping)} for row in partition))
+
+
+def _commit_archive(archive: IO[str], tmp_path: Path, path: Path) -> int:
+    """Close, sync and move an archive into place (runs in a worker thread).
+
+    Returns:
+        Size of the archive file in bytes
+
+    """
+    archive.close()
+    with open(tmp_path, "rb") as archive_file:
+        os.fsync(archive_file.fileno())
+    os.replace(tmp_path, path)
+    return path.stat().st_size
+
+
+def _discard_archive(archive: IO[str], tmp_path: Path) -> None:
+    """Close and delete an unfinished archive (runs in a worker thread)."""
+    archive.close()
+    tmp_path.unlink(missing_ok=True)
+
+
+async def _write_archive(conn: AsyncConnection, project_id: UUID, batch_size: int) -> ArchiveResult:
+    """Stream all rows of a project into its archive file.
+
+    Compression, file writes and fsync run in worker threads, so archiving
+    does not block the event loop.
+    """
+    path = archive_path(project_id)
+    await asyncio.to_thread(path.parent.mkdir, parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+
+    rows: Dict[str, int] = {}
+    archive = await asyncio.to_thread(gzip.open, tmp_path, "wt", encoding="utf-8")
+    try:
+        header = {
+            "format": ARCHIVE_FORMAT,
+            "version": ARCHIVE_VERSION,
+            "project_id": str(project_id),
+            "archived_at": datetime.utcnow().isoformat(),
+        }
+        await asyncio.to_thread(_write_records, archive, [header])
+
+        for table, query in _project_queries(project_id):
+            rows[table.name] = 0
+            result = await conn.stream(query.execution_options(yield_per=batch_size))
+            async for partition in result.partitions(batch_size):
+                await asyncio.to_thread(_write_rows, archive, table.name, partition)
+                rows[table.name] += len(partition)
+
+        # A trailer marks the archive as complete
+        await asyncio.to_thread(_write_records, archive, [{"end": True, "rows": rows}])
+        size_bytes = await asyncio.to_thread(_commit_archive, archive, tmp_path, path)
+    except BaseException:
+        await asyncio.to_thread(_discard_archive, archive, tmp_path)
+        raise
+
+    return ArchiveResult(project_id=project_id, path=str(path), size_bytes=size_bytes, rows=rows)
+
+
+async def _delete_in_batches(
+    conn: AsyncConnection, table: Table, condition: ColumnElement, batch_size: int
+) -> int:
+    """Delete matching rows in statements of at most batch_size rows."""
+    deleted = 0
+    while True:
+        batch = select(table.c.id).where(condition).limit(batch_size).scalar_subquery()
+        result = await conn.execute(delete(table).where(table.c.id.in_(batch)))
+        deleted += result.rowcount
+        if result.rowcount < batch_size:
+            return deleted
+
+
+async def _delete_project_rows(conn: AsyncConnection, project_id: UUID, batch_size: int) -> None:
+    """Delete an archived project from the hot tables, children first."""
+    project_documents = select(documents.c.id).where(documents.c.project_id == project_id)
+    for table, condition in (
+        (llm_logs, llm_logs.c.project_id == project_id),
+        (workflow_states, workflow_states.c.project_id == project_id),
+        (workflow_timelines, workflow_timelines.c.project_id == project_id),
+        (plan_tasks, plan_tasks.c.project_id == project_id),
+        (plan_stages, plan_stages.c.project_id == project_id),
+        (document_versions, document_versions.c.document_id.in_(project_documents)),
+        (documents, documents.c.project_id == project_id),
+    ):
+        await _delete_in_batches(conn, table, condition, batch_size)
+    await conn.execute(delete(idea_fingerprints).where(idea_fingerprints.c.project_id == project_id))
+    await conn.execute(delete(projects).where(projects.c.id == project_id))
+
+
+async def cleanup_orphan_blobs(batch_size: Optional[int] = None) -> int:
+    """Delete document blobs no longer referenced by any version or delta.
+
+    Args:
+        batch_size: Maximum rows deleted per transaction
+
+    Returns:
+        Number of deleted blobs
+
+    """
+    batch_size = batch_size or settings.ARCHIVE_BATCH_SIZE
+    dependent = document_blobs.alias("dependent")
+    deleted = 0
+    while True:
+        orphans = (
+            select(document_blobs.c.sha256)
+            .where(
+                ~exists().where(document_versions.c.content_sha256 == document_blobs.c.sha256),
+                ~exists().where(dependent.c.base_sha256 == document_blobs.c.sha256),
+            )
+            .limit(batch_size)
+            .scalar_subquery()
+        )
+        async with engine.begin() as conn:
+            result = await conn.execute(delete(document_blobs).where(document_blobs.c.sha256.in_(orphans)))
+        deleted += result.rowcount
+        # Deleting a delta can orphan its base, so repeat until nothing is left
+        if result.rowcount == 0:
+            return deleted
+
+
+async def archive_project(project_id: UUID, batch_size: Optional[int] = None) -> ArchiveResult:
+    """Archive a project to cold storage and delete it from the hot tables.
+
+    The archive file is fully written and synced before any row is deleted.
+    Export and deletion share one REPEATABLE READ transaction that first
+    locks the project row: writers of the project's rows (which touch
+    ``projects.updated_at``) wait until the archive is done, and a row changed
+    after the snapshot fails the transaction instead of being deleted
+    unarchived.
+
+    Args:
+        project_id: Project UUID
+        batch_size: Rows fetched/deleted per batch
+
+    Returns:
+        ArchiveResult
+
+    Raises:
+        ValueError: If the project does not exist
+
+    """
+    batch_size = batch_size or settings.ARCHIVE_BATCH_SIZE
+    async with engine.connect() as conn:
+        # One snapshot for all tables of the project
+        await conn.execution_options(isolation_level="REPEATABLE READ")
+        async with conn.begin():
+            locked = await conn.execute(
+                select(projects.c.id).where(projects.c.id == project_id).with_for_update()
+            )
+            if locked.first() is None:
+                raise ValueError(f"Project {project_id} not found")
+
+            result = await _write_archive(conn, project_id, batch_size)
+            await _delete_project_rows(conn, project_id, batch_size)
+
+    logger.info(f"Archived project {project_id} to {result.path} ({result.size_bytes} bytes)")
+    return result
+
+
+async def select_archivable_projects(older_than_days: Optional[int] = None, limit: int = 50) -> List[UUID]:
+    """Select completed projects older than the given age.
+
+    Args:
+        older_than_days: Minimum age since completion (defaults to ARCHIVE_AFTER_DAYS)
+        limit: Maximum number of projects
+
+    Returns:
+        Project IDs, oldest first
+
+    """
+    older_than_days = settings.ARCHIVE_AFTER_DAYS if older_than_days is None else older_than_days
+    async with engine.connect() as conn:
+        return await find_archivable_projects(conn, older_than_days, limit)
+
+
+async def archive_selected(project_ids: Sequence[UUID]) -> Tuple[List[ArchiveResult], int]:
+    """Archive the given projects one by one, then delete orphaned blobs.
+
+    Projects already being archived by another job of this process are
+    skipped. Failures are logged and do not stop the batch.
+
+    Args:
+        project_ids: Projects to archive
+
+    Returns:
+        Tuple of (archive results, deleted orphan blobs)
+
+    """
+    results = []
+    for project_id in project_ids:
+        if project_id in _archiving:
+            logger.info(f"Project {project_id} is already being archived, skipping")
+            continue
+        _archiving.add(project_id)
+        try:
+            results.append(await archive_project(project_id))
+        except Exception as e:
+            logger.error(f"Failed to archive project {project_id}: {e}")
+        finally:
+            _archiving.discard(project_id)
+
+    deleted_blobs = await cleanup_orphan_blobs() if results else 0
+    logger.info(f"Archived {len(results)}/{len(project_ids)} projects, deleted {deleted_blobs} orphan blobs")
+    return results, deleted_blobs
+
+
+async def archive_projects(
+    older_than_days: Optional[int] = None,
+    limit: int = 50,
+    dry_run: bool = False,
+) -> Tuple[List[UUID], List[ArchiveResult], int]:
+    """Archive completed projects older than the given age.
+
+    Args:
+        older_than_days: Minimum age since completion (defaults to ARCHIVE_AFTER_DAYS)
+        limit: Maximum number of projects to archive
+        dry_run: Only list the projects that would be archived
+
+    Returns:
+        Tuple of (selected project IDs, archive results, deleted orphan blobs)
+
+    """
+    project_ids = await select_archivable_projects(older_than_days, limit)
+    if dry_run:
+        return project_ids, [], 0
+
+    results, deleted_blobs = await archive_selected(project_ids)
+    return project_ids, results, deleted_blobs
+
+
+def _read_archive(path: Path, project_id: UUID) -> Iterator[Tuple[Table, Dict[str, Any]]]:
+    """Read (table, encoded row) records from an archive file.
+
+    Raises:
+        InvalidArchiveError: If the file is not an archive of the project or is
+            truncated (raised after the last record, so callers roll back)
+
+    """
+    with gzip.open(path, "rt", encoding="utf-8") as archive:
+        header = json.loads(archive.readline())
+        if header.get("format") != ARCHIVE_FORMAT or header.get("project_id") != str(project_id):
+            raise InvalidArchiveError(f"Invalid archive file {path}")
+
+        for line in archive:
+            record = json.loads(line)
+            if record.get("end"):
+                return
+            yield RESTORE_TABLES[record["table"]], record["row"]
+
+    raise InvalidArchiveError(f"Archive file {path} is truncated")
+
+
+def _read_batches(
+    path: Path, project_id: UUID, batch_size: int
+) -> Iterator[Tuple[Table, List[Dict[str, Any]]]]:
+    """Read and decode archived rows in batches of one table.
+
+    Iterated from a worker thread, so decompression and decoding do not
+    block the event loop.
+
+    Raises:
+        InvalidArchiveError: If the archive is invalid, truncated or corrupt
+
+    """
+    current: Optional[Table] = None
+    batch: List[Dict[str, Any]] = []
+    try:
+        for table, row in _read_archive(path, project_id):
+            if batch and (table is not current or len(batch) >= batch_size):
+                yield current, batch
+                batch = []
+            current = table
+            batch.append(decode_row(table, row))
+    except InvalidArchiveError:
+        raise
+    except (OSError, EOFError, ValueError, KeyError, TypeError) as e:
+        raise InvalidArchiveError(f"Archive file {path} is corrupt: {e}") from e
+
+    if batch:
+        yield current, batch
+
+
+async def restore_project(project_id: UUID, batch_size: Optional[int] = None) -> Dict[str, int]:
+    """Restore an archived project into the hot tables.
+
+    Args:
+        project_id: Project UUID
+        batch_size: Rows inserted per statement
+
+    Returns:
+        Restored row counts per table
+
+    Raises:
+        FileNotFoundError: If there is no archive for the project
+        ArchiveConflictError: If the project already exists
+        InvalidArchiveError: If the archive is invalid, truncated or corrupt
+
+    """
+    batch_size = batch_size or settings.ARCHIVE_BATCH_SIZE
+    path = archive_path(project_id)
+    if not await asyncio.to_thread(path.exists):
+        raise FileNotFoundError(f"No archive found for project {project_id}")
+
+    rows: Dict[str, int] = {}
+    async with engine.begin() as conn:
+        existing = await conn.execute(select(projects.c.id).where(projects.c.id == project_id))
+        if existing.first() is not None:
+            raise ArchiveConflictError(f"Project {project_id} already exists")
+
+        batches = _read_batches(path, project_id, batch_size)
+        try:
+            while (item := await asyncio.to_thread(next, batches, None)) is not None:
+                table, batch = item
+                if table is document_blobs:
+                    # Blobs are shared by content - they may still be present
+                    statement = pg_insert(table).on_conflict_do_nothing()
+                else:
+                    statement = insert(table)
+                await conn.execute(statement, batch)
+                rows[table.name] = rows.get(table.name, 0) + len(batch)
+        finally:
+            await asyncio.to_thread(batches.close)
+
+        await conn.execute(
+            update(documents)
+            .where(documents.c.project_id == project_id)
+            .values(search_vector=search_vector_expression(documents.c.content_md))
+        )
+
+        user_id, idea = (
+            await conn.execute(select(projects.c.user_id, projects.c.idea).where(projects.c.id == project_id))
+        ).one()
+        signature = minhash_signature(idea)
+        await conn.execute(
+            insert(idea_fingerprints).values(
+                project_id=project_id, user_id=user_id, signature=signature, bands=lsh_bands(signature)
+            )
+        )
+
+    logger.info(f"Restored project {project_id} from {path}")
+    return rows
+
+
+def main() -> None:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Archive completed projects to cold storage")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    archive_parser = subparsers.add_parser("archive", help="Archive old completed projects")
+    archive_parser.add_argument("--older-than-days", type=int, default=settings.ARCHIVE_AFTER_DAYS)
+    archive_parser.add_argument("--limit", type=int, default=50)
+    archive_parser.add_argument("--dry-run", action="store_true")
+
+    restore_parser = subparsers.add_parser("restore", help="Restore an archived project")
+    restore_parser.add_argument("project_id", type=UUID)
+
+    subparsers.add_parser("cleanup-blobs", help="Delete unreferenced document blobs")
+
+    args = parser.parse_args()
+    logging.basicConfig(level=settings.LOG_LEVEL)
+
+    async def run() -> None:
+        try:
+            if args.command == "archive":
+                project_ids, results, deleted_blobs = await archive_projects(
+                    args.older_than_days, args.limit, args.dry_run
+                )
+                for project_id in project_ids:
+                    print(project_id)
+                print(
+                    f"{len(project_ids)} project(s) selected, {len(results)} archived, "
+                    f"{deleted_blobs} orphan blob(s) deleted"
+                )
+            elif args.command == "restore":
+                rows = await restore_project(args.project_id)
+                print(json.dumps(rows))
+            else:
+                print(f"{await cleanup_orphan_blobs()} orphan blob(s) deleted")
+        finally:
+            await engine.dispose()
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
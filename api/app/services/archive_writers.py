@@ -0,0 +1,162 @@
+"""Incremental archive writers producing output without a seekable file.
+
+Each writer collects its output in memory only until ``drain`` is called, so
+callers can stream archives chunk by chunk with constant memory.
+"""
+import tarfile
+import zipfile
+import zlib
+from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List
+
+
+class _Sink:
+    """Write-only file object collecting archive output until drained."""
+
+    def __init__(self) -> None:
+        self._parts: List[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self._parts.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._parts)
+        self._parts = []
+        return data
+
+
+class ArchiveWriter(ABC):
+    """Incremental archive writer; output is collected with ``drain``."""
+
+    def __init__(self) -> None:
+        self._sink = _Sink()
+
+    @abstractmethod
+    def start_file(self, name: str, size_bytes: int, modified: datetime) -> None:
+        """Start a new file of a known size."""
+        pass
+
+    @abstractmethod
+    def write(self, data: bytes) -> None:
+        """Write file data."""
+        pass
+
+    def end_file(self) -> None:  # noqa: B027 - optional hook
+        """Finish the current file (nothing to do by default)."""
+
+    def close(self) -> None:  # noqa: B027 - optional hook
+        """Finish the archive (nothing to do by default)."""
+
+    def drain(self) -> bytes:
+        """Return and clear the output produced so far."""
+        return self._sink.drain()
+
+
+class ZipArchiveWriter(ArchiveWriter):
+    """Zip writer for a non-seekable output (entries use data descriptors)."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._zip = zipfile.ZipFile(self._sink, mode="w", compression=zipfile.ZIP_DEFLATED)
+        self._entry: Any = None
+
+    def start_file(self, name: str, size_bytes: int, modified: datetime) -> None:
+        info = zipfile.ZipInfo(name, date_time=modified.timetuple()[:6])
+        info.compress_type = zipfile.ZIP_DEFLATED
+        info.file_size = size_bytes  # Decides whether ZIP64 headers are needed
+        self._entry = self._zip.open(info, mode="w")
+
+    def write(self, data: bytes) -> None:
+        self._entry.write(data)
+
+    def end_file(self) -> None:
+        self._entry.close()
+        self._entry = None
+
+    def close(self) -> None:
+        self._zip.close()
+
+
+class TarGzArchiveWriter(ArchiveWriter):
+    """tar.gz writer emitting headers and data blocks directly through gzip."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._gzip = zlib.compressobj(6, zlib.DEFLATED, 31)  # wbits=31: gzip container
+        self._remaining = 0
+        self._padding = 0
+        self._total = 0
+
+    def _emit(self, data: bytes) -> None:
+        self._total += len(data)
+        self._sink.write(self._gzip.compress(data))
+
+    def start_file(self, name: str, size_bytes: int, modified: datetime) -> None:
+        info = tarfile.TarInfo(name)
+        info.size = size_bytes
+        info.mtime = int(modified.replace(tzinfo=timezone.utc).timestamp())  # Stored as naive UTC
+        info.mode = 0o644
+        self._emit(info.tobuf(tarfile.PAX_FORMAT, "utf-8", "surrogateescape"))
+        self._remaining = size_bytes
+        self._padding = -size_bytes % tarfile.BLOCKSIZE
+
+    def write(self, data: bytes) -> None:
+        if len(data) > self._remaining:
+            raise ValueError("File data exceeds the size declared in the tar header")
+        self._remaining -= len(data)
+        self._emit(data)
+
+    def end_file(self) -> None:
+        if self._remaining:
+            raise ValueError("File data is shorter than the size declared in the tar header")
+        self._emit(tarfile.NUL * self._padding)
+
+    def close(self) -> None:
+        # End-of-archive marker, padded to a full record
+        self._emit(tarfile.NUL * (2 * tarfile.BLOCKSIZE))
+        self._emit(tarfile.NUL * (-self._total % tarfile.RECORDSIZE))
+        self._sink.write(self._gzip.flush())
+
+
+class MarkdownBundleWriter(ArchiveWriter):
+    """Single markdown file with all documents, separated by rules."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._files = 0
+
+    def start_file(self, name: str, size_bytes: int, modified: datetime) -> None:
+        separator = "\n\n---\n\n" if self._files else ""
+        self._sink.write(f"{separator}<!-- {name} -->\n\n".encode("utf-8"))
+        self._files += 1
+
+    def write(self, data: bytes) -> None:
+        self._sink.write(data)
+
+
+def create_archive_writer(export_format: str) -> ArchiveWriter:
+    """Create the archive writer for an export format.
+
+    Args:
+        export_format: One of EXPORT_FORMATS
+
+    Returns:
+        ArchiveWriter
+
+    Raises:
+        ValueError: If the format is not supported
+
+    """
+    writers: Dict[str, Callable[[], ArchiveWriter]] = {
+        "zip": ZipArchiveWriter,
+        "tar.gz": TarGzArchiveWriter,
+        "md": MarkdownBundleWriter,
+    }
+    if export_format not in writers:
+        raise ValueError(f"Unsupported export format: {export_format}")
+    return writers[export_format]()
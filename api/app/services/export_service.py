@@ -0,0 +1,228 @@
+"""Streaming export of project documents as zip, tar.gz or a single markdown bundle.
+
+Archives are generated on the fly: document contents are read from the
+database in fixed-size chunks and written through an archive writer whose
+output is drained after every chunk, so memory use does not depend on the
+size of the documents.
+"""
+import hashlib
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import Document, LLMLog, Project, WorkflowState
+from app.services.archive_writers import create_archive_writer
+from app.workflow.state_machine import DocumentType
+
+# Characters read from the database per query
+EXPORT_CHUNK_CHARS = 64 * 1024
+
+EXPORT_FORMATS = {
+    "zip": ("application/zip", "zip"),
+    "tar.gz": ("application/gzip", "tar.gz"),
+    "md": ("text/markdown; charset=utf-8", "md"),
+}
+
+# Documents appear in workflow order
+DOCUMENT_ORDER = [
+    DocumentType.EVENT_STORMING.value,
+    DocumentType.PRD.value,
+    DocumentType.TECH_STACK.value,
+    DocumentType.EXECUTION_PLAN.value,
+]
+
+
+@dataclass
+class ExportDocument:
+    """Document to export (content is streamed separately)."""
+
+    id: UUID
+    type: str
+    size_bytes: int
+    length: int  # Characters
+    updated_at: datetime
+    model: Optional[str] = None
+
+    @property
+    def filename(self) -> str:
+        """File name inside the archive."""
+        return f"{self.type.lower()}.md"
+
+
+async def get_export_documents(db: AsyncSession, project_id: UUID) -> List[ExportDocument]:
+    """Get the documents of a project without loading their content.
+
+    Args:
+        db: Database session
+        project_id: Project UUID
+
+    Returns:
+        Documents in workflow order
+
+    """
+    result = await db.execute(
+        select(
+            Document.id,
+            Document.type,
+            func.octet_length(Document.content_md),
+            func.length(Document.content_md),
+            Document.updated_at,
+            Document.__table__.c.metadata["model"].astext,
+        ).where(Document.project_id == project_id)
+    )
+    documents = [ExportDocument(*row) for row in result.all()]
+    documents.sort(
+        key=lambda doc: DOCUMENT_ORDER.index(doc.type) if doc.type in DOCUMENT_ORDER else len(DOCUMENT_ORDER)
+    )
+    return documents
+
+
+def export_etag(project: Project, documents: List[ExportDocument], export_format: str) -> str:
+    """Compute a strong ETag for the export of a project.
+
+    Args:
+        project: Project
+        documents: Documents to export
+        export_format: Export format
+
+    Returns:
+        Quoted ETag value
+
+    """
+    digest = hashlib.sha256(f"{project.id}:{project.updated_at.isoformat()}:{export_format}".encode())
+    for document in documents:
+        digest.update(f":{document.type}:{document.updated_at.isoformat()}:{document.size_bytes}".encode())
+    return f'"{digest.hexdigest()[:32]}"'
+
+
+async def _get_phase_summary(db: AsyncSession, project_id: UUID) -> List[Dict[str, Any]]:
+    """Summarize cost, models and timing per phase for the manifest."""
+    result = await db.execute(
+        select(
+            LLMLog.phase,
+            func.sum(LLMLog.cost_usd),
+            func.sum(LLMLog.total_tokens),
+            func.array_agg(func.distinct(LLMLog.model)),
+        )
+        .where(LLMLog.project_id == project_id)
+        .group_by(LLMLog.phase)
+    )
+    costs = {phase: (cost, tokens, models) for phase, cost, tokens, models in result.all()}
+
+    result = await db.execute(
+        select(WorkflowState.phase, WorkflowState.status, WorkflowState.started_at, WorkflowState.completed_at)
+        .where(WorkflowState.project_id == project_id)
+        .order_by(WorkflowState.created_at)
+    )
+
+    phases: Dict[str, Dict[str, Any]] = {}
+    for phase, status, started_at, completed_at in result.all():
+        # The latest attempt of a phase wins
+        phases[phase] = {
+            "phase": phase,
+            "status": status,
+            "started_at": started_at.isoformat() if started_at else None,
+            "completed_at": completed_at.isoformat() if completed_at else None,
+            "duration_ms": (
+                int((completed_at - started_at).total_seconds() * 1000)
+                if started_at and completed_at
+                else None
+            ),
+        }
+
+    for phase, (cost, tokens, models) in costs.items():
+        entry = phases.setdefault(phase, {"phase": phase})
+        entry.update(cost_usd=float(cost or 0), total_tokens=int(tokens or 0), models=sorted(models))
+
+    return list(phases.values())
+
+
+async def stream_export(
+    session_factory: Callable[[], AsyncSession],
+    project_id: UUID,
+    export_format: str,
+    chunk_chars: int = EXPORT_CHUNK_CHARS,
+) -> AsyncIterator[bytes]:
+    """Stream an export archive of all project documents plus a manifest.
+
+    Uses its own session (the request session is closed once streaming
+    starts) with a repeatable-read snapshot, so sizes written to archive
+    headers match the streamed content.
+
+    Args:
+        session_factory: Factory creating a database session
+        project_id: Project UUID
+        export_format: One of EXPORT_FORMATS
+        chunk_chars: Characters read from the database per query
+
+    Yields:
+        Archive bytes
+
+    """
+    writer = create_archive_writer(export_format)
+    root = f"project-{project_id}"
+
+    async with session_factory() as db:
+        await db.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+
+        project = (await db.execute(select(Project).where(Project.id == project_id))).scalar_one()
+        documents = await get_export_documents(db, project_id)
+
+        manifest_documents = []
+        for document in documents:
+            digest = hashlib.sha256()
+            writer.start_file(f"{root}/{document.filename}", document.size_bytes, document.updated_at)
+
+            for start in range(1, document.length + 1, chunk_chars):
+                result = await db.execute(
+                    select(func.substr(Document.content_md, start, chunk_chars)).where(
+                        Document.id == document.id
+                    )
+                )
+                data = result.scalar_one().encode("utf-8")
+                digest.update(data)
+                writer.write(data)
+                output = writer.drain()
+                if output:
+                    yield output
+
+            writer.end_file()
+            manifest_documents.append(
+                {
+                    "type": document.type,
+                    "filename": document.filename,
+                    "size_bytes": document.size_bytes,
+                    "sha256": digest.hexdigest(),
+                    "model": document.model,
+                    "updated_at": document.updated_at.isoformat(),
+                }
+            )
+
+        metadata = project.metadata or {}
+        manifest = {
+            "project_id": str(project.id),
+            "idea": project.idea,
+            "status": project.status,
+            "created_at": project.created_at.isoformat(),
+            "completed_at": project.completed_at.isoformat() if project.completed_at else None,
+            "total_cost_usd": metadata.get("total_cost_usd"),
+            "total_duration_seconds": metadata.get("total_duration_seconds"),
+            "documents": manifest_documents,
+            "phases": await _get_phase_summary(db, project_id),
+        }
+
+    manifest_bytes = json.dumps(manifest, indent=2).encode("utf-8")
+    if export_format == "md":
+        manifest_bytes = b"```json\n" + manifest_bytes + b"\n```\n"
+    writer.start_file(
+        f"{root}/manifest.json", len(manifest_bytes), project.completed_at or project.updated_at
+    )
+    writer.write(manifest_bytes)
+    writer.end_file()
+    writer.close()
+    yield writer.drain()
@@ -0,0 +1,240 @@
+"""Near-duplicate idea detection and reuse of prior workflow outputs.
+
+Every project idea gets a MinHash fingerprint. Candidates are the completed
+projects sharing at least one LSH band (GIN-indexed array overlap). Their
+stored signatures estimate the similarity without loading the ideas, and
+only the best few are re-ranked by the exact shingle similarity of their
+ideas. The Smart Detection
+output and Event Storming document of a close match can seed a new workflow
+instead of being generated again.
+"""
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.db.models import Document, IdeaFingerprint, LLMLog, Project
+from app.workflow.similarity import jaccard, lsh_bands, minhash_signature, shingles, shortlist
+from app.workflow.state_machine import DocumentType, WorkflowPhase, WorkflowStatus
+
+# Band matches whose ideas are re-ranked by exact similarity per lookup
+SHORTLIST_SIZE = 5
+# Margin below the threshold for signature estimates (MinHash error with NUM_PERM values)
+ESTIMATE_TOLERANCE = 0.1
+
+
+@dataclass
+class SimilarProject:
+    """A completed project whose idea is close to a new one."""
+
+    project_id: UUID
+    similarity: float
+    reusable_cost_usd: float  # What reusing its outputs saves
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dict (project metadata)."""
+        return {
+            "project_id": str(self.project_id),
+            "similarity": round(self.similarity, 4),
+            "reusable_cost_usd": round(self.reusable_cost_usd, 6),
+        }
+
+
+@dataclass
+class ReuseSeed:
+    """Outputs of a completed project used to seed a new workflow."""
+
+    source_project_id: UUID
+    smart_detection: Dict[str, Any]
+    event_storming_md: Optional[str]
+    smart_detection_cost_usd: float
+    event_storming_cost_usd: float
+
+
+async def compute_signature(idea: str) -> List[int]:
+    """Compute the MinHash signature of an idea off the event loop.
+
+    Args:
+        idea: Project idea
+
+    Returns:
+        MinHash signature
+
+    """
+    return await asyncio.to_thread(minhash_signature, idea)
+
+
+def build_fingerprint(project: Project, signature: List[int]) -> IdeaFingerprint:
+    """Build the fingerprint row of a project.
+
+    Args:
+        project: Project (with its ID assigned)
+        signature: MinHash signature of the project idea
+
+    Returns:
+        IdeaFingerprint to add to the session
+
+    """
+    return IdeaFingerprint(
+        project_id=project.id,
+        user_id=project.user_id,
+        signature=signature,
+        bands=lsh_bands(signature),
+    )
+
+
+async def _phase_costs(db: AsyncSession, project_id: UUID) -> Dict[str, float]:
+    """Get the LLM cost of the reusable phases of a project."""
+    result = await db.execute(
+        select(LLMLog.phase, func.sum(LLMLog.cost_usd))
+        .where(
+            LLMLog.project_id == project_id,
+            LLMLog.phase.in_([WorkflowPhase.SMART_DETECTION.value, WorkflowPhase.EVENT_STORMING.value]),
+        )
+        .group_by(LLMLog.phase)
+    )
+    return {phase: float(cost or 0) for phase, cost in result.all()}
+
+
+def _carried_over_costs(metadata: Dict[str, Any]) -> Dict[str, float]:
+    """Get the phase costs a project saved by reusing another project's outputs."""
+    return (metadata.get("reuse") or {}).get("phase_costs_usd") or {}
+
+
+async def find_similar_project(
+    db: AsyncSession,
+    idea: str,
+    signature: List[int],
+    user_id: UUID,
+    exclude_project_id: Optional[UUID] = None,
+    threshold: Optional[float] = None,
+) -> Optional[SimilarProject]:
+    """Find the completed project whose idea is closest to a new idea.
+
+    Only the user's own projects are matched unless IDEA_REUSE_ACROSS_USERS
+    is enabled.
+
+    Args:
+        db: Database session
+        idea: New project idea
+        signature: MinHash signature of the idea
+        user_id: Owner of the new project
+        exclude_project_id: Project to leave out (the new project itself)
+        threshold: Minimum similarity (defaults to IDEA_SIMILARITY_THRESHOLD)
+
+    Returns:
+        Closest project at or above the threshold, or None
+
+    """
+    threshold = settings.IDEA_SIMILARITY_THRESHOLD if threshold is None else threshold
+
+    query = (
+        select(IdeaFingerprint.project_id, IdeaFingerprint.signature)
+        .join(Project, Project.id == IdeaFingerprint.project_id)
+        .where(
+            IdeaFingerprint.bands.overlap(lsh_bands(signature)),
+            Project.status == WorkflowStatus.COMPLETED.value,
+            Project.__table__.c.metadata.has_key("smart_detection"),
+        )
+    )
+    if not settings.IDEA_REUSE_ACROSS_USERS:
+        query = query.where(IdeaFingerprint.user_id == user_id)
+    if exclude_project_id:
+        query = query.where(IdeaFingerprint.project_id != exclude_project_id)
+
+    candidate_ids = shortlist(
+        signature, (await db.execute(query)).all(), threshold - ESTIMATE_TOLERANCE, SHORTLIST_SIZE
+    )
+    if not candidate_ids:
+        return None
+
+    candidates = (await db.execute(select(Project.id, Project.idea).where(Project.id.in_(candidate_ids)))).all()
+    if not candidates:
+        return None
+
+    idea_shingles = shingles(idea)
+    similarity, project_id = max(
+        (jaccard(idea_shingles, shingles(candidate_idea)), candidate_id)
+        for candidate_id, candidate_idea in candidates
+    )
+    if similarity < threshold:
+        return None
+
+    seed = await load_reuse_seed(db, project_id)
+    if seed is None:
+        return None
+    return SimilarProject(
+        project_id=project_id,
+        similarity=similarity,
+        reusable_cost_usd=seed.smart_detection_cost_usd
+        + (seed.event_storming_cost_usd if seed.event_storming_md else 0.0),
+    )
+
+
+async def load_reuse_seed(db: AsyncSession, project_id: UUID) -> Optional[ReuseSeed]:
+    """Load the reusable outputs of a completed project.
+
+    Args:
+        db: Database session
+        project_id: Source project UUID
+
+    Returns:
+        ReuseSeed, or None if the project is gone or has no Smart Detection output
+
+    """
+    metadata = (
+        await db.execute(select(Project.__table__.c.metadata).where(Project.id == project_id))
+    ).scalar_one_or_none()
+    if not metadata or not metadata.get("smart_detection"):
+        return None
+
+    event_storming_md = (
+        await db.execute(
+            select(Document.content_md).where(
+                Document.project_id == project_id,
+                Document.type == DocumentType.EVENT_STORMING.value,
+            )
+        )
+    ).scalar_one_or_none()
+
+    # A source that reused outputs itself paid nothing for them; count what it saved
+    costs = {**_carried_over_costs(metadata), **await _phase_costs(db, project_id)}
+    return ReuseSeed(
+        source_project_id=project_id,
+        smart_detection=metadata["smart_detection"],
+        event_storming_md=event_storming_md,
+        smart_detection_cost_usd=costs.get(WorkflowPhase.SMART_DETECTION.value, 0.0),
+        event_storming_cost_usd=costs.get(WorkflowPhase.EVENT_STORMING.value, 0.0),
+    )
+
+
+async def backfill_idea_fingerprints(db: AsyncSession, batch_size: int = 500) -> int:
+    """Fingerprint the ideas of projects created before fingerprints were stored.
+
+    Args:
+        db: Database session
+        batch_size: Projects fingerprinted per transaction
+
+    Returns:
+        Number of fingerprinted projects
+
+    """
+    indexed = 0
+    while True:
+        result = await db.execute(
+            select(Project)
+            .outerjoin(IdeaFingerprint, IdeaFingerprint.project_id == Project.id)
+            .where(IdeaFingerprint.project_id.is_(None))
+            .limit(batch_size)
+        )
+        projects = result.scalars().all()
+        for project in projects:
+            db.add(build_fingerprint(project, await compute_signature(project.idea)))
+        await db.commit()
+        indexed += len(projects)
+        if len(projects) < batch_size:
+            return indexed
@@ -1,12 +1,16 @@
-"""LangFuse service for observability and cost tracking."""
-from typing import Any, Dict, Optional
-from uuid import UUID
+"""LangFuse service for observability and cost tracking.
 
-from langfuse import Langfuse
-from langfuse.model import CreateTrace
+The langfuse package is imported on first use, so deployments without
+LangFuse configured never pay for importing it.
+"""
+from typing import TYPE_CHECKING, Any, Dict, Optional
+from uuid import UUID
 
 from app.config import settings
 
+if TYPE_CHECKING:
+    from langfuse import Langfuse
+
 
 class LangFuseTracker:
     """LangFuse tracker for a single project workflow."""
@@ -132,13 +136,15 @@ class LangFuseTracker:
         )
 
 
-def get_langfuse_client() -> Langfuse:
+def get_langfuse_client() -> "Langfuse":
     """Get LangFuse client singleton.
 
     Returns:
         LangFuse client instance
 
     """
+    from langfuse import Langfuse
+
     return Langfuse(
         public_key=settings.LANGFUSE_PUBLIC_KEY,
         secret_key=settings.LANGFUSE_SECRET_KEY,
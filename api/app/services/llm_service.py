@@ -1,11 +1,13 @@
 """OpenRouter LLM service for making API calls."""
+import asyncio
 import json
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import httpx
 
 from app.config import settings
+from app.services.model_catalog import ModelCatalog, model_catalog
 
 
 class LLMResponse:
@@ -19,6 +21,7 @@ class LLMResponse:
         cost_usd: float,
         latency_ms: int,
         raw_response: Dict[str, Any],
+        timings: Optional[Dict[str, Tuple[float, float]]] = None,
     ):
         self.content = content
         self.model = model
@@ -26,24 +29,89 @@ class LLMResponse:
         self.cost_usd = cost_usd
         self.latency_ms = latency_ms
         self.raw_response = raw_response
+        # Request stages as (start_ms, end_ms) offsets from the start of the call:
+        # {"connect": ..., "ttfb": ..., "body": ...}
+        self.timings = timings or {}
+
+
+class RequestTimer:
+    """Collects connect/TTFB/body timings from httpx trace events."""
+
+    def __init__(self) -> None:
+        self.origin = time.perf_counter()
+        self._events: Dict[str, float] = {}
+
+    def elapsed_ms(self) -> float:
+        """Milliseconds since the timer was created."""
+        return (time.perf_counter() - self.origin) * 1000
+
+    async def trace(self, event_name: str, info: Dict[str, Any]) -> None:
+        """httpx ``trace`` extension callback."""
+        self._events.setdefault(event_name, self.elapsed_ms())
+
+    def mark(self, event_name: str) -> None:
+        """Record a custom event (e.g., first streamed token)."""
+        self._events.setdefault(event_name, self.elapsed_ms())
+
+    def timings(self) -> Dict[str, Tuple[float, float]]:
+        """Build request stage timings from the recorded events."""
+        events = self._events
+        result: Dict[str, Tuple[float, float]] = {}
+
+        connect_start = events.get("connection.connect_tcp.started")
+        connect_end = events.get("connection.start_tls.complete") or events.get(
+            "connection.connect_tcp.complete"
+        )
+        if connect_start is not None and connect_end is not None:
+            result["connect"] = (connect_start, connect_end)
+
+        request_start = events.get("http11.send_request_headers.started") or events.get(
+            "http2.send_request_headers.started"
+        )
+        first_byte = events.get("first_token") or events.get(
+            "http11.receive_response_headers.complete"
+        ) or events.get("http2.receive_response_headers.complete")
+        if request_start is not None and first_byte is not None:
+            result["ttfb"] = (request_start, first_byte)
+
+        body_end = events.get("stream_complete") or events.get(
+            "http11.receive_response_body.complete"
+        ) or events.get("http2.receive_response_body.complete")
+        if first_byte is not None and body_end is not None:
+            result["body"] = (first_byte, body_end)
+
+        return result
 
 
 class LLMService:
     """Service for interacting with OpenRouter API."""
 
-    # Model pricing per 1M tokens (approximate, update as needed)
-    # Format: {"model_name": {"input": price, "output": price}}
-    MODEL_PRICING = {
-        "openai/gpt-4o-mini": {"input": 0.150, "output": 0.600},
-        "openai/gpt-4o": {"input": 2.50, "output": 10.00},
-        "anthropic/claude-3.5-sonnet": {"input": 3.00, "output": 15.00},
-        "anthropic/claude-3-haiku": {"input": 0.25, "output": 1.25},
-    }
+    # Per-operation HTTP timeout (connect, read, write)
+    DEFAULT_TIMEOUT_SECONDS = 120.0
 
-    def __init__(self):
+    def __init__(self, catalog: ModelCatalog = model_catalog):
         self.base_url = settings.OPENROUTER_BASE_URL
         self.api_key = settings.OPENROUTER_API_KEY
-        self.client = httpx.AsyncClient(timeout=120.0)
+        # Pricing and capabilities of the models
+        self.catalog = catalog
+        # HTTP client, opened at startup (or on first use) rather than at import
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """HTTP client for OpenRouter, opened on first use."""
+        if self._client is None:
+            self.open()
+        return self._client
+
+    @client.setter
+    def client(self, client: httpx.AsyncClient) -> None:
+        self._client = client
+
+    def open(self) -> None:
+        """Open the HTTP client (called from the application lifespan)."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(timeout=self.DEFAULT_TIMEOUT_SECONDS)
 
     async def call(
         self,
@@ -51,8 +119,9 @@ class LLMService:
         prompt: str,
         temperature: float = 0.7,
         max_tokens: int = 4000,
-        response_format: Optional[Dict[str, str]] = None,
+        response_format: Optional[Dict[str, Any]] = None,
         system_message: Optional[str] = None,
+        timeout: Optional[float] = None,
     ) -> LLMResponse:
         """Make an LLM API call via OpenRouter.
 
@@ -63,44 +132,33 @@ class LLMService:
             max_tokens: Maximum tokens to generate
             response_format: Optional response format (e.g., {"type": "json_object"})
             system_message: Optional system message
+            timeout: Optional time limit for the whole request in seconds (e.g., the
+                remaining workflow deadline); the HTTP request is aborted when it expires
 
         Returns:
             LLMResponse with content, usage, and cost
 
         Raises:
             httpx.HTTPError: If API call fails
+            TimeoutError: If the time limit expires
 
         """
         start_time = time.time()
+        timer = RequestTimer()
 
-        # Build messages
-        messages = []
-        if system_message:
-            messages.append({"role": "system", "content": system_message})
-        messages.append({"role": "user", "content": prompt})
-
-        # Build request payload
-        payload = {
-            "model": model,
-            "messages": messages,
-            "temperature": temperature,
-            "max_tokens": max_tokens,
-        }
-
-        # Add response format if specified (for JSON mode)
-        if response_format:
-            payload["response_format"] = response_format
+        payload = self._build_payload(
+            model, prompt, temperature, max_tokens, response_format, system_message
+        )
 
         # Make API call
-        response = await self.client.post(
-            f"{self.base_url}/chat/completions",
-            json=payload,
-            headers={
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json",
-                "HTTP-Referer": settings.PROJECT_NAME,
-            },
-        )
+        async with asyncio.timeout(timeout):
+            response = await self.client.post(
+                f"{self.base_url}/chat/completions",
+                json=payload,
+                headers=self._build_headers(),
+                timeout=self._request_timeout(timeout),
+                extensions={"trace": timer.trace},
+            )
         response.raise_for_status()
 
         # Parse response
@@ -127,7 +185,242 @@ class LLMService:
             cost_usd=cost_usd,
             latency_ms=latency_ms,
             raw_response=data,
+            timings=timer.timings(),
+        )
+
+    def _request_timeout(self, timeout: Optional[float]) -> httpx.Timeout:
+        """Get the HTTP timeout of a request, shortened to fit its time limit."""
+        if timeout is None:
+            return httpx.Timeout(self.DEFAULT_TIMEOUT_SECONDS)
+        return httpx.Timeout(max(min(timeout, self.DEFAULT_TIMEOUT_SECONDS), 0.001))
+
+    async def call_streaming(
+        self,
+        model: str,
+        prompt: str,
+        on_delta: Callable[[str], None],
+        temperature: float = 0.7,
+        max_tokens: int = 4000,
+        response_format: Optional[Dict[str, Any]] = None,
+        system_message: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> LLMResponse:
+        """Make a streaming LLM API call via OpenRouter.
+
+        Each content delta is passed to ``on_delta`` as it arrives. If the callback
+        raises, the HTTP stream is closed immediately and the exception propagates,
+        so no further tokens are generated.
+
+        Args:
+            model: Model identifier (e.g., "openai/gpt-4o-mini")
+            prompt: User prompt
+            on_delta: Callback invoked with each content delta
+            temperature: Sampling temperature (0.0-1.0)
+            max_tokens: Maximum tokens to generate
+            response_format: Optional response format (e.g., {"type": "json_object"})
+            system_message: Optional system message
+            timeout: Optional time limit for the whole request in seconds (e.g., the
+                remaining workflow deadline); the HTTP stream is closed when it expires
+
+        Returns:
+            LLMResponse with the full content, usage, and cost
+
+        Raises:
+            httpx.HTTPError: If API call fails
+            TimeoutError: If the time limit expires
+
+        """
+        start_time = time.time()
+        timer = RequestTimer()
+
+        payload = self._build_payload(
+            model, prompt, temperature, max_tokens, response_format, system_message
         )
+        payload["stream"] = True
+        payload["stream_options"] = {"include_usage": True}
+
+        chunks: List[str] = []
+        usage: Optional[Dict[str, int]] = None
+        last_event: Dict[str, Any] = {}
+
+        async with asyncio.timeout(timeout):
+            async with self.client.stream(
+                "POST",
+                f"{self.base_url}/chat/completions",
+                json=payload,
+                headers=self._build_headers(),
+                timeout=self._request_timeout(timeout),
+                extensions={"trace": timer.trace},
+            ) as response:
+                response.raise_for_status()
+
+                async for line in response.aiter_lines():
+                    # Server-sent events: skip keep-alive comments and blank lines
+                    if not line.startswith("data:"):
+                        continue
+                    data = line[len("data:"):].strip()
+                    if data == "[DONE]":
+                        break
+
+                    event = json.loads(data)
+                    last_event = event
+                    if event.get("usage"):
+                        usage = {
+                            "prompt_tokens": event["usage"]["prompt_tokens"],
+                            "completion_tokens": event["usage"]["completion_tokens"],
+                            "total_tokens": event["usage"]["total_tokens"],
+                        }
+
+                    for choice in event.get("choices", []):
+                        delta = (choice.get("delta") or {}).get("content")
+                        if delta:
+                            timer.mark("first_token")
+                            chunks.append(delta)
+                            on_delta(delta)
+
+        timer.mark("stream_complete")
+
+        latency_ms = int((time.time() - start_time) * 1000)
+        content = "".join(chunks)
+
+        # Fall back to an estimate if the provider did not report usage
+        if usage is None:
+            usage = self.estimate_usage(prompt, content, system_message)
+
+        return LLMResponse(
+            content=content,
+            model=model,
+            usage=usage,
+            cost_usd=self._calculate_cost(model, usage),
+            latency_ms=latency_ms,
+            raw_response=last_event,
+            timings=timer.timings(),
+        )
+
+    def _build_payload(
+        self,
+        model: str,
+        prompt: str,
+        temperature: float,
+        max_tokens: int,
+        response_format: Optional[Dict[str, Any]],
+        system_message: Optional[str],
+    ) -> Dict[str, Any]:
+        """Build chat completions request payload."""
+        # Build messages
+        messages = []
+        if system_message:
+            messages.append({"role": "system", "content": system_message})
+        messages.append({"role": "user", "content": prompt})
+
+        # Build request payload
+        payload: Dict[str, Any] = {
+            "model": model,
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+        }
+
+        # Add response format if specified (for JSON mode)
+        if response_format:
+            payload["response_format"] = response_format
+
+        return payload
+
+    def _build_headers(self) -> Dict[str, str]:
+        """Build OpenRouter request headers."""
+        return {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+            "HTTP-Referer": settings.PROJECT_NAME,
+        }
+
+    def supports_json_schema(self, model: str) -> bool:
+        """Check whether a model supports JSON schema structured outputs.
+
+        Args:
+            model: Model identifier
+
+        Returns:
+            True if the JSON schema can be sent as response_format
+
+        """
+        spec = self.catalog.get(model)
+        return spec is not None and spec.json_schema
+
+    def supports_json_mode(self, model: str) -> bool:
+        """Check whether a model supports plain JSON mode.
+
+        Args:
+            model: Model identifier
+
+        Returns:
+            True if {"type": "json_object"} can be sent as response_format
+
+        """
+        spec = self.catalog.get(model)
+        return spec is not None and spec.json_mode
+
+    @staticmethod
+    def estimate_tokens(text: str) -> int:
+        """Roughly estimate the token count of a text (~4 characters per token).
+
+        Args:
+            text: Text to estimate
+
+        Returns:
+            Estimated token count
+
+        """
+        return (len(text) + 3) // 4
+
+    def estimate_usage(
+        self, prompt: str, completion: str, system_message: Optional[str] = None
+    ) -> Dict[str, int]:
+        """Estimate token usage when the provider did not report it.
+
+        Args:
+            prompt: User prompt
+            completion: Generated (possibly partial) completion
+            system_message: Optional system message
+
+        Returns:
+            Usage dict in the same format as the API reports
+
+        """
+        prompt_tokens = self.estimate_tokens(prompt) + self.estimate_tokens(system_message or "")
+        completion_tokens = self.estimate_tokens(completion)
+        return {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        }
+
+    def estimate_cost(
+        self, model: str, prompt: str, max_tokens: int, system_message: Optional[str] = None
+    ) -> float:
+        """Estimate the cost of a call before it is made (pre-flight).
+
+        The completion is assumed to use all of ``max_tokens``, so the
+        estimate is an upper bound for the output part.
+
+        Args:
+            model: Model identifier
+            prompt: User prompt
+            max_tokens: Maximum tokens to generate
+            system_message: Optional system message
+
+        Returns:
+            Estimated cost in USD
+
+        """
+        prompt_tokens = self.estimate_tokens(prompt) + self.estimate_tokens(system_message or "")
+        usage = {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": max_tokens,
+            "total_tokens": prompt_tokens + max_tokens,
+        }
+        return self._calculate_cost(model, usage)
 
     def _calculate_cost(self, model: str, usage: Dict[str, int]) -> float:
         """Calculate cost in USD based on token usage.
@@ -140,20 +433,20 @@ class LLMService:
             Cost in USD
 
         """
-        # Get pricing for model (default to GPT-4o pricing if unknown)
-        pricing = self.MODEL_PRICING.get(
-            model, {"input": 2.50, "output": 10.00}  # Default to GPT-4o pricing
-        )
+        # Get pricing for model (unknown models are priced as the most expensive one)
+        pricing = self.catalog.pricing(model)
 
         # Calculate cost (pricing is per 1M tokens)
-        input_cost = (usage["prompt_tokens"] / 1_000_000) * pricing["input"]
-        output_cost = (usage["completion_tokens"] / 1_000_000) * pricing["output"]
+        input_cost = (usage["prompt_tokens"] / 1_000_000) * pricing.input_price
+        output_cost = (usage["completion_tokens"] / 1_000_000) * pricing.output_price
 
         return round(input_cost + output_cost, 6)
 
     async def close(self):
-        """Close the HTTP client."""
-        await self.client.aclose()
+        """Close the HTTP client (it is reopened on next use)."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
 
 # Global instance
@@ -0,0 +1,138 @@
+"""Streaming exports of LLM logs and workflow states for admin audits.
+
+Rows are read through ``AsyncSession.stream()`` (a server-side cursor) in
+fixed-size partitions and serialized partition by partition, so exporting
+millions of rows uses constant memory.
+"""
+from datetime import datetime
+from typing import AsyncIterator, Callable, List, Optional
+from uuid import UUID
+
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import LLMLog, WorkflowState
+from app.db.rows import rows_to_csv, rows_to_ndjson
+
+# Rows fetched from the cursor per round trip
+EXPORT_BATCH_SIZE = 1000
+
+LOG_EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+llm_logs = LLMLog.__table__
+workflow_states = WorkflowState.__table__
+
+# Large JSON payloads are only exported on request
+WORKFLOW_STATE_DATA_COLUMNS = ("input_data", "output_data")
+
+
+def llm_log_query(
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    model: Optional[str] = None,
+    phase: Optional[str] = None,
+    project_id: Optional[UUID] = None,
+) -> Select:
+    """Build the LLM log export query.
+
+    Args:
+        start: Only rows created at or after this time
+        end: Only rows created before this time
+        model: Only rows for this model
+        phase: Only rows for this phase
+        project_id: Only rows for this project
+
+    Returns:
+        Select ordered by creation time
+
+    """
+    query = select(llm_logs)
+    if start:
+        query = query.where(llm_logs.c.created_at >= start)
+    if end:
+        query = query.where(llm_logs.c.created_at < end)
+    if model:
+        query = query.where(llm_logs.c.model == model)
+    if phase:
+        query = query.where(llm_logs.c.phase == phase)
+    if project_id:
+        query = query.where(llm_logs.c.project_id == project_id)
+    return query.order_by(llm_logs.c.created_at, llm_logs.c.id)
+
+
+def workflow_state_query(
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    phase: Optional[str] = None,
+    status: Optional[str] = None,
+    project_id: Optional[UUID] = None,
+    include_data: bool = False,
+) -> Select:
+    """Build the workflow state export query.
+
+    Args:
+        start: Only rows created at or after this time
+        end: Only rows created before this time
+        phase: Only rows for this phase
+        status: Only rows with this status
+        project_id: Only rows for this project
+        include_data: Whether to include the input/output JSON payloads
+
+    Returns:
+        Select ordered by creation time
+
+    """
+    columns = [
+        column
+        for column in workflow_states.columns
+        if include_data or column.name not in WORKFLOW_STATE_DATA_COLUMNS
+    ]
+    query = select(*columns)
+    if start:
+        query = query.where(workflow_states.c.created_at >= start)
+    if end:
+        query = query.where(workflow_states.c.created_at < end)
+    if phase:
+        query = query.where(workflow_states.c.phase == phase)
+    if status:
+        query = query.where(workflow_states.c.status == status)
+    if project_id:
+        query = query.where(workflow_states.c.project_id == project_id)
+    return query.order_by(workflow_states.c.created_at, workflow_states.c.id)
+
+
+async def stream_rows(
+    session_factory: Callable[[], AsyncSession],
+    query: Select,
+    export_format: str,
+    batch_size: int = EXPORT_BATCH_SIZE,
+) -> AsyncIterator[str]:
+    """Stream query results as NDJSON or CSV chunks.
+
+    Uses its own session, since the request session is closed once the
+    response starts streaming.
+
+    Args:
+        session_factory: Factory creating a database session
+        query: Core select to export
+        export_format: "ndjson" or "csv"
+        batch_size: Rows per cursor fetch (and per yielded chunk)
+
+    Yields:
+        Serialized chunks of at most batch_size rows
+
+    """
+    columns: List[str] = [column.name for column in query.selected_columns]
+    if export_format == "csv":
+        yield rows_to_csv([], columns, include_header=True)
+
+    async with session_factory() as db:
+        result = await db.stream(query.execution_options(yield_per=batch_size))
+        async for partition in result.mappings().partitions(batch_size):
+            if export_format == "csv":
+                yield rows_to_csv(partition, columns)
+            else:
+                yield rows_to_ndjson(partition)
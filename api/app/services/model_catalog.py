@@ -0,0 +1,250 @@
+"""Model catalog: pricing, capabilities and per-phase routing loaded from a file.
+
+The catalog is a JSON (or, with PyYAML installed, YAML) file validated at
+load time. It is re-read when the file changes, so models can be repriced or
+phases moved to other models without a restart; a file that fails
+validation is rejected and the previous catalog stays active.
+"""
+import json
+import logging
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional, Set
+
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, model_validator
+
+from app.config import settings
+from app.workflow.state_machine import WorkflowPhase
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CATALOG_PATH = Path(__file__).parent.parent / "model_catalog.json"
+
+# Routing role used when a phase does not name a more specific one
+DEFAULT_ROLE = "default"
+
+
+class ModelCatalogError(ValueError):
+    """Catalog file is missing, unreadable or invalid."""
+
+
+class ModelSpec(BaseModel):
+    """Pricing and capabilities of a model."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    input_price: float = Field(..., ge=0, description="USD per 1M prompt tokens")
+    output_price: float = Field(..., ge=0, description="USD per 1M completion tokens")
+    context_window: int = Field(..., gt=0, description="Maximum prompt plus completion tokens")
+    json_schema: bool = Field(False, description="Accepts a JSON schema as response_format")
+    json_mode: bool = Field(True, description="Accepts {\"type\": \"json_object\"} as response_format")
+
+
+class CatalogDefinition(BaseModel):
+    """Contents of a catalog file."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    models: Dict[str, ModelSpec] = Field(..., min_length=1)
+    # Phase name -> role -> model; every phase needs a "default" role
+    routing: Dict[str, Dict[str, str]]
+
+    @model_validator(mode="after")
+    def validate_routing(self) -> "CatalogDefinition":
+        """Check that every phase is routed, and only to known models."""
+        phases = {phase.value for phase in WorkflowPhase}
+        unknown_phases = set(self.routing) - phases
+        if unknown_phases:
+            raise ValueError(f"Unknown phases in routing: {', '.join(sorted(unknown_phases))}")
+
+        for phase in sorted(phases):
+            roles = self.routing.get(phase, {})
+            if DEFAULT_ROLE not in roles:
+                raise ValueError(f"Phase {phase} has no '{DEFAULT_ROLE}' model")
+            for role, model in roles.items():
+                if model not in self.models:
+                    raise ValueError(f"Phase {phase} routes '{role}' to unknown model {model}")
+        return self
+
+
+def parse_catalog(text: str, suffix: str = ".json") -> CatalogDefinition:
+    """Parse and validate catalog file contents.
+
+    Args:
+        text: File contents
+        suffix: File suffix, selecting JSON or YAML
+
+    Returns:
+        CatalogDefinition
+
+    Raises:
+        ModelCatalogError: If the contents cannot be parsed or are invalid
+
+    """
+    try:
+        if suffix in (".yaml", ".yml"):
+            try:
+                import yaml
+            except ImportError as e:
+                raise ModelCatalogError("YAML catalogs require PyYAML (pip install pyyaml)") from e
+            data = yaml.safe_load(text)
+        else:
+            data = json.loads(text)
+    except ModelCatalogError:
+        raise
+    except Exception as e:
+        raise ModelCatalogError(f"Unparseable model catalog: {e}") from e
+
+    try:
+        return CatalogDefinition.model_validate(data)
+    except ValidationError as e:
+        raise ModelCatalogError(f"Invalid model catalog: {e}") from e
+
+
+class ModelCatalog:
+    """Model catalog backed by a file, reloaded when the file changes."""
+
+    def __init__(self, path: Path, check_interval: float = 5.0):
+        """Initialize the catalog (the file is read on first use).
+
+        Args:
+            path: Catalog file path (.json, .yaml or .yml)
+            check_interval: Seconds between file modification checks (0 = never)
+
+        """
+        self.path = path
+        self.check_interval = check_interval
+        self.loaded_at: Optional[datetime] = None
+        self._definition: Optional[CatalogDefinition] = None
+        self._mtime: Optional[float] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+        self._unpriced_warned: Set[str] = set()
+
+    def load(self) -> CatalogDefinition:
+        """Read and validate the catalog file, then make it the active catalog.
+
+        Returns:
+            The loaded catalog
+
+        Raises:
+            ModelCatalogError: If the file is missing or invalid (the active catalog is kept)
+
+        """
+        try:
+            mtime = self.path.stat().st_mtime
+            text = self.path.read_text(encoding="utf-8")
+        except OSError as e:
+            raise ModelCatalogError(f"Cannot read model catalog {self.path}: {e}") from e
+
+        definition = parse_catalog(text, self.path.suffix.lower())
+        with self._lock:
+            self._definition = definition
+            self._mtime = mtime
+            self._checked_at = time.monotonic()
+            self.loaded_at = datetime.utcnow()
+            self._unpriced_warned.clear()
+        logger.info(f"Loaded model catalog {self.path} ({len(definition.models)} models)")
+        return definition
+
+    def _current(self) -> CatalogDefinition:
+        """Get the active catalog, reloading it first if the file changed."""
+        if self._definition is None:
+            return self.load()
+
+        now = time.monotonic()
+        if self.check_interval > 0 and now - self._checked_at >= self.check_interval:
+            self._checked_at = now
+            try:
+                mtime = self.path.stat().st_mtime
+            except OSError:
+                mtime = self._mtime
+            if mtime != self._mtime:
+                try:
+                    self.load()
+                except ModelCatalogError as e:
+                    # Keep serving the previous catalog; do not retry until the file changes again
+                    self._mtime = mtime
+                    logger.error(f"Model catalog reload rejected, keeping previous catalog: {e}")
+        return self._definition
+
+    @property
+    def models(self) -> Dict[str, ModelSpec]:
+        """Known models by identifier."""
+        return self._current().models
+
+    def __contains__(self, model: object) -> bool:
+        return model in self.models
+
+    def get(self, model: str) -> Optional[ModelSpec]:
+        """Get the spec of a model (None if unknown).
+
+        Args:
+            model: Model identifier
+
+        Returns:
+            ModelSpec or None
+
+        """
+        return self.models.get(model)
+
+    def pricing(self, model: str) -> ModelSpec:
+        """Get the spec used to price a model.
+
+        Unknown models are priced as the most expensive known model, so that
+        costs and budgets are never underestimated, with a warning.
+
+        Args:
+            model: Model identifier
+
+        Returns:
+            ModelSpec
+
+        """
+        models = self.models
+        spec = models.get(model)
+        if spec is not None:
+            return spec
+
+        if model not in self._unpriced_warned:
+            self._unpriced_warned.add(model)
+            logger.warning(f"Model {model} is not in the model catalog, pricing it as the most expensive model")
+        return max(models.values(), key=lambda candidate: candidate.input_price + candidate.output_price)
+
+    def model_for(self, phase: str, role: str = DEFAULT_ROLE) -> str:
+        """Get the model routed to a phase.
+
+        Args:
+            phase: Workflow phase name
+            role: Call within the phase (e.g., "approach_detection"); falls back to "default"
+
+        Returns:
+            Model identifier
+
+        """
+        roles = self._current().routing[phase]
+        return roles.get(role, roles[DEFAULT_ROLE])
+
+    def summary(self) -> Dict[str, Any]:
+        """Describe the active catalog.
+
+        Returns:
+            Path, load time, models and routing
+
+        """
+        definition = self._current()
+        return {
+            "path": str(self.path),
+            "loaded_at": self.loaded_at,
+            "models": {model: spec.model_dump() for model, spec in definition.models.items()},
+            "routing": definition.routing,
+        }
+
+
+# Global instance
+model_catalog = ModelCatalog(
+    Path(settings.MODEL_CATALOG_PATH) if settings.MODEL_CATALOG_PATH else DEFAULT_CATALOG_PATH,
+    check_interval=settings.MODEL_CATALOG_CHECK_SECONDS,
+)
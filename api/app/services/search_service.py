@@ -0,0 +1,121 @@
+"""Full-text search across generated documents."""
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import func, select, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.pagination import decode_cursor, encode_cursor
+from app.db.models import Document, Project
+from app.workflow.document_storage import search_config, search_vector_expression
+
+# ts_headline options: up to two fragments around the matches
+HEADLINE_OPTIONS = "MaxFragments=2, MaxWords=30, MinWords=10, StartSel=**, StopSel=**, FragmentDelimiter=\" … \""
+
+
+@dataclass
+class SearchHit:
+    """A single document search result."""
+
+    document_id: UUID
+    project_id: UUID
+    type: str
+    rank: float
+    snippet: str
+    updated_at: datetime
+
+
+async def search_documents(
+    db: AsyncSession,
+    query: str,
+    limit: int = 20,
+    cursor: Optional[str] = None,
+    document_type: Optional[str] = None,
+    user_id: Optional[UUID] = None,
+) -> Tuple[List[SearchHit], Optional[str]]:
+    """Search documents by relevance with keyset pagination.
+
+    Matches use the GIN-indexed ``search_vector``; results are ordered by
+    ``ts_rank_cd`` and paginated on (rank, id), so later pages cost the same
+    as the first. Snippets are only computed for the returned page.
+
+    Args:
+        db: Database session
+        query: Web-style search query (quotes, OR, -exclusion)
+        limit: Page size
+        cursor: Cursor from the previous page
+        document_type: Optional document type filter
+        user_id: Optional filter on the project owner
+
+    Returns:
+        Tuple of (hits, next page cursor or None)
+
+    Raises:
+        ValueError: If the cursor is invalid
+
+    """
+    ts_query = func.websearch_to_tsquery(search_config(), query)
+    rank = func.ts_rank_cd(Document.search_vector, ts_query)
+
+    page = select(Document.id, rank.label("rank")).where(Document.search_vector.op("@@")(ts_query))
+    if document_type:
+        page = page.where(Document.type == document_type)
+    if user_id:
+        page = page.where(Document.project_id.in_(select(Project.id).where(Project.user_id == user_id)))
+    if cursor:
+        position = decode_cursor(cursor)
+        try:
+            after = (float(position["rank"]), UUID(position["id"]))
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValueError("Invalid cursor") from e
+        page = page.where(tuple_(rank, Document.id) < after)
+
+    page_ids = page.order_by(rank.desc(), Document.id.desc()).limit(limit + 1).subquery()
+
+    result = await db.execute(
+        select(
+            Document.id,
+            Document.project_id,
+            Document.type,
+            page_ids.c.rank,
+            func.ts_headline(search_config(), Document.content_md, ts_query, HEADLINE_OPTIONS),
+            Document.updated_at,
+        )
+        .join(page_ids, page_ids.c.id == Document.id)
+        .order_by(page_ids.c.rank.desc(), Document.id.desc())
+    )
+    hits = [SearchHit(*row) for row in result.all()]
+
+    next_cursor = None
+    if len(hits) > limit:
+        hits = hits[:limit]
+        next_cursor = encode_cursor({"rank": hits[-1].rank, "id": str(hits[-1].document_id)})
+    return hits, next_cursor
+
+
+async def backfill_search_vectors(db: AsyncSession, batch_size: int = 500) -> int:
+    """Compute the search vector of documents saved before it was maintained.
+
+    Args:
+        db: Database session
+        batch_size: Documents updated per transaction
+
+    Returns:
+        Number of updated documents
+
+    """
+    updated = 0
+    while True:
+        batch = select(Document.id).where(Document.search_vector.is_(None)).limit(batch_size)
+        result = await db.execute(
+            update(Document)
+            .where(Document.id.in_(batch.scalar_subquery()))
+            .values(search_vector=search_vector_expression(Document.content_md))
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+        updated += result.rowcount
+        if result.rowcount < batch_size:
+            return updated
@@ -0,0 +1,112 @@
+"""Per-workflow cost budgets with automatic downgrades to cheaper models."""
+from dataclasses import dataclass
+from typing import Any, Callable, Collection, List, Mapping, Optional
+
+from app.config import settings
+
+
+class BudgetExceededError(Exception):
+    """The workflow budget is already spent."""
+
+    def __init__(self, spent_usd: float, budget_usd: float):
+        super().__init__(f"Budget of ${budget_usd:.4f} exhausted (${spent_usd:.4f} spent)")
+        self.spent_usd = spent_usd
+        self.budget_usd = budget_usd
+
+
+@dataclass
+class ModelChoice:
+    """Model selected for an LLM call under a budget."""
+
+    model: str
+    requested_model: str
+    projected_cost_usd: float  # Running spend plus the estimate of this call
+
+    @property
+    def downgraded(self) -> bool:
+        """Whether a cheaper model than requested was selected."""
+        return self.model != self.requested_model
+
+
+def resolve_budget(metadata: Mapping[str, Any], user_id: str) -> Optional[float]:
+    """Get the budget of a workflow run.
+
+    A project's own ``budget_usd`` wins over its owner's tier budget, which
+    wins over ``WORKFLOW_BUDGET_USD``.
+
+    Args:
+        metadata: Project metadata
+        user_id: Owner user ID
+
+    Returns:
+        Budget in USD, or None if unlimited
+
+    """
+    if metadata.get("budget_usd"):
+        return float(metadata["budget_usd"])
+
+    tier = settings.WORKFLOW_TENANT_TIERS.get(user_id, settings.WORKFLOW_DEFAULT_TIER)
+    budget = settings.WORKFLOW_TIER_BUDGETS_USD.get(tier, settings.WORKFLOW_BUDGET_USD)
+    return budget if budget > 0 else None
+
+
+def downgrade_chain(model: str, downgrades: Mapping[str, str], known_models: Collection[str]) -> List[str]:
+    """List a model followed by its successively cheaper replacements.
+
+    Replacements that are not known models end the chain, as do cycles.
+
+    Args:
+        model: Requested model
+        downgrades: Cheaper replacement per model
+        known_models: Models in the model catalog
+
+    Returns:
+        Candidate models, requested model first
+
+    """
+    chain = [model]
+    while chain[-1] in downgrades:
+        candidate = downgrades[chain[-1]]
+        if candidate in chain or candidate not in known_models:
+            break
+        chain.append(candidate)
+    return chain
+
+
+def choose_model(
+    model: str,
+    spent_usd: float,
+    budget_usd: float,
+    estimate: Callable[[str], float],
+    downgrades: Mapping[str, str],
+    known_models: Collection[str],
+) -> ModelChoice:
+    """Pick the first model of the downgrade chain whose call fits the budget.
+
+    If even the cheapest candidate does not fit, it is used anyway: the
+    call is only refused once the budget is completely spent.
+
+    Args:
+        model: Requested model
+        spent_usd: Spend of the workflow so far
+        budget_usd: Workflow budget
+        estimate: Pre-flight cost estimate of the call for a model
+        downgrades: Cheaper replacement per model
+        known_models: Models in the model catalog
+
+    Returns:
+        ModelChoice
+
+    Raises:
+        BudgetExceededError: If the budget is already spent
+
+    """
+    if spent_usd >= budget_usd:
+        raise BudgetExceededError(spent_usd, budget_usd)
+
+    projected = spent_usd
+    for candidate in downgrade_chain(model, downgrades, known_models):
+        projected = spent_usd + estimate(candidate)
+        if projected <= budget_usd:
+            break
+    return ModelChoice(model=candidate, requested_model=model, projected_cost_usd=projected)
@@ -0,0 +1,93 @@
+"""Cooperative cancellation of running workflows."""
+import asyncio
+import logging
+from typing import Dict, Optional
+from uuid import UUID
+
+logger = logging.getLogger(__name__)
+
+
+class WorkflowCancelledError(Exception):
+    """The workflow was cancelled (by a user, another worker or its deadline)."""
+
+    def __init__(self, reason: str):
+        super().__init__(reason)
+        self.reason = reason
+
+
+class CancellationRegistry:
+    """Tasks of the workflows running (or queued) in this process, by project ID.
+
+    Cancelling a workflow cancels its task: the ``CancelledError`` unwinds
+    through the phase handler and the HTTP client, which closes the in-flight
+    LLM request, and the engine marks the project CANCELLED.
+    """
+
+    def __init__(self) -> None:
+        self._tasks: Dict[UUID, asyncio.Task] = {}
+        self._reasons: Dict[UUID, str] = {}
+
+    def register(self, project_id: UUID, task: Optional[asyncio.Task] = None) -> None:
+        """Register the task executing a workflow.
+
+        Args:
+            project_id: Project UUID
+            task: Task to cancel (defaults to the current task)
+
+        Raises:
+            RuntimeError: If no task is given and none is running
+
+        """
+        task = task or asyncio.current_task()
+        if task is None:
+            raise RuntimeError(f"No task to register for the workflow of project {project_id}")
+        self._tasks[project_id] = task
+        self._reasons.pop(project_id, None)
+
+    def unregister(self, project_id: UUID) -> None:
+        """Forget a finished workflow.
+
+        Args:
+            project_id: Project UUID
+
+        """
+        self._tasks.pop(project_id, None)
+        self._reasons.pop(project_id, None)
+
+    def cancel(self, project_id: UUID, reason: str) -> bool:
+        """Request cancellation of a workflow running in this process.
+
+        Args:
+            project_id: Project UUID
+            reason: Reason recorded on the project
+
+        Returns:
+            True if the workflow's task was found and cancelled
+
+        """
+        task = self._tasks.get(project_id)
+        if task is None or task.done():
+            return False
+        self._reasons[project_id] = reason
+        task.cancel(reason)
+        logger.info(f"Cancellation requested for workflow of project {project_id}: {reason}")
+        return True
+
+    def cancel_reason(self, project_id: UUID) -> Optional[str]:
+        """Get the reason of a requested cancellation (None if not requested).
+
+        Args:
+            project_id: Project UUID
+
+        Returns:
+            Reason or None
+
+        """
+        return self._reasons.get(project_id)
+
+    def __contains__(self, project_id: UUID) -> bool:
+        return project_id in self._tasks
+
+
+# Global registry instance
+workflow_registry = CancellationRegistry()
@@ -0,0 +1,120 @@
+"""Line-based delta encoding for document version storage.
+
+A delta is a list of operations that rebuild the target text from a base:
+``["=", start, end]`` copies base lines ``start:end`` and ``["+", lines]``
+inserts new lines. Stored payloads are zlib-compressed JSON, so the size of a
+stored version grows with the size of the change rather than the document.
+"""
+import difflib
+import hashlib
+import json
+import zlib
+from typing import Any, Dict, List
+
+Delta = List[List[Any]]
+
+
+def content_hash(content: str) -> str:
+    """Compute the content address (SHA-256 hex digest) of a document.
+
+    Args:
+        content: Document text
+
+    Returns:
+        Hex digest
+
+    """
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def compute_delta(base: str, target: str) -> Delta:
+    """Compute the operations that rebuild ``target`` from ``base``.
+
+    Args:
+        base: Base text
+        target: Target text
+
+    Returns:
+        Delta operations
+
+    """
+    base_lines = base.splitlines(keepends=True)
+    target_lines = target.splitlines(keepends=True)
+
+    ops: Delta = []
+    matcher = difflib.SequenceMatcher(None, base_lines, target_lines, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            ops.append(["=", i1, i2])
+        elif j2 > j1:  # replace / insert
+            ops.append(["+", target_lines[j1:j2]])
+    return ops
+
+
+def apply_delta(base: str, ops: Delta) -> str:
+    """Rebuild a text from its base and delta operations.
+
+    Args:
+        base: Base text
+        ops: Delta operations
+
+    Returns:
+        Rebuilt text
+
+    Raises:
+        ValueError: If an operation is malformed
+
+    """
+    base_lines = base.splitlines(keepends=True)
+    parts: List[str] = []
+    for op in ops:
+        if op[0] == "=":
+            parts.extend(base_lines[op[1] : op[2]])
+        elif op[0] == "+":
+            parts.extend(op[1])
+        else:
+            raise ValueError(f"Unknown delta operation: {op[0]!r}")
+    return "".join(parts)
+
+
+def pack(data: Any) -> bytes:
+    """Serialize and compress a payload (full text or delta) for storage."""
+    return zlib.compress(json.dumps(data, separators=(",", ":")).encode("utf-8"), 6)
+
+
+def unpack(data: bytes) -> Any:
+    """Decompress and deserialize a stored payload."""
+    return json.loads(zlib.decompress(data).decode("utf-8"))
+
+
+def diff_documents(old: str, new: str, old_label: str, new_label: str) -> Dict[str, Any]:
+    """Compute a unified diff and line statistics between two texts.
+
+    Args:
+        old: Old text
+        new: New text
+        old_label: Label of the old text in the diff header
+        new_label: Label of the new text in the diff header
+
+    Returns:
+        Dict with added_lines, removed_lines and unified_diff
+
+    """
+    lines = list(
+        difflib.unified_diff(
+            old.splitlines(keepends=True),
+            new.splitlines(keepends=True),
+            fromfile=old_label,
+            tofile=new_label,
+        )
+    )
+    added = sum(1 for line in lines if line.startswith("+") and not line.startswith("+++"))
+    removed = sum(1 for line in lines if line.startswith("-") and not line.startswith("---"))
+    return {
+        "added_lines": added,
+        "removed_lines": removed,
+        "unified_diff": "".join(
+            line if line.endswith("\n") else line + "\n\\ No newline at end of file\n"
+            for line in lines
+        ),
+    }
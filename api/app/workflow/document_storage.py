@@ -1,14 +1,47 @@
 """Document storage utilities."""
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import ColumnElement, and_, cast, func, select
+from sqlalchemy.dialects.postgresql import REGCONFIG, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.models import Document
+from app.db.models import Document, DocumentBlob, DocumentVersion, Project
+from app.db.repository import ProjectNotFoundError
+from app.db.routing import touch_projects
+from app.workflow.deltas import apply_delta, compute_delta, content_hash, pack, unpack
+from app.workflow.markdown import build_section_index
+from app.workflow.plan_storage import save_plan
 from app.workflow.state_machine import DocumentType
 
+# Longest chain of deltas before a full snapshot is stored (bounds reconstruction cost)
+MAX_DELTA_CHAIN = 10
+
+BLOB_FULL = "FULL"
+BLOB_DELTA = "DELTA"
+
+# Text search configuration of the documents.search_vector index
+SEARCH_CONFIG = "english"
+
+
+def search_config() -> ColumnElement:
+    """Text search configuration as a SQL expression."""
+    return cast(SEARCH_CONFIG, REGCONFIG)
+
+
+def search_vector_expression(content: Any) -> ColumnElement:
+    """SQL expression computing the full-text search vector of document content.
+
+    Args:
+        content: Content value or column expression
+
+    Returns:
+        ``to_tsvector`` expression
+
+    """
+    return func.to_tsvector(search_config(), content)
+
 
 async def save_document(
     db: AsyncSession,
@@ -16,8 +49,14 @@ async def save_document(
     document_type: DocumentType,
     content_md: str,
     metadata: Optional[Dict] = None,
-) -> Document:
-    """Save a document to the database.
+    alternates: Optional[Sequence[Tuple[str, Dict[str, Any]]]] = None,
+) -> UUID:
+    """Save a document to the database, recording a new version.
+
+    The document is written with a single upsert that also returns the
+    content it replaced. The previous content is kept in the version
+    history, delta-encoded against the content that replaced it. Saving an
+    execution plan also replaces its extracted stages and tasks.
 
     Args:
         db: Database session
@@ -25,40 +64,245 @@ async def save_document(
         document_type: Type of document
         content_md: Markdown content
         metadata: Optional metadata
+        alternates: Optional (content, attributes) pairs of candidate versions
+            that were generated alongside content_md but not selected
 
     Returns:
-        Created Document
+        ID of the saved document
 
     """
-    # Check if document already exists (overwrite if yes)
+    # Section index (byte offsets) for partial retrieval; not part of version attributes
+    document_metadata = {**(metadata or {}), "sections": build_section_index(content_md)}
+
+    documents = Document.__table__
+    # Subqueries see the table as it was before the statement: the replaced content
+    previous = documents.alias("previous")
+    previous_content = (
+        select(previous.c.content_md)
+        .where(previous.c.project_id == project_id, previous.c.type == document_type.value)
+        .scalar_subquery()
+    )
+
+    statement = insert(documents).values(
+        project_id=project_id,
+        type=document_type.value,
+        content_md=content_md,
+        search_vector=search_vector_expression(content_md),
+        metadata=document_metadata,
+        updated_at=datetime.utcnow(),
+    )
+    statement = statement.on_conflict_do_update(
+        constraint="uq_documents_project_type",
+        set_={
+            "content_md": statement.excluded.content_md,
+            "search_vector": statement.excluded.search_vector,
+            "metadata": statement.excluded.metadata,
+            "updated_at": statement.excluded.updated_at,
+        },
+    ).returning(documents.c.id, previous_content.label("previous_content"))
+
+    row = (await db.execute(statement)).one()
+    document_id = row.id
+    # Bulk statements bypass the flush that normally marks the project as written
+    await db.execute(touch_projects([project_id]))
+
+    await _record_versions(db, document_id, content_md, row.previous_content, metadata or {}, alternates or ())
+    if document_type == DocumentType.EXECUTION_PLAN:
+        await save_plan(db, project_id, document_id, content_md)
+    return document_id
+
+
+async def _get_chain_depth(db: AsyncSession, sha256: str) -> Optional[int]:
+    """Get the delta chain depth of a stored blob (None if not stored)."""
     result = await db.execute(
-        select(Document).where(
-            Document.project_id == project_id,
-            Document.type == document_type.value,
+        select(DocumentBlob.chain_depth).where(DocumentBlob.sha256 == sha256)
+    )
+    return result.scalar_one_or_none()
+
+
+async def _store_blob(
+    db: AsyncSession, content: str, base_content: Optional[str] = None
+) -> str:
+    """Store document content as a content-addressed blob.
+
+    Content is stored as a delta against ``base_content`` when that is smaller
+    than a full (compressed) copy and the delta chain is short enough;
+    otherwise a full snapshot is stored. Identical content is stored once.
+
+    Args:
+        db: Database session
+        content: Content to store
+        base_content: Optional content to delta-encode against
+
+    Returns:
+        SHA-256 of the content
+
+    """
+    sha256 = content_hash(content)
+    if await _get_chain_depth(db, sha256) is not None:
+        return sha256
+
+    values: Dict[str, Any] = {
+        "sha256": sha256,
+        "kind": BLOB_FULL,
+        "base_sha256": None,
+        "chain_depth": 0,
+        "data": pack(content),
+        "size_bytes": len(content.encode("utf-8")),
+    }
+
+    if base_content is not None:
+        base_sha256 = content_hash(base_content)
+        base_depth = await _get_chain_depth(db, base_sha256)
+        if base_depth is not None and base_depth < MAX_DELTA_CHAIN:
+            delta = pack(compute_delta(base_content, content))
+            if len(delta) < len(values["data"]):
+                values.update(
+                    kind=BLOB_DELTA,
+                    base_sha256=base_sha256,
+                    chain_depth=base_depth + 1,
+                    data=delta,
+                )
+
+    values["stored_bytes"] = len(values["data"])
+    values["created_at"] = datetime.utcnow()
+
+    # Concurrent writers may store the same content - first one wins
+    await db.execute(insert(DocumentBlob).values(**values).on_conflict_do_nothing())
+    return sha256
+
+
+async def _record_versions(
+    db: AsyncSession,
+    document_id: UUID,
+    content: str,
+    previous_content: Optional[str],
+    metadata: Dict[str, Any],
+    alternates: Sequence[Tuple[str, Dict[str, Any]]],
+) -> None:
+    """Record the new content (and any alternates) in the version history."""
+    result = await db.execute(
+        select(DocumentVersion.version, DocumentVersion.content_sha256)
+        .where(DocumentVersion.document_id == document_id)
+        .order_by(DocumentVersion.version.desc())
+        .limit(1)
+    )
+    latest = result.first()
+    next_version = latest.version + 1 if latest else 1
+
+    if previous_content is not None and latest is None:
+        # Document saved before version history existed - keep its content as version 1
+        db.add(
+            DocumentVersion(
+                document_id=document_id,
+                version=next_version,
+                content_sha256=await _store_blob(db, previous_content),
+                attributes={},
+            )
+        )
+        next_version += 1
+    elif latest and latest.content_sha256 == content_hash(content) and not alternates:
+        return  # Unchanged
+
+    sha256 = await _store_blob(db, content, previous_content)
+
+    # Alternates first, so the highest version is always the current content
+    for alternate_content, attributes in alternates:
+        db.add(
+            DocumentVersion(
+                document_id=document_id,
+                version=next_version,
+                content_sha256=await _store_blob(db, alternate_content, content),
+                attributes={**attributes, "alternate": True},
+            )
+        )
+        next_version += 1
+
+    db.add(
+        DocumentVersion(
+            document_id=document_id,
+            version=next_version,
+            content_sha256=sha256,
+            attributes={key: value for key, value in metadata.items() if key != "alternates"},
         )
     )
-    existing_doc = result.scalar_one_or_none()
 
-    if existing_doc:
-        # Update existing document
-        existing_doc.content_md = content_md
-        existing_doc.metadata = metadata or {}
-        existing_doc.updated_at = datetime.utcnow()
-        await db.commit()
-        await db.refresh(existing_doc)
-        return existing_doc
-    else:
-        # Create new document
-        document = Document(
-            project_id=project_id,
-            type=document_type.value,
-            content_md=content_md,
-            metadata=metadata or {},
+
+async def list_document_versions(
+    db: AsyncSession, document_id: UUID
+) -> List[Tuple[DocumentVersion, DocumentBlob]]:
+    """List the versions of a document with their storage details.
+
+    Args:
+        db: Database session
+        document_id: Document UUID
+
+    Returns:
+        List of (DocumentVersion, DocumentBlob), oldest first
+
+    """
+    result = await db.execute(
+        select(DocumentVersion, DocumentBlob)
+        .join(DocumentBlob, DocumentBlob.sha256 == DocumentVersion.content_sha256)
+        .where(DocumentVersion.document_id == document_id)
+        .order_by(DocumentVersion.version)
+    )
+    return [tuple(row) for row in result.all()]
+
+
+async def get_document_version(
+    db: AsyncSession, document_id: UUID, version: int
+) -> Optional[DocumentVersion]:
+    """Get a single document version.
+
+    Args:
+        db: Database session
+        document_id: Document UUID
+        version: Version number
+
+    Returns:
+        DocumentVersion or None if not found
+
+    """
+    result = await db.execute(
+        select(DocumentVersion).where(
+            DocumentVersion.document_id == document_id,
+            DocumentVersion.version == version,
         )
-        db.add(document)
-        await db.commit()
-        await db.refresh(document)
-        return document
+    )
+    return result.scalar_one_or_none()
+
+
+async def load_blob_content(db: AsyncSession, sha256: str) -> str:
+    """Rebuild the full content of a blob by applying its delta chain.
+
+    Args:
+        db: Database session
+        sha256: Content address
+
+    Returns:
+        Full content
+
+    Raises:
+        ValueError: If the blob chain is broken or the result does not match its hash
+
+    """
+    chain: List[DocumentBlob] = []
+    current: Optional[str] = sha256
+    while current is not None:
+        blob = await db.get(DocumentBlob, current)
+        if blob is None:
+            raise ValueError(f"Missing document blob {current}")
+        chain.append(blob)
+        current = blob.base_sha256 if blob.kind == BLOB_DELTA else None
+
+    content = unpack(chain[-1].data)
+    for blob in reversed(chain[:-1]):
+        content = apply_delta(content, unpack(blob.data))
+
+    if content_hash(content) != sha256:
+        raise ValueError(f"Document blob {sha256} failed integrity check")
+    return content
 
 
 async def get_document(
@@ -86,6 +330,75 @@ async def get_document(
     return result.scalar_one_or_none()
 
 
+async def get_section_index(
+    db: AsyncSession,
+    project_id: UUID,
+    document_type: DocumentType,
+) -> Optional[Tuple[UUID, int, List[Dict[str, Any]]]]:
+    """Get the section index of a document without loading its content.
+
+    Documents saved before sections were indexed are indexed on the fly.
+
+    Args:
+        db: Database session
+        project_id: Project UUID
+        document_type: Type of document
+
+    Returns:
+        Tuple of (document ID, content size in bytes, sections) or None if not found
+
+    Raises:
+        ProjectNotFoundError: If the project does not exist
+
+    """
+    # Joined from the project so that a missing project is told apart from a missing document
+    result = await db.execute(
+        select(
+            Project.id,
+            Document.id,
+            func.octet_length(Document.content_md),
+            Document.__table__.c.metadata["sections"],
+        )
+        .outerjoin(
+            Document,
+            and_(Document.project_id == Project.id, Document.type == document_type.value),
+        )
+        .where(Project.id == project_id)
+    )
+    row = result.first()
+    if row is None:
+        raise ProjectNotFoundError(project_id)
+
+    _, document_id, size_bytes, sections = row
+    if document_id is None:
+        return None
+    if sections is None:
+        result = await db.execute(select(Document.content_md).where(Document.id == document_id))
+        sections = build_section_index(result.scalar_one())
+    return document_id, size_bytes, sections
+
+
+async def read_document_bytes(db: AsyncSession, document_id: UUID, start: int, end: int) -> bytes:
+    """Read a byte range of a document's UTF-8 content in the database.
+
+    Args:
+        db: Database session
+        document_id: Document UUID
+        start: First byte (0-based)
+        end: End byte (exclusive)
+
+    Returns:
+        Content bytes (may split a multi-byte character at the range edges)
+
+    """
+    result = await db.execute(
+        select(
+            func.substring(func.convert_to(Document.content_md, "UTF8"), start + 1, end - start)
+        ).where(Document.id == document_id)
+    )
+    return bytes(result.scalar_one())
+
+
 async def get_all_documents(
     db: AsyncSession,
     project_id: UUID,
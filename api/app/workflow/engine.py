@@ -1,22 +1,35 @@
 """Workflow engine for orchestrating the AI-driven development workflow."""
+import asyncio
 import logging
+import time
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional, Tuple, Type
 from uuid import UUID
 
 from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import async_sessionmaker
 
+from app.config import settings
 from app.core.websocket_manager import manager as ws_manager
-from app.db.models import Project
+from app.db.models import Project, WorkflowTimeline
+from app.db.repository import update_project
+from app.db.session import AsyncSessionLocal, session_scope
+from app.services.idea_similarity_service import ReuseSeed, load_reuse_seed
 from app.services.langfuse_service import LangFuseTracker, is_langfuse_enabled
+from app.services.llm_service import llm_service
+from app.workflow import profiler as spans
+from app.workflow.budget import resolve_budget
+from app.workflow.cancellation import WorkflowCancelledError, workflow_registry
 from app.workflow.document_storage import save_document
-from app.workflow.phases.base import PhaseResult
+from app.workflow.heuristics import estimate_idea_complexity
+from app.workflow.phases.base import BasePhaseHandler, PhaseResult
 from app.workflow.phases.event_storming import EventStormingPhase
 from app.workflow.phases.execution_plan import ExecutionPlanPhase
 from app.workflow.phases.prd_generation import PRDGenerationPhase
 from app.workflow.phases.smart_detection import SmartDetectionPhase
 from app.workflow.phases.tech_stack import TechStackPhase
+from app.workflow.profiler import WorkflowProfiler
 from app.workflow.state_machine import (
     DocumentType,
     WorkflowPhase,
@@ -27,24 +40,51 @@ from app.workflow.state_machine import (
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class SpeculativePhase:
+    """A phase started before it is known to be needed."""
+
+    started_at: float
+    complexity: float
+    task: asyncio.Task
+    handler: Optional[BasePhaseHandler] = None
+
+
 class WorkflowEngine:
-    """Main workflow engine for orchestrating all phases."""
+    """Main workflow engine for orchestrating all phases.
 
-    def __init__(self, db: AsyncSession, project_id: UUID):
+    The engine never holds a session for the whole run: every persistence
+    step (here and in the phase handlers) opens a short-lived session from
+    ``session_factory``, so no pooled connection is checked out while a
+    workflow waits on the LLM.
+    """
+
+    def __init__(self, project_id: UUID, session_factory: async_sessionmaker = AsyncSessionLocal):
         """Initialize workflow engine.
 
         Args:
-            db: Database session
             project_id: Project UUID
+            session_factory: Factory of the sessions used by the workflow
 
         """
-        self.db = db
+        self.session_factory = session_factory
         self.project_id = project_id
         self.tracker: Optional[LangFuseTracker] = None
         self.start_time: Optional[datetime] = None
+        self.profiler = WorkflowProfiler()
+        # Event loop time by which the workflow must finish (None = no deadline)
+        self.deadline: Optional[float] = None
+        # Cost budget of this run (None = unlimited) and the calls moved to cheaper models
+        self.budget_usd: Optional[float] = None
+        self.model_downgrades: List[dict] = []
+        # Project entity, cached for the engine's lifetime (see invalidate_project)
+        self._project: Optional[Project] = None
 
     async def _get_project(self) -> Project:
-        """Get project from database.
+        """Get the project, loading it once per engine.
+
+        The entity is kept for the engine's lifetime and refreshed by every
+        status update; call ``invalidate_project`` to read it again.
 
         Returns:
             Project
@@ -53,13 +93,17 @@ class WorkflowEngine:
             ValueError: If project not found
 
         """
-        result = await self.db.execute(
-            select(Project).where(Project.id == self.project_id)
-        )
-        project = result.scalar_one_or_none()
-        if not project:
-            raise ValueError(f"Project {self.project_id} not found")
-        return project
+        if self._project is None:
+            async with session_scope(self.session_factory) as db:
+                project = await db.get(Project, self.project_id)
+            if not project:
+                raise ValueError(f"Project {self.project_id} not found")
+            self._project = project
+        return self._project
+
+    def invalidate_project(self) -> None:
+        """Drop the cached project, e.g. after it may have been changed by another worker."""
+        self._project = None
 
     async def _update_project_status(
         self,
@@ -74,19 +118,71 @@ class WorkflowEngine:
             current_phase: Optional current phase
             metadata: Optional metadata to merge
 
-        """
-        project = await self._get_project()
-        project.status = status.value
-        project.current_phase = current_phase.value if current_phase else None
-        project.updated_at = datetime.utcnow()
+        Raises:
+            WorkflowCancelledError: If the project was cancelled meanwhile (it stays CANCELLED)
 
+        """
+        values = {
+            "status": status.value,
+            "current_phase": current_phase.value if current_phase else None,
+        }
         if status == WorkflowStatus.COMPLETED:
-            project.completed_at = datetime.utcnow()
+            values["completed_at"] = datetime.utcnow()
+        if self.model_downgrades:
+            metadata = {**(metadata or {}), **self._budget_metadata()}
+
+        # A project cancelled by another worker must not leave CANCELLED (not even to COMPLETED or FAILED)
+        unless_status = WorkflowStatus.CANCELLED.value if status != WorkflowStatus.CANCELLED else None
+
+        with self.profiler.span("update_project_status", spans.DB, status=status.value):
+            async with session_scope(self.session_factory) as db:
+                project = await update_project(db, self.project_id, values, metadata, unless_status)
+                if project is None:
+                    project = await db.get(Project, self.project_id)
+                    if not project:
+                        raise ValueError(f"Project {self.project_id} not found")
+                    self._project = project
+                    raise WorkflowCancelledError(
+                        (project.metadata.get("cancelled") or {}).get("reason", "Cancelled")
+                    )
+        self._project = project
+
+    async def _broadcast(self, message: dict) -> None:
+        """Broadcast an event via WebSocket, timed in the profiler.
+
+        Args:
+            message: Message to broadcast
 
-        if metadata:
-            project.metadata = {**project.metadata, **metadata}
+        """
+        with self.profiler.span(f"broadcast_{message['type']}", spans.BROADCAST):
+            await ws_manager.broadcast(self.project_id, message)
 
-        await self.db.commit()
+    async def _save_document(
+        self,
+        document_type: DocumentType,
+        content_md: str,
+        metadata: dict,
+        alternates: Optional[List[Tuple[str, dict]]] = None,
+    ) -> None:
+        """Save a generated document, timed in the profiler.
+
+        Args:
+            document_type: Type of document
+            content_md: Markdown content
+            metadata: Document metadata
+            alternates: Optional (content, attributes) pairs of unselected variants
+
+        """
+        with self.profiler.span("save_document", spans.DB, document_type=document_type.value):
+            async with session_scope(self.session_factory) as db:
+                await save_document(
+                    db,
+                    self.project_id,
+                    document_type,
+                    content_md,
+                    metadata=metadata,
+                    alternates=alternates,
+                )
 
     async def _broadcast_phase_started(self, phase: WorkflowPhase, message: str) -> None:
         """Broadcast phase started event via WebSocket.
@@ -96,8 +192,7 @@ class WorkflowEngine:
             message: Human-readable message
 
         """
-        await ws_manager.broadcast(
-            self.project_id,
+        await self._broadcast(
             {
                 "type": "phase_started",
                 "phase": phase.value,
@@ -106,22 +201,22 @@ class WorkflowEngine:
         )
 
     async def _broadcast_phase_completed(
-        self, phase: WorkflowPhase, duration_seconds: int, cost_usd: float
+        self, phase: WorkflowPhase, duration_ms: int, cost_usd: float
     ) -> None:
         """Broadcast phase completed event via WebSocket.
 
         Args:
             phase: Workflow phase
-            duration_seconds: Phase duration in seconds
+            duration_ms: Phase duration in milliseconds (monotonic clock)
             cost_usd: Phase cost in USD
 
         """
-        await ws_manager.broadcast(
-            self.project_id,
+        await self._broadcast(
             {
                 "type": "phase_completed",
                 "phase": phase.value,
-                "duration_seconds": duration_seconds,
+                "duration_seconds": duration_ms // 1000,
+                "duration_ms": duration_ms,
                 "cost_usd": round(cost_usd, 6),
             },
         )
@@ -134,8 +229,7 @@ class WorkflowEngine:
             error: Error message
 
         """
-        await ws_manager.broadcast(
-            self.project_id,
+        await self._broadcast(
             {
                 "type": "phase_failed",
                 "phase": phase.value,
@@ -144,6 +238,44 @@ class WorkflowEngine:
             },
         )
 
+    async def _broadcast_phase_retrying(
+        self,
+        phase: WorkflowPhase,
+        attempt: int,
+        max_attempts: int,
+        delay_seconds: float,
+        error: BaseException,
+    ) -> None:
+        """Broadcast phase retrying event via WebSocket.
+
+        Args:
+            phase: Workflow phase
+            attempt: Number of the failed attempt
+            max_attempts: Attempts allowed by the retry policy
+            delay_seconds: Delay before the next attempt
+            error: Transient error of the failed attempt
+
+        """
+        await self._broadcast(
+            {
+                "type": "phase_retrying",
+                "phase": phase.value,
+                "attempt": attempt,
+                "max_attempts": max_attempts,
+                "delay_seconds": round(delay_seconds, 3),
+                "error": f"{type(error).__name__}: {error}",
+            },
+        )
+
+    async def _broadcast_model_downgraded(self, downgrade: dict) -> None:
+        """Broadcast model downgraded event via WebSocket.
+
+        Args:
+            downgrade: Phase, requested and selected model, projected cost and budget
+
+        """
+        await self._broadcast({"type": "model_downgraded", **downgrade})
+
     async def _broadcast_workflow_completed(
         self, total_duration_seconds: int, total_cost_usd: float, documents_generated: int
     ) -> None:
@@ -155,8 +287,7 @@ class WorkflowEngine:
             documents_generated: Number of documents generated
 
         """
-        await ws_manager.broadcast(
-            self.project_id,
+        await self._broadcast(
             {
                 "type": "workflow_completed",
                 "total_duration_seconds": total_duration_seconds,
@@ -166,12 +297,54 @@ class WorkflowEngine:
         )
 
     async def execute_workflow(self) -> bool:
-        """Execute the complete workflow.
+        """Execute the complete workflow and persist its timeline.
+
+        The workflow is stopped when ``WORKFLOW_DEADLINE_SECONDS`` expires or
+        when its task is cancelled through ``workflow_registry``; the in-flight
+        LLM request is aborted and the project is marked CANCELLED.
 
         Returns:
             True if workflow completed successfully, False otherwise
 
         """
+        loop = asyncio.get_running_loop()
+        deadline_seconds = settings.WORKFLOW_DEADLINE_SECONDS
+        self.deadline = loop.time() + deadline_seconds if deadline_seconds > 0 else None
+
+        status = WorkflowStatus.FAILED
+        try:
+            with self.profiler.span("workflow", spans.WORKFLOW):
+                async with asyncio.timeout_at(self.deadline):
+                    success = await self._execute_phases()
+            status = WorkflowStatus.COMPLETED if success else WorkflowStatus.FAILED
+        except TimeoutError:
+            await self.handle_cancellation(f"Workflow deadline of {deadline_seconds:g}s exceeded")
+            status = WorkflowStatus.CANCELLED
+        except WorkflowCancelledError as e:
+            await self.handle_cancellation(e.reason)
+            status = WorkflowStatus.CANCELLED
+        except asyncio.CancelledError:
+            reason = workflow_registry.cancel_reason(self.project_id)
+            if reason is None:
+                # Not a cancellation requested through the API (e.g., shutdown)
+                raise
+            current_task = asyncio.current_task()
+            if current_task is not None:
+                current_task.uncancel()
+            await self.handle_cancellation(reason)
+            status = WorkflowStatus.CANCELLED
+
+        await self._save_timeline(status)
+        return status == WorkflowStatus.COMPLETED
+
+    async def _execute_phases(self) -> bool:
+        """Execute all workflow phases.
+
+        Returns:
+            True if workflow completed successfully, False otherwise
+
+        """
+        speculation: Optional[SpeculativePhase] = None
         try:
             # Get project
             project = await self._get_project()
@@ -192,81 +365,25 @@ class WorkflowEngine:
 
             logger.info(f"Starting workflow for project {self.project_id}")
 
-            # Phase 0: Smart Detection
-            await self._broadcast_phase_started(
-                WorkflowPhase.SMART_DETECTION,
-                "Analyzing project complexity and determining workflow approach...",
-            )
-            phase_start = datetime.utcnow()
-            smart_detection_result = await self._run_smart_detection(project.idea)
-            if not smart_detection_result.success:
-                await self._broadcast_phase_failed(
-                    WorkflowPhase.SMART_DETECTION,
-                    smart_detection_result.error_message or "Smart detection failed",
-                )
-                await self._handle_workflow_failure(smart_detection_result.error_message)
-                return False
+            self.budget_usd = resolve_budget(project.metadata, str(project.user_id))
+            reuse_seed = await self._load_reuse_seed(project)
 
-            # Broadcast Smart Detection completion
-            phase_duration = int((datetime.utcnow() - phase_start).total_seconds())
-            phase_cost = smart_detection_result.llm_response.cost_usd if smart_detection_result.llm_response else 0.0
-            await self._broadcast_phase_completed(
-                WorkflowPhase.SMART_DETECTION,
-                phase_duration,
-                phase_cost,
-            )
+            # Phase 0: Smart Detection (Event Storming may start speculatively alongside)
+            speculation = None if reuse_seed else self._start_speculative_event_storming(project.idea)
+            smart_detection_result = await self._run_smart_detection_step(project, reuse_seed, speculation)
+            if smart_detection_result is None:
+                return False
 
             use_event_storming = smart_detection_result.output_data.get("use_event_storming", False)
 
-            # Store smart detection results in project metadata
-            await self._update_project_status(
-                WorkflowStatus.PROCESSING,
-                WorkflowPhase.SMART_DETECTION,
-                metadata={"smart_detection": smart_detection_result.output_data},
-            )
-
             # Phase 0.5: Event Storming (conditional)
             event_storming_summary = None
             if use_event_storming:
-                await self._update_project_status(
-                    WorkflowStatus.PROCESSING,
-                    WorkflowPhase.EVENT_STORMING,
-                )
-
-                await self._broadcast_phase_started(
-                    WorkflowPhase.EVENT_STORMING,
-                    "Running Event Storming to discover business domain and events...",
-                )
-                phase_start = datetime.utcnow()
-                event_storming_result = await self._run_event_storming(project.idea)
-                if not event_storming_result.success:
-                    await self._broadcast_phase_failed(
-                        WorkflowPhase.EVENT_STORMING,
-                        event_storming_result.error_message or "Event Storming failed",
-                    )
-                    await self._handle_workflow_failure(event_storming_result.error_message)
+                event_storming_result = await self._run_event_storming_step(project, reuse_seed, speculation)
+                if event_storming_result is None:
                     return False
-
-                # Broadcast Event Storming completion
-                phase_duration = int((datetime.utcnow() - phase_start).total_seconds())
-                phase_cost = event_storming_result.llm_response.cost_usd if event_storming_result.llm_response else 0.0
-                await self._broadcast_phase_completed(
-                    WorkflowPhase.EVENT_STORMING,
-                    phase_duration,
-                    phase_cost,
-                )
-
                 event_storming_summary = event_storming_result.output_data.get("event_storming_md")
 
-                # Save Event Storming document
-                await save_document(
-                    self.db,
-                    self.project_id,
-                    DocumentType.EVENT_STORMING,
-                    event_storming_summary,
-                    metadata={"model": event_storming_result.llm_response.model if event_storming_result.llm_response else None},
-                )
-
             # Phase 1-2: PRD Generation
             await self._update_project_status(
                 WorkflowStatus.PROCESSING,
@@ -277,8 +394,11 @@ class WorkflowEngine:
                 WorkflowPhase.PRD,
                 "Generating Product Requirements Document (PRD)...",
             )
-            phase_start = datetime.utcnow()
-            prd_result = await self._run_prd_generation(project.idea, event_storming_summary)
+            phase_start = time.perf_counter()
+            variant_options = self._variant_options(project)
+            prd_result = await self._run_prd_generation(
+                project.idea, event_storming_summary, variant_options
+            )
             if not prd_result.success:
                 await self._broadcast_phase_failed(
                     WorkflowPhase.PRD,
@@ -288,8 +408,8 @@ class WorkflowEngine:
                 return False
 
             # Broadcast PRD completion
-            phase_duration = int((datetime.utcnow() - phase_start).total_seconds())
-            phase_cost = prd_result.llm_response.cost_usd if prd_result.llm_response else 0.0
+            phase_duration = int((time.perf_counter() - phase_start) * 1000)
+            phase_cost = prd_result.total_cost_usd
             await self._broadcast_phase_completed(
                 WorkflowPhase.PRD,
                 phase_duration,
@@ -299,12 +419,14 @@ class WorkflowEngine:
             prd_md = prd_result.output_data.get("prd_md")
 
             # Save PRD document
-            await save_document(
-                self.db,
-                self.project_id,
+            await self._save_document(
                 DocumentType.PRD,
                 prd_md,
-                metadata={"model": prd_result.llm_response.model if prd_result.llm_response else None},
+                metadata={
+                    "model": prd_result.llm_response.model if prd_result.llm_response else None,
+                    **self._variant_metadata(prd_result),
+                },
+                alternates=self._alternate_versions(prd_result),
             )
 
             # Phase 3: Tech Stack
@@ -317,7 +439,7 @@ class WorkflowEngine:
                 WorkflowPhase.TECH_STACK,
                 "Determining optimal tech stack and architecture...",
             )
-            phase_start = datetime.utcnow()
+            phase_start = time.perf_counter()
             tech_stack_result = await self._run_tech_stack(prd_md)
             if not tech_stack_result.success:
                 await self._broadcast_phase_failed(
@@ -328,8 +450,8 @@ class WorkflowEngine:
                 return False
 
             # Broadcast Tech Stack completion
-            phase_duration = int((datetime.utcnow() - phase_start).total_seconds())
-            phase_cost = tech_stack_result.llm_response.cost_usd if tech_stack_result.llm_response else 0.0
+            phase_duration = int((time.perf_counter() - phase_start) * 1000)
+            phase_cost = tech_stack_result.total_cost_usd
             await self._broadcast_phase_completed(
                 WorkflowPhase.TECH_STACK,
                 phase_duration,
@@ -339,9 +461,7 @@ class WorkflowEngine:
             tech_stack_md = tech_stack_result.output_data.get("tech_stack_md")
 
             # Save Tech Stack document
-            await save_document(
-                self.db,
-                self.project_id,
+            await self._save_document(
                 DocumentType.TECH_STACK,
                 tech_stack_md,
                 metadata={"model": tech_stack_result.llm_response.model if tech_stack_result.llm_response else None},
@@ -357,8 +477,10 @@ class WorkflowEngine:
                 WorkflowPhase.EXECUTION_PLAN,
                 "Creating detailed execution plan with stage gates...",
             )
-            phase_start = datetime.utcnow()
-            execution_plan_result = await self._run_execution_plan(prd_md, tech_stack_md)
+            phase_start = time.perf_counter()
+            execution_plan_result = await self._run_execution_plan(
+                prd_md, tech_stack_md, variant_options
+            )
             if not execution_plan_result.success:
                 await self._broadcast_phase_failed(
                     WorkflowPhase.EXECUTION_PLAN,
@@ -368,8 +490,8 @@ class WorkflowEngine:
                 return False
 
             # Broadcast Execution Plan completion
-            phase_duration = int((datetime.utcnow() - phase_start).total_seconds())
-            phase_cost = execution_plan_result.llm_response.cost_usd if execution_plan_result.llm_response else 0.0
+            phase_duration = int((time.perf_counter() - phase_start) * 1000)
+            phase_cost = execution_plan_result.total_cost_usd
             await self._broadcast_phase_completed(
                 WorkflowPhase.EXECUTION_PLAN,
                 phase_duration,
@@ -380,93 +502,516 @@ class WorkflowEngine:
             approach = execution_plan_result.output_data.get("approach", "HORIZONTAL")
 
             # Save Execution Plan document
-            await save_document(
-                self.db,
-                self.project_id,
+            await self._save_document(
                 DocumentType.EXECUTION_PLAN,
                 execution_plan_md,
                 metadata={
                     "model": execution_plan_result.llm_response.model if execution_plan_result.llm_response else None,
                     "approach": approach,
+                    **self._variant_metadata(execution_plan_result),
                 },
+                alternates=self._alternate_versions(execution_plan_result),
+            )
+
+            await self._finalize_workflow(use_event_storming, approach)
+
+            logger.info(f"Workflow completed successfully for project {self.project_id}")
+            return True
+
+        except (asyncio.CancelledError, WorkflowCancelledError):
+            # Handled by execute_workflow
+            await self._cancel_speculation(speculation)
+            raise
+
+        except Exception as e:
+            logger.error(f"Workflow failed for project {self.project_id}: {e}", exc_info=True)
+            await self._cancel_speculation(speculation)
+            await self._handle_workflow_failure(str(e))
+            return False
+
+    async def _run_smart_detection_step(
+        self,
+        project: Project,
+        reuse_seed: Optional[ReuseSeed],
+        speculation: Optional[SpeculativePhase],
+    ) -> Optional[PhaseResult]:
+        """Run (or reuse) Smart Detection and store its result in the project metadata.
+
+        Args:
+            project: Project instance
+            reuse_seed: Outputs of a similar project to reuse, if any
+            speculation: Event Storming started speculatively, discarded if not needed
+
+        Returns:
+            Smart Detection result, or None if the phase failed (the workflow is marked failed)
+
+        """
+        await self._broadcast_phase_started(
+            WorkflowPhase.SMART_DETECTION,
+            "Reusing complexity analysis of a similar completed project..."
+            if reuse_seed
+            else "Analyzing project complexity and determining workflow approach...",
+        )
+        phase_start = time.perf_counter()
+        if reuse_seed:
+            result = PhaseResult(WorkflowPhase.SMART_DETECTION, True, dict(reuse_seed.smart_detection))
+        else:
+            result = await self._run_smart_detection(project.idea)
+        if not result.success:
+            if speculation:
+                await self._discard_speculation(speculation)
+            await self._broadcast_phase_failed(
+                WorkflowPhase.SMART_DETECTION,
+                result.error_message or "Smart detection failed",
             )
+            await self._handle_workflow_failure(result.error_message)
+            return None
+
+        # Broadcast Smart Detection completion
+        phase_duration = int((time.perf_counter() - phase_start) * 1000)
+        await self._broadcast_phase_completed(
+            WorkflowPhase.SMART_DETECTION,
+            phase_duration,
+            result.total_cost_usd,
+        )
 
-            # Calculate total cost and duration
-            total_cost, total_duration = await self._calculate_totals()
+        # Store smart detection results in project metadata
+        use_event_storming = result.output_data.get("use_event_storming", False)
+        await self._update_project_status(
+            WorkflowStatus.PROCESSING,
+            WorkflowPhase.SMART_DETECTION,
+            metadata={
+                "smart_detection": result.output_data,
+                **self._reuse_metadata(project, reuse_seed, use_event_storming),
+            },
+        )
 
-            # Update project with final metadata
+        # Speculative Event Storming turned out to be unnecessary
+        if speculation and not use_event_storming:
+            await self._discard_speculation(speculation)
+        return result
+
+    async def _run_event_storming_step(
+        self,
+        project: Project,
+        reuse_seed: Optional[ReuseSeed],
+        speculation: Optional[SpeculativePhase],
+    ) -> Optional[PhaseResult]:
+        """Run Event Storming (reused, speculative or fresh) and save its document.
+
+        Args:
+            project: Project instance
+            reuse_seed: Outputs of a similar project to reuse, if any
+            speculation: Event Storming already running since Smart Detection started
+
+        Returns:
+            Event Storming result, or None if the phase failed (the workflow is marked failed)
+
+        """
+        await self._update_project_status(
+            WorkflowStatus.PROCESSING,
+            WorkflowPhase.EVENT_STORMING,
+        )
+
+        await self._broadcast_phase_started(
+            WorkflowPhase.EVENT_STORMING,
+            "Running Event Storming to discover business domain and events...",
+        )
+        if reuse_seed and reuse_seed.event_storming_md:
+            phase_start = time.perf_counter()
+            result = PhaseResult(
+                WorkflowPhase.EVENT_STORMING,
+                True,
+                {"event_storming_md": reuse_seed.event_storming_md},
+            )
+        elif speculation:
+            # Already running since Smart Detection started
+            phase_start = speculation.started_at
+            result = await speculation.task
             await self._update_project_status(
-                WorkflowStatus.COMPLETED,
-                WorkflowPhase.EXECUTION_PLAN,
+                WorkflowStatus.PROCESSING,
+                WorkflowPhase.EVENT_STORMING,
                 metadata={
-                    "use_event_storming": use_event_storming,
-                    "use_vertical_approach": approach == "VERTICAL",
-                    "total_cost_usd": total_cost,
-                    "total_duration_seconds": total_duration,
+                    "speculation": {
+                        "event_storming": {
+                            "complexity": speculation.complexity,
+                            "used": True,
+                            "wasted_cost_usd": 0.0,
+                        }
+                    }
                 },
             )
+        else:
+            phase_start = time.perf_counter()
+            result = await self._run_event_storming(project.idea)
+        if not result.success:
+            await self._broadcast_phase_failed(
+                WorkflowPhase.EVENT_STORMING,
+                result.error_message or "Event Storming failed",
+            )
+            await self._handle_workflow_failure(result.error_message)
+            return None
+
+        # Broadcast Event Storming completion
+        phase_duration = int((time.perf_counter() - phase_start) * 1000)
+        await self._broadcast_phase_completed(
+            WorkflowPhase.EVENT_STORMING,
+            phase_duration,
+            result.total_cost_usd,
+        )
 
-            # Finalize LangFuse trace
-            if self.tracker:
-                documents_generated = 4 if use_event_storming else 3
-                self.tracker.finalize(
-                    total_cost=total_cost,
-                    total_duration_seconds=total_duration,
-                    status="completed",
-                    documents_generated=documents_generated,
-                )
+        # Save Event Storming document
+        event_storming_metadata = {
+            "model": result.llm_response.model if result.llm_response else None,
+        }
+        if not result.llm_response and reuse_seed:
+            event_storming_metadata["reused_from"] = str(reuse_seed.source_project_id)
+        await self._save_document(
+            DocumentType.EVENT_STORMING,
+            result.output_data.get("event_storming_md"),
+            metadata=event_storming_metadata,
+        )
+        return result
+
+    async def _finalize_workflow(self, use_event_storming: bool, approach: str) -> None:
+        """Mark the workflow completed with its totals and report the completion.
+
+        Args:
+            use_event_storming: Whether the workflow ran Event Storming
+            approach: Execution plan approach (HORIZONTAL or VERTICAL)
 
-            # Broadcast workflow completion
+        """
+        # Calculate total cost and duration
+        total_cost, total_duration = await self._calculate_totals()
+
+        # Update project with final metadata
+        await self._update_project_status(
+            WorkflowStatus.COMPLETED,
+            WorkflowPhase.EXECUTION_PLAN,
+            metadata={
+                "use_event_storming": use_event_storming,
+                "use_vertical_approach": approach == "VERTICAL",
+                "total_cost_usd": total_cost,
+                "total_duration_seconds": total_duration,
+            },
+        )
+
+        # Finalize LangFuse trace
+        if self.tracker:
             documents_generated = 4 if use_event_storming else 3
-            await self._broadcast_workflow_completed(
-                total_duration,
-                total_cost,
-                documents_generated,
+            self.tracker.finalize(
+                total_cost=total_cost,
+                total_duration_seconds=total_duration,
+                status="completed",
+                documents_generated=documents_generated,
             )
 
-            logger.info(f"Workflow completed successfully for project {self.project_id}")
-            return True
+        # Broadcast workflow completion
+        documents_generated = 4 if use_event_storming else 3
+        await self._broadcast_workflow_completed(
+            total_duration,
+            total_cost,
+            documents_generated,
+        )
 
-        except Exception as e:
-            logger.error(f"Workflow failed for project {self.project_id}: {e}", exc_info=True)
-            await self._handle_workflow_failure(str(e))
-            return False
+    async def _load_reuse_seed(self, project: Project) -> Optional[ReuseSeed]:
+        """Load the outputs of the similar project chosen for reuse when the workflow started.
+
+        Args:
+            project: Project instance
+
+        Returns:
+            ReuseSeed, or None if reuse was not requested or the source is unavailable
+
+        """
+        reuse = (project.metadata or {}).get("reuse")
+        if not reuse:
+            return None
+
+        async with session_scope(self.session_factory) as db:
+            seed = await load_reuse_seed(db, UUID(reuse["source_project_id"]))
+        if seed is None:
+            logger.warning(
+                f"Reuse source {reuse['source_project_id']} of project {self.project_id} "
+                "is unavailable, running all phases"
+            )
+        return seed
+
+    @staticmethod
+    def _reuse_metadata(
+        project: Project, reuse_seed: Optional[ReuseSeed], use_event_storming: bool
+    ) -> dict:
+        """Build project metadata describing the reused phases and the cost saved.
+
+        Args:
+            project: Project instance
+            reuse_seed: Reused outputs, if any
+            use_event_storming: Whether the workflow runs Event Storming
+
+        Returns:
+            Metadata entries to merge (empty without reuse)
+
+        """
+        if not reuse_seed:
+            return {}
+
+        phase_costs = {WorkflowPhase.SMART_DETECTION.value: reuse_seed.smart_detection_cost_usd}
+        if use_event_storming and reuse_seed.event_storming_md:
+            phase_costs[WorkflowPhase.EVENT_STORMING.value] = reuse_seed.event_storming_cost_usd
+        return {
+            "reuse": {
+                **project.metadata["reuse"],
+                "phases": list(phase_costs),
+                "phase_costs_usd": {phase: round(cost, 6) for phase, cost in phase_costs.items()},
+                "cost_saved_usd": round(sum(phase_costs.values()), 6),
+            }
+        }
+
+    def _start_speculative_event_storming(self, idea: str) -> Optional[SpeculativePhase]:
+        """Start Event Storming in parallel with Smart Detection if the idea looks complex.
+
+        The speculative phase runs in its own task.
+
+        Args:
+            idea: Project idea
+
+        Returns:
+            SpeculativePhase or None if speculation is disabled or the idea looks simple
+
+        """
+        if not settings.SPECULATIVE_EVENT_STORMING:
+            return None
+
+        complexity = estimate_idea_complexity(idea)
+        if complexity < settings.SPECULATIVE_COMPLEXITY_THRESHOLD:
+            return None
+
+        logger.info(
+            f"Starting speculative Event Storming for project {self.project_id} "
+            f"(complexity {complexity})"
+        )
+        started_at = time.perf_counter()
+
+        async def run() -> PhaseResult:
+            # The task first runs after this method returns, so speculation is bound by then
+            return await self._run_phase(
+                EventStormingPhase, {"idea": idea, "speculative": True}, speculation=speculation
+            )
+
+        speculation = SpeculativePhase(
+            started_at=started_at, complexity=complexity, task=asyncio.create_task(run())
+        )
+        return speculation
+
+    @staticmethod
+    async def _cancel_speculation(speculation: Optional[SpeculativePhase]) -> None:
+        """Cancel a running speculative phase and wait until it has stopped.
+
+        Args:
+            speculation: Speculative phase to cancel (nothing to do if None or finished)
+
+        """
+        if speculation is None or speculation.task.done():
+            return
+        speculation.task.cancel()
+        try:
+            await speculation.task
+        except asyncio.CancelledError:
+            pass
+
+    async def _discard_speculation(self, speculation: SpeculativePhase) -> None:
+        """Cancel an unneeded speculative phase and record its wasted cost.
+
+        Args:
+            speculation: Speculative phase to discard
+
+        """
+        wasted_cost = 0.0
+
+        if speculation.task.done():
+            # Finished before detection returned - its cost is already in the LLM logs
+            if not speculation.task.cancelled() and speculation.task.exception() is None:
+                result = speculation.task.result()
+                wasted_cost = result.total_cost_usd
+        else:
+            in_flight = speculation.handler.in_flight_request if speculation.handler else None
+            await self._cancel_speculation(speculation)
+
+            # The provider has already processed the prompt; estimate that cost
+            if in_flight:
+                usage = llm_service.estimate_usage(
+                    in_flight["prompt"], "", in_flight["system_message"]
+                )
+                wasted_cost = llm_service._calculate_cost(in_flight["model"], usage)
+
+        logger.info(
+            f"Discarded speculative Event Storming for project {self.project_id} "
+            f"(wasted cost ${wasted_cost:.6f})"
+        )
+
+        await self._update_project_status(
+            WorkflowStatus.PROCESSING,
+            WorkflowPhase.SMART_DETECTION,
+            metadata={
+                "speculation": {
+                    "event_storming": {
+                        "complexity": speculation.complexity,
+                        "used": False,
+                        "wasted_cost_usd": round(wasted_cost, 6),
+                    }
+                }
+            },
+        )
+
+    async def _run_phase(
+        self,
+        handler_class: Type[BasePhaseHandler],
+        input_data: dict,
+        speculation: Optional[SpeculativePhase] = None,
+    ) -> PhaseResult:
+        """Run a phase handler with state tracking inside a profiler span.
+
+        Args:
+            handler_class: Phase handler class
+            input_data: Input data for the phase
+            speculation: Speculative phase the handler runs for, if any
+
+        Returns:
+            PhaseResult
+
+        """
+        handler = handler_class(self.session_factory, self.project_id, self.tracker, self.profiler)
+        if speculation:
+            speculation.handler = handler
+        return await self._run_handler(handler, input_data)
+
+    async def _run_handler(self, handler: BasePhaseHandler, input_data: dict) -> PhaseResult:
+        """Run a phase handler with the engine's callbacks, deadline and budget.
+
+        Args:
+            handler: Phase handler
+            input_data: Input data for the phase
+
+        Returns:
+            PhaseResult
+
+        """
+        phase = handler.get_phase_name()
+
+        async def on_retry(attempt: int, max_attempts: int, delay: float, error: BaseException) -> None:
+            await self._broadcast_phase_retrying(phase, attempt, max_attempts, delay, error)
+
+        async def on_model_downgraded(downgrade: dict) -> None:
+            self.model_downgrades.append({**downgrade, "timestamp": datetime.utcnow().isoformat()})
+            await self._broadcast_model_downgraded(downgrade)
+
+        handler.on_retry = on_retry
+        handler.on_model_downgraded = on_model_downgraded
+        handler.deadline = self.deadline
+        handler.budget_usd = self.budget_usd
+        handler.run_started_at = self.start_time
+        with self.profiler.span(phase.value, spans.PHASE, phase=phase.value):
+            return await handler.run_with_state_tracking(input_data)
+
+    def _budget_metadata(self) -> dict:
+        """Build project metadata describing the budget and the model downgrades.
+
+        Returns:
+            Metadata entries to merge
+
+        """
+        return {
+            "budget": {
+                "limit_usd": self.budget_usd,
+                "downgrades": self.model_downgrades,
+            }
+        }
+
+    @staticmethod
+    def _variant_options(project: Project) -> dict:
+        """Get the multi-variant generation options requested for a project.
+
+        Args:
+            project: Project instance
+
+        Returns:
+            Input data entries for phases that support variants
+
+        """
+        options = {"variants": (project.metadata or {}).get("variants", 1)}
+        if (project.metadata or {}).get("variant_models"):
+            options["variant_models"] = project.metadata["variant_models"]
+        return options
+
+    @staticmethod
+    def _variant_metadata(result: PhaseResult) -> dict:
+        """Build document metadata describing a multi-variant generation.
+
+        Args:
+            result: Phase result
+
+        Returns:
+            Metadata with the winner's score and the variant count (empty for one variant)
+
+        """
+        alternates = result.output_data.get("alternates") or []
+        if not alternates:
+            return {}
+        return {
+            "score": result.output_data.get("score"),
+            "variants": len(alternates) + 1,
+            "total_cost_usd": round(result.total_cost_usd, 6),
+        }
+
+    @staticmethod
+    def _alternate_versions(result: PhaseResult) -> List[Tuple[str, dict]]:
+        """Get the unselected variants of a phase as document versions.
+
+        Args:
+            result: Phase result
+
+        Returns:
+            List of (content, version attributes), best first
+
+        """
+        return result.alternates
 
     async def _run_smart_detection(self, idea: str) -> PhaseResult:
         """Run smart detection phase."""
-        handler = SmartDetectionPhase(self.db, self.project_id, self.tracker)
-        return await handler.run_with_state_tracking({"idea": idea})
+        return await self._run_phase(SmartDetectionPhase, {"idea": idea})
 
     async def _run_event_storming(self, idea: str) -> PhaseResult:
         """Run Event Storming phase."""
-        handler = EventStormingPhase(self.db, self.project_id, self.tracker)
-        return await handler.run_with_state_tracking({"idea": idea})
+        return await self._run_phase(EventStormingPhase, {"idea": idea})
 
     async def _run_prd_generation(
-        self, idea: str, event_storming_summary: Optional[str]
+        self,
+        idea: str,
+        event_storming_summary: Optional[str],
+        variant_options: Optional[dict] = None,
     ) -> PhaseResult:
         """Run PRD generation phase."""
-        handler = PRDGenerationPhase(self.db, self.project_id, self.tracker)
-        input_data = {"idea": idea}
+        input_data = {"idea": idea, **(variant_options or {})}
         if event_storming_summary:
             input_data["event_storming_summary"] = event_storming_summary
-        return await handler.run_with_state_tracking(input_data)
+        return await self._run_phase(PRDGenerationPhase, input_data)
 
     async def _run_tech_stack(self, prd_md: str) -> PhaseResult:
         """Run Tech Stack phase."""
-        handler = TechStackPhase(self.db, self.project_id, self.tracker)
-        return await handler.run_with_state_tracking({"prd_md": prd_md})
+        return await self._run_phase(TechStackPhase, {"prd_md": prd_md})
 
-    async def _run_execution_plan(self, prd_md: str, tech_stack_md: str) -> PhaseResult:
+    async def _run_execution_plan(
+        self, prd_md: str, tech_stack_md: str, variant_options: Optional[dict] = None
+    ) -> PhaseResult:
         """Run Execution Plan phase."""
-        handler = ExecutionPlanPhase(self.db, self.project_id, self.tracker)
-        return await handler.run_with_state_tracking({
+        return await self._run_phase(ExecutionPlanPhase, {
             "prd_md": prd_md,
             "tech_stack_md": tech_stack_md,
+            **(variant_options or {}),
         })
 
     async def _calculate_totals(self) -> tuple[float, int]:
-        """Calculate total cost and duration from LLM logs.
+        """Calculate total cost from LLM logs and wall-clock duration.
 
         Returns:
             Tuple of (total_cost_usd, total_duration_seconds)
@@ -475,20 +1020,42 @@ class WorkflowEngine:
         from app.db.models import LLMLog
         from sqlalchemy import func
 
-        result = await self.db.execute(
-            select(
-                func.sum(LLMLog.cost_usd),
-                func.sum(LLMLog.latency_ms),
-            ).where(LLMLog.project_id == self.project_id)
-        )
+        with self.profiler.span("calculate_totals", spans.DB):
+            async with session_scope(self.session_factory) as db:
+                result = await db.execute(
+                    select(func.sum(LLMLog.cost_usd)).where(LLMLog.project_id == self.project_id)
+                )
+                total_cost = float(result.scalar() or 0.0)
 
-        row = result.one()
-        total_cost = float(row[0] or 0.0)
-        total_latency_ms = int(row[1] or 0)
-        total_duration_seconds = total_latency_ms // 1000
+        # Wall-clock time (monotonic) covers DB, rendering and broadcasts, not just LLM latency
+        total_duration_seconds = int(self.profiler.now_ms()) // 1000
 
         return total_cost, total_duration_seconds
 
+    async def _save_timeline(self, status: WorkflowStatus) -> None:
+        """Persist the profiler spans for this workflow execution.
+
+        Args:
+            status: Final workflow status
+
+        """
+        spans_data = self.profiler.to_list()
+        root = next((span for span in spans_data if span["category"] == spans.WORKFLOW), None)
+
+        try:
+            async with session_scope(self.session_factory) as db:
+                db.add(
+                    WorkflowTimeline(
+                        project_id=self.project_id,
+                        status=status.value,
+                        total_ms=int(root["duration_ms"]) if root else 0,
+                        spans=spans_data,
+                    )
+                )
+        except Exception as e:
+            # Profiling must never affect the workflow outcome
+            logger.warning(f"Failed to save timeline for project {self.project_id}: {e}")
+
     async def _handle_workflow_failure(self, error_message: Optional[str]) -> None:
         """Handle workflow failure.
 
@@ -502,8 +1069,7 @@ class WorkflowEngine:
         )
 
         # Broadcast workflow failure
-        await ws_manager.broadcast(
-            self.project_id,
+        await self._broadcast(
             {
                 "type": "workflow_failed",
                 "error": error_message or "Unknown error occurred",
@@ -518,3 +1084,42 @@ class WorkflowEngine:
             )
 
         logger.error(f"Workflow failed for project {self.project_id}: {error_message}")
+
+    async def handle_cancellation(self, reason: str) -> None:
+        """Mark the workflow as cancelled and notify clients.
+
+        Args:
+            reason: Why the workflow was cancelled
+
+        """
+        # Read fresh: the project may have been cancelled by another worker
+        self.invalidate_project()
+        project = await self._get_project()
+        cancelled_phase = project.current_phase
+        if project.status != WorkflowStatus.CANCELLED.value:
+            await self._update_project_status(
+                WorkflowStatus.CANCELLED,
+                WorkflowPhase(cancelled_phase) if cancelled_phase else None,
+                metadata={
+                    "cancelled": {
+                        "reason": reason,
+                        "phase": cancelled_phase,
+                        "cancelled_at": datetime.utcnow().isoformat(),
+                    }
+                },
+            )
+
+        # Broadcast workflow cancellation
+        await self._broadcast(
+            {
+                "type": "workflow_cancelled",
+                "reason": reason,
+                "phase": cancelled_phase,
+                "timestamp": datetime.utcnow().isoformat(),
+            },
+        )
+
+        if self.tracker:
+            self.tracker.track_event("workflow_cancelled", metadata={"reason": reason})
+
+        logger.warning(f"Workflow cancelled for project {self.project_id}: {reason}")
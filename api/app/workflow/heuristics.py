@@ -0,0 +1,81 @@
+"""Cheap local heuristics over project ideas (no LLM calls)."""
+import re
+
+# Signals of complex business logic, mirroring the Smart Detection criteria
+COMPLEXITY_KEYWORDS = (
+    "approval",
+    "booking",
+    "billing",
+    "checkout",
+    "compliance",
+    "inventory",
+    "invoice",
+    "marketplace",
+    "multi-tenant",
+    "notification",
+    "order",
+    "payment",
+    "permission",
+    "reporting",
+    "reservation",
+    "role",
+    "scheduling",
+    "subscription",
+    "workflow",
+    "integration",
+)
+
+# Signals of several distinct user types
+USER_TYPE_KEYWORDS = (
+    "admin",
+    "customer",
+    "seller",
+    "buyer",
+    "vendor",
+    "manager",
+    "employee",
+    "teacher",
+    "student",
+    "doctor",
+    "patient",
+    "driver",
+    "moderator",
+)
+
+WORD_PATTERN = re.compile(r"[a-z][a-z-]+")
+FEATURE_SEPARATOR_PATTERN = re.compile(r",|;|\band\b|\n\s*[-*\d]")
+
+
+def estimate_idea_complexity(idea: str) -> float:
+    """Estimate how likely an idea needs Event Storming.
+
+    Combines an estimated feature count, business-logic keywords, user types
+    and description length into a score between 0.0 (simple CRUD) and 1.0
+    (complex business domain).
+
+    Args:
+        idea: Project idea text
+
+    Returns:
+        Complexity score in the range [0.0, 1.0]
+
+    """
+    text = idea.lower()
+    words = WORD_PATTERN.findall(text)
+    if not words:
+        return 0.0
+
+    # Features are usually listed with commas, "and" or bullet points
+    feature_count = len(FEATURE_SEPARATOR_PATTERN.findall(text)) + 1
+    feature_score = min(feature_count / 6, 1.0)
+
+    keyword_hits = sum(1 for keyword in COMPLEXITY_KEYWORDS if keyword in text)
+    keyword_score = min(keyword_hits / 3, 1.0)
+
+    user_types = sum(1 for keyword in USER_TYPE_KEYWORDS if keyword in text)
+    user_score = min(user_types / 3, 1.0)
+
+    length_score = min(len(words) / 120, 1.0)
+
+    score = 0.3 * feature_score + 0.35 * keyword_score + 0.2 * user_score + 0.15 * length_score
+    return round(score, 3)
@@ -0,0 +1,118 @@
+"""Markdown parsing helpers for generated documents."""
+import re
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# ATX heading: 1-6 '#' characters followed by whitespace and the title
+HEADING_PATTERN = re.compile(r"^\s{0,3}(#{1,6})\s+(.+?)\s*#*\s*$")
+
+
+def parse_heading(line: str) -> Optional[Tuple[int, str]]:
+    """Parse a markdown ATX heading line.
+
+    Args:
+        line: Single line of markdown (without trailing newline)
+
+    Returns:
+        Tuple of (level, title) or None if the line is not a heading
+
+    """
+    match = HEADING_PATTERN.match(line)
+    if not match:
+        return None
+    return len(match.group(1)), match.group(2).strip()
+
+
+# Opening/closing line of a fenced code block (headings inside are not headings)
+FENCE_PATTERN = re.compile(r"^\s{0,3}(`{3,}|~{3,})")
+
+_SLUG_STRIP = re.compile(r"[^\w-]+", re.UNICODE)
+
+
+def slugify(title: str) -> str:
+    """Convert a heading title to a URL slug.
+
+    Args:
+        title: Heading title
+
+    Returns:
+        Lowercase words joined by single hyphens
+
+    """
+    title = title.replace("`", "").replace("*", "").replace("_", " ")
+    return "-".join(_SLUG_STRIP.sub(" ", title.lower()).split()) or "section"
+
+
+def iter_lines(content: str) -> Iterator[Tuple[int, str]]:
+    """Iterate over the lines of a markdown document outside fenced code blocks.
+
+    Args:
+        content: Markdown content
+
+    Yields:
+        Tuple of (UTF-8 byte offset of the line, line without its line break)
+
+    """
+    fence: Optional[str] = None
+    offset = 0
+
+    for line in content.splitlines(keepends=True):
+        start = offset
+        offset += len(line.encode("utf-8"))
+
+        fence_match = FENCE_PATTERN.match(line)
+        if fence_match:
+            marker = fence_match.group(1)
+            if fence is None:
+                fence = marker[0] * len(marker)
+            elif marker.startswith(fence):
+                fence = None
+            continue
+        if fence is None:
+            yield start, line.rstrip("\r\n")
+
+
+def build_section_index(content: str) -> List[Dict[str, Any]]:
+    """Index the sections of a markdown document by UTF-8 byte offsets.
+
+    A section starts at its heading line and ends where the next heading of
+    the same or a higher level starts, so it includes its subsections.
+    Repeated titles get numbered slugs (``tasks``, ``tasks-1``, ...).
+
+    Args:
+        content: Markdown content
+
+    Returns:
+        List of sections with slug, title, level, start and end (end exclusive),
+        in document order
+
+    """
+    sections: List[Dict[str, Any]] = []
+    open_sections: List[Dict[str, Any]] = []
+    slug_counts: Dict[str, int] = {}
+
+    for start, line in iter_lines(content):
+        heading = parse_heading(line)
+        if not heading:
+            continue
+        level, title = heading
+
+        while open_sections and open_sections[-1]["level"] >= level:
+            open_sections.pop()["end"] = start
+
+        slug = slugify(title)
+        count = slug_counts.get(slug, 0)
+        slug_counts[slug] = count + 1
+        section = {
+            "slug": f"{slug}-{count}" if count else slug,
+            "title": title,
+            "level": level,
+            "start": start,
+            "end": None,
+        }
+        sections.append(section)
+        open_sections.append(section)
+
+    size = len(content.encode("utf-8"))
+    for section in open_sections:
+        section["end"] = size
+    return sections
@@ -1,17 +1,58 @@
 """Base class for workflow phase handlers."""
+import asyncio
 import json
+import logging
+import time
 from abc import ABC, abstractmethod
+from contextlib import nullcontext
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    ContextManager,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+)
 from uuid import UUID
 
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker
 
+from app.config import settings
 from app.db.models import LLMLog, WorkflowState
+from app.db.session import session_scope
 from app.services.langfuse_service import LangFuseTracker, is_langfuse_enabled
 from app.services.llm_service import LLMResponse, llm_service
+from app.services.model_catalog import DEFAULT_ROLE
+from app.workflow import profiler as spans
+from app.workflow.budget import choose_model
+from app.workflow.cancellation import WorkflowCancelledError
+from app.workflow.profiler import Span, WorkflowProfiler
+from app.workflow.retry import RetryPolicy
 from app.workflow.state_machine import PhaseStatus, WorkflowPhase
+from app.workflow.structured_output import (
+    ModelT,
+    StructuredOutputError,
+    build_repair_prompt,
+    json_schema_response_format,
+    parse_structured,
+)
+from app.workflow.validators import (
+    DocumentCheck,
+    JsonStreamValidator,
+    OffTrackOutputError,
+    SectionReport,
+    StreamValidator,
+    first_passing_document,
+)
+
+logger = logging.getLogger(__name__)
 
 
 class PhaseResult:
@@ -24,34 +65,175 @@ class PhaseResult:
         output_data: Dict[str, Any],
         error_message: Optional[str] = None,
         llm_response: Optional[LLMResponse] = None,
+        additional_llm_responses: Optional[List[LLMResponse]] = None,
+        alternates: Optional[List[Tuple[str, Dict[str, Any]]]] = None,
     ):
         self.phase = phase
         self.success = success
         self.output_data = output_data
         self.error_message = error_message
         self.llm_response = llm_response
+        # Other LLM calls made by the phase (retries, helper calls)
+        self.additional_llm_responses = additional_llm_responses or []
+        # Unselected variants as (content, attributes); saved as document versions, not in the state
+        self.alternates = alternates or []
+
+    @property
+    def total_cost_usd(self) -> float:
+        """Combined cost of all LLM calls made by the phase."""
+        responses = ([self.llm_response] if self.llm_response else []) + self.additional_llm_responses
+        return sum(response.cost_usd for response in responses)
+
+
+@dataclass
+class Variant:
+    """One candidate output of a multi-variant generation."""
+
+    model: str
+    temperature: float
+    llm_response: LLMResponse
+    section_report: Optional[SectionReport]
+    score: float = 0.0
+
+    def to_dict(self, include_content: bool = True) -> Dict[str, Any]:
+        """Convert variant to a JSON-serializable dict."""
+        data: Dict[str, Any] = {
+            "model": self.model,
+            "temperature": self.temperature,
+            "score": self.score,
+            "cost_usd": round(self.llm_response.cost_usd, 6),
+        }
+        if self.section_report is not None:
+            data["sections"] = self.section_report.to_dict()
+        if include_content:
+            data["content"] = self.llm_response.content
+        return data
+
+
+def variant_specs(
+    model: str, temperature: float, count: int, models: Optional[Sequence[str]] = None
+) -> List[Tuple[str, float]]:
+    """Build (model, temperature) pairs for a multi-variant generation.
+
+    The first variant uses the phase defaults; the others alternate around the
+    base temperature and cycle through the optional alternative models.
+
+    Args:
+        model: Default model of the phase
+        temperature: Default temperature of the phase
+        count: Number of variants
+        models: Optional models to cycle through (the default model first if omitted)
+
+    Returns:
+        List of (model, temperature) pairs
+
+    """
+    pool = list(models) if models else [model]
+    specs = []
+    for index in range(count):
+        offset = ((index + 1) // 2) * 0.15 * (1 if index % 2 else -1)
+        specs.append((pool[index % len(pool)], round(min(max(temperature + offset, 0.0), 1.2), 2)))
+    return specs
+
+
+class GenerationAbortedError(Exception):
+    """Raised when a streamed generation is aborted by its validator."""
+
+    def __init__(self, reason: str, llm_response: LLMResponse):
+        super().__init__(reason)
+        self.reason = reason
+        self.llm_response = llm_response
 
 
 class BasePhaseHandler(ABC):
-    """Base class for all phase handlers."""
+    """Base class for all phase handlers.
+
+    Handlers hold no database session: each persistence step opens a
+    short-lived one, so no pooled connection is checked out while the phase
+    waits on the LLM.
+    """
 
     def __init__(
         self,
-        db: AsyncSession,
+        session_factory: async_sessionmaker,
         project_id: UUID,
         tracker: Optional[LangFuseTracker] = None,
+        profiler: Optional[WorkflowProfiler] = None,
     ):
         """Initialize phase handler.
 
         Args:
-            db: Database session
+            session_factory: Factory of the sessions used for persistence steps
             project_id: Project UUID
             tracker: Optional LangFuse tracker
+            profiler: Optional workflow profiler
 
         """
-        self.db = db
+        self.session_factory = session_factory
         self.project_id = project_id
         self.tracker = tracker
+        self.profiler = profiler
+        # Request currently awaiting the LLM, used to estimate the cost of cancelled calls
+        self.in_flight_request: Optional[Dict[str, Any]] = None
+        # Every LLM response received by this handler, logged after the phase runs
+        self.llm_responses: List[LLMResponse] = []
+        # Called before a retry with (failed attempt, max attempts, delay seconds, error)
+        self.on_retry: Optional[Callable[[int, int, float, BaseException], Awaitable[None]]] = None
+        # Event loop time by which the whole workflow must finish (None = no deadline)
+        self.deadline: Optional[float] = None
+        # Workflow budget (None = unlimited) and the spend logged before the current attempt
+        self.budget_usd: Optional[float] = None
+        self.logged_cost_usd = 0.0
+        # Start of the workflow run; spend logged before it belongs to earlier runs
+        self.run_started_at: Optional[datetime] = None
+        # Pre-flight estimates of the calls currently in flight
+        self.reserved_cost_usd = 0.0
+        # Called with a description of every call moved to a cheaper model
+        self.on_model_downgraded: Optional[Callable[[Dict[str, Any]], Awaitable[None]]] = None
+
+    def remaining_time(self) -> Optional[float]:
+        """Get the seconds left until the workflow deadline.
+
+        Returns:
+            Remaining seconds (0 if passed) or None without a deadline
+
+        """
+        if self.deadline is None:
+            return None
+        return max(self.deadline - asyncio.get_running_loop().time(), 0.0)
+
+    def _deadline_exceeded(self) -> WorkflowCancelledError:
+        """Build the error raised when an LLM call hits the workflow deadline."""
+        return WorkflowCancelledError("Workflow deadline exceeded")
+
+    def span(self, name: str, category: str, **attributes: Any) -> ContextManager[Optional[Span]]:
+        """Time a block of code in the workflow profiler (no-op without a profiler).
+
+        Args:
+            name: Span name
+            category: Span category
+            **attributes: Extra span attributes
+
+        Returns:
+            Context manager yielding the Span (or None)
+
+        """
+        if not self.profiler:
+            return nullcontext()
+        return self.profiler.span(name, category, **attributes)
+
+    def _record_request_timings(self, span: Optional[Span], llm_response: LLMResponse) -> None:
+        """Record connect/TTFB/body sub-spans of an LLM request."""
+        if not self.profiler or span is None:
+            return
+        for stage, (start_ms, end_ms) in llm_response.timings.items():
+            self.profiler.record(
+                f"llm_{stage}",
+                spans.LLM,
+                span.start_ms + start_ms,
+                span.start_ms + end_ms,
+                parent=span,
+            )
 
     @abstractmethod
     async def execute(self, input_data: Dict[str, Any]) -> PhaseResult:
@@ -76,13 +258,35 @@ class BasePhaseHandler(ABC):
         """
         pass
 
+    def model_for(self, role: str = DEFAULT_ROLE) -> str:
+        """Get the model the model catalog routes a call of this phase to.
+
+        Args:
+            role: Call within the phase (e.g., "approach_detection")
+
+        Returns:
+            Model identifier
+
+        """
+        return llm_service.catalog.model_for(self.get_phase_name().value, role)
+
+    def get_retry_policy(self) -> RetryPolicy:
+        """Get the retry policy for transient errors of this phase.
+
+        Returns:
+            RetryPolicy (settings defaults plus per-phase overrides)
+
+        """
+        return RetryPolicy.for_phase(self.get_phase_name().value)
+
     async def create_workflow_state(
-        self, input_data: Dict[str, Any]
+        self, input_data: Dict[str, Any], attempt: int = 1
     ) -> WorkflowState:
         """Create a workflow state record for this phase.
 
         Args:
             input_data: Input data for this phase
+            attempt: Attempt number of the phase (1-based)
 
         Returns:
             Created WorkflowState
@@ -93,11 +297,12 @@ class BasePhaseHandler(ABC):
             phase=self.get_phase_name().value,
             status=PhaseStatus.IN_PROGRESS.value,
             input_data=input_data,
+            attempt=attempt,
             started_at=datetime.utcnow(),
         )
-        self.db.add(workflow_state)
-        await self.db.commit()
-        await self.db.refresh(workflow_state)
+        with self.span("create_workflow_state", spans.DB):
+            async with session_scope(self.session_factory) as db:
+                db.add(workflow_state)
         return workflow_state
 
     async def update_workflow_state(
@@ -106,43 +311,49 @@ class BasePhaseHandler(ABC):
         status: PhaseStatus,
         output_data: Optional[Dict[str, Any]] = None,
         error_message: Optional[str] = None,
+        llm_logs: Sequence[LLMLog] = (),
     ) -> None:
-        """Update workflow state.
+        """Update workflow state, saving the LLM logs of the attempt in the same transaction.
 
         Args:
             workflow_state: WorkflowState to update
             status: New status
             output_data: Optional output data
             error_message: Optional error message
+            llm_logs: LLM logs to save (see ``build_llm_log``)
 
         """
-        workflow_state.status = status.value
-        workflow_state.output_data = output_data
-        workflow_state.error_message = error_message
-        workflow_state.completed_at = datetime.utcnow()
-
-        await self.db.commit()
-
-    async def save_llm_log(
+        with self.span("update_workflow_state", spans.DB, llm_logs=len(llm_logs)):
+            async with session_scope(self.session_factory) as db:
+                # Re-attach the state created in an earlier session
+                db.add(workflow_state)
+                workflow_state.status = status.value
+                workflow_state.output_data = output_data
+                workflow_state.error_message = error_message
+                workflow_state.completed_at = datetime.utcnow()
+                db.add_all(llm_logs)
+
+    def build_llm_log(
         self,
         workflow_state_id: UUID,
-        phase: str,
         llm_response: LLMResponse,
         langfuse_trace_id: Optional[str] = None,
-    ) -> None:
-        """Save LLM log to database.
+    ) -> LLMLog:
+        """Build the LLM log of a response of this phase.
 
         Args:
             workflow_state_id: WorkflowState UUID
-            phase: Phase name
             llm_response: LLM response with usage data
             langfuse_trace_id: Optional LangFuse trace ID
 
+        Returns:
+            LLMLog (not yet added to a session)
+
         """
-        llm_log = LLMLog(
+        return LLMLog(
             project_id=self.project_id,
             workflow_state_id=workflow_state_id,
-            phase=phase,
+            phase=self.get_phase_name().value,
             model=llm_response.model,
             langfuse_trace_id=langfuse_trace_id,
             prompt_tokens=llm_response.usage["prompt_tokens"],
@@ -151,8 +362,80 @@ class BasePhaseHandler(ABC):
             cost_usd=llm_response.cost_usd,
             latency_ms=llm_response.latency_ms,
         )
-        self.db.add(llm_log)
-        await self.db.commit()
+
+    async def load_logged_cost(self) -> float:
+        """Load the LLM spend of the current workflow run logged so far.
+
+        Returns:
+            Cost in USD (of the whole project if the run start is unknown)
+
+        """
+        statement = select(func.coalesce(func.sum(LLMLog.cost_usd), 0)).where(
+            LLMLog.project_id == self.project_id
+        )
+        if self.run_started_at is not None:
+            statement = statement.where(LLMLog.created_at >= self.run_started_at)
+
+        with self.span("load_logged_cost", spans.DB):
+            async with session_scope(self.session_factory) as db:
+                result = await db.execute(statement)
+                return float(result.scalar_one())
+
+    async def select_model(
+        self, model: str, prompt: str, max_tokens: int, system_message: Optional[str] = None
+    ) -> Tuple[str, float]:
+        """Pick the model of a call so that the workflow stays within its budget.
+
+        The running spend (logged calls, calls of this attempt and the
+        estimates of calls in flight) plus the pre-flight estimate of this call
+        is compared with the budget; if it would be exceeded, the call is moved
+        down ``MODEL_DOWNGRADES`` until it fits.
+
+        Args:
+            model: Requested model
+            prompt: User prompt
+            max_tokens: Maximum tokens
+            system_message: Optional system message
+
+        Returns:
+            Tuple of (model to call, pre-flight cost estimate)
+
+        Raises:
+            BudgetExceededError: If the budget is already spent
+
+        """
+        if self.budget_usd is None:
+            return model, 0.0
+
+        spent = (
+            self.logged_cost_usd
+            + sum(response.cost_usd for response in self.llm_responses)
+            + self.reserved_cost_usd
+        )
+        choice = choose_model(
+            model,
+            spent,
+            self.budget_usd,
+            lambda candidate: llm_service.estimate_cost(candidate, prompt, max_tokens, system_message),
+            settings.MODEL_DOWNGRADES,
+            llm_service.catalog.models,
+        )
+        if choice.downgraded:
+            logger.warning(
+                f"{self.get_phase_name().value} for project {self.project_id}: {model} would exceed "
+                f"the ${self.budget_usd:.4f} budget, using {choice.model}"
+            )
+            if self.on_model_downgraded:
+                await self.on_model_downgraded(
+                    {
+                        "phase": self.get_phase_name().value,
+                        "requested_model": model,
+                        "model": choice.model,
+                        "projected_cost_usd": round(choice.projected_cost_usd, 6),
+                        "budget_usd": self.budget_usd,
+                    }
+                )
+        return choice.model, choice.projected_cost_usd - spent
 
     async def call_llm(
         self,
@@ -160,7 +443,7 @@ class BasePhaseHandler(ABC):
         prompt: str,
         temperature: float = 0.7,
         max_tokens: int = 4000,
-        response_format: Optional[Dict[str, str]] = None,
+        response_format: Optional[Dict[str, Any]] = None,
         system_message: Optional[str] = None,
     ) -> LLMResponse:
         """Call LLM and handle errors.
@@ -177,16 +460,293 @@ class BasePhaseHandler(ABC):
             LLMResponse
 
         Raises:
+            BudgetExceededError: If the workflow budget is already spent
+            WorkflowCancelledError: If the workflow deadline expired during the call
             Exception: If LLM call fails
 
         """
-        return await llm_service.call(
-            model=model,
-            prompt=prompt,
-            temperature=temperature,
-            max_tokens=max_tokens,
-            response_format=response_format,
-            system_message=system_message,
+        model, estimate = await self.select_model(model, prompt, max_tokens, system_message)
+        self.in_flight_request = {"model": model, "prompt": prompt, "system_message": system_message}
+        self.reserved_cost_usd += estimate
+        try:
+            with self.span("llm_request", spans.LLM, model=model) as span:
+                llm_response = await llm_service.call(
+                    model=model,
+                    prompt=prompt,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    response_format=response_format,
+                    system_message=system_message,
+                    timeout=self.remaining_time(),
+                )
+        except TimeoutError as e:
+            raise self._deadline_exceeded() from e
+        finally:
+            # Cleared however the request ends (success, error, timeout or cancellation)
+            self.in_flight_request = None
+            self.reserved_cost_usd -= estimate
+        self.llm_responses.append(llm_response)
+        self._record_request_timings(span, llm_response)
+        return llm_response
+
+    async def call_llm_streaming(
+        self,
+        model: str,
+        prompt: str,
+        validator: StreamValidator,
+        temperature: float = 0.7,
+        max_tokens: int = 4000,
+        system_message: Optional[str] = None,
+        response_format: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[LLMResponse, Optional[SectionReport]]:
+        """Call LLM with streaming and validate the output as it arrives.
+
+        Args:
+            model: Model identifier
+            prompt: User prompt
+            validator: Streaming validator fed with every delta
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens
+            system_message: Optional system message
+            response_format: Optional response format
+
+        Returns:
+            Tuple of (LLMResponse, SectionReport or None)
+
+        Raises:
+            GenerationAbortedError: If the validator aborted the generation
+            BudgetExceededError: If the workflow budget is already spent
+            WorkflowCancelledError: If the workflow deadline expired during the call
+            Exception: If LLM call fails
+
+        """
+        requested_model = model
+        model, estimate = await self.select_model(model, prompt, max_tokens, system_message)
+        if model != requested_model and response_format:
+            # The cheaper model may not support the requested output mode
+            if response_format.get("type") == "json_schema" and not llm_service.supports_json_schema(model):
+                response_format = {"type": "json_object"}
+            if not llm_service.supports_json_mode(model):
+                response_format = None
+
+        start_time = time.time()
+        received: List[str] = []
+
+        def on_delta(delta: str) -> None:
+            received.append(delta)
+            validator.feed(delta)
+
+        self.in_flight_request = {"model": model, "prompt": prompt, "system_message": system_message}
+        self.reserved_cost_usd += estimate
+        try:
+            with self.span("llm_request", spans.LLM, model=model, streaming=True) as span:
+                llm_response = await llm_service.call_streaming(
+                    model=model,
+                    prompt=prompt,
+                    on_delta=on_delta,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    response_format=response_format,
+                    system_message=system_message,
+                    timeout=self.remaining_time(),
+                )
+            self._record_request_timings(span, llm_response)
+        except TimeoutError as e:
+            raise self._deadline_exceeded() from e
+        except OffTrackOutputError as e:
+            # Stream was closed early - bill the partial output by estimate
+            partial = "".join(received)
+            usage = llm_service.estimate_usage(prompt, partial, system_message)
+            partial_response = LLMResponse(
+                content=partial,
+                model=model,
+                usage=usage,
+                cost_usd=llm_service._calculate_cost(model, usage),
+                latency_ms=int((time.time() - start_time) * 1000),
+                raw_response={"aborted": True, "reason": e.reason},
+            )
+            self.llm_responses.append(partial_response)
+            raise GenerationAbortedError(e.reason, partial_response) from e
+        finally:
+            self.in_flight_request = None
+            self.reserved_cost_usd -= estimate
+
+        self.llm_responses.append(llm_response)
+        try:
+            with self.span("validate_output", spans.VALIDATE):
+                report = validator.finish()
+        except OffTrackOutputError as e:
+            raise GenerationAbortedError(e.reason, llm_response) from e
+
+        return llm_response, report
+
+    async def call_llm_structured(
+        self,
+        model: str,
+        prompt: str,
+        schema: Type[ModelT],
+        temperature: float = 0.3,
+        max_tokens: int = 500,
+        system_message: Optional[str] = None,
+    ) -> Tuple[ModelT, LLMResponse]:
+        """Call LLM in structured output mode and parse the result into a schema.
+
+        Models that support it get the JSON schema as ``response_format``; others
+        get plain JSON mode. The stream is aborted as soon as the output is not
+        JSON. Invalid output is first repaired locally (code fences, truncation,
+        trailing commas); only if that fails is one targeted retry made.
+
+        Args:
+            model: Model identifier
+            prompt: User prompt
+            schema: Pydantic model describing the expected output
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens
+            system_message: Optional system message
+
+        Returns:
+            Tuple of (parsed model instance, LLMResponse of the successful attempt)
+
+        Raises:
+            StructuredOutputError: If the output is still invalid after the retry
+            Exception: If LLM call fails
+
+        """
+        response_format: Optional[Dict[str, Any]] = None
+        if llm_service.supports_json_schema(model):
+            response_format = json_schema_response_format(schema)
+        elif llm_service.supports_json_mode(model):
+            response_format = {"type": "json_object"}
+
+        attempt_prompt = prompt
+        for attempt in range(2):
+            try:
+                llm_response, _ = await self.call_llm_streaming(
+                    model=model,
+                    prompt=attempt_prompt,
+                    validator=JsonStreamValidator(),
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    system_message=system_message,
+                    response_format=response_format,
+                )
+            except GenerationAbortedError as e:
+                error, raw_output = e.reason, e.llm_response.content
+            else:
+                try:
+                    with self.span("parse_json", spans.PARSE, attempt=attempt + 1):
+                        return parse_structured(llm_response.content, schema), llm_response
+                except StructuredOutputError as e:
+                    error, raw_output = str(e), e.raw_output
+
+            if attempt == 0:
+                attempt_prompt = build_repair_prompt(prompt, schema, error, raw_output)
+
+        raise StructuredOutputError(error, raw_output)
+
+    async def call_llm_variants(
+        self,
+        model: str,
+        prompt: str,
+        validator_factory: Callable[[], StreamValidator],
+        scorer: Callable[[str, Optional[SectionReport]], float],
+        count: int = 1,
+        models: Optional[Sequence[str]] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 4000,
+        system_message: Optional[str] = None,
+    ) -> List[Variant]:
+        """Generate several candidate outputs concurrently and rank them.
+
+        Args:
+            model: Default model
+            prompt: User prompt
+            validator_factory: Creates a fresh streaming validator per variant
+            scorer: Local scoring function (content, section report) -> score
+            count: Number of variants to generate
+            models: Optional alternative models to cycle through
+            temperature: Base sampling temperature
+            max_tokens: Maximum tokens per variant
+            system_message: Optional system message
+
+        Returns:
+            Successful variants, best first
+
+        Raises:
+            GenerationAbortedError: If every variant was aborted
+            Exception: If every variant failed
+
+        """
+
+        async def generate(variant_model: str, variant_temperature: float) -> Variant:
+            llm_response, report = await self.call_llm_streaming(
+                model=variant_model,
+                prompt=prompt,
+                validator=validator_factory(),
+                temperature=variant_temperature,
+                max_tokens=max_tokens,
+                system_message=system_message,
+            )
+            with self.span("score_variant", spans.VALIDATE, model=variant_model):
+                score = scorer(llm_response.content, report)
+            return Variant(
+                model=variant_model,
+                temperature=variant_temperature,
+                llm_response=llm_response,
+                section_report=report,
+                score=score,
+            )
+
+        specs = variant_specs(model, temperature, max(count, 1), models)
+        results = await asyncio.gather(
+            *(generate(variant_model, variant_temperature) for variant_model, variant_temperature in specs),
+            return_exceptions=True,
+        )
+
+        variants = [result for result in results if isinstance(result, Variant)]
+        if not variants:
+            raise results[0]
+
+        # Stable sort keeps the default variant first on ties
+        return sorted(variants, key=lambda variant: variant.score, reverse=True)
+
+    def select_variant(
+        self, variants: List[Variant], check: DocumentCheck
+    ) -> Tuple[Optional[Variant], List[Variant], Optional[str]]:
+        """Pick the best-scored variant that passes a document check.
+
+        Args:
+            variants: Variants, best score first
+            check: Length and keyword check of the phase
+
+        Returns:
+            Tuple of (winner, other variants in score order, None), or
+            (None, variants, failure of the best variant) if none passes
+
+        """
+        index, error = first_passing_document(
+            check, [variant.llm_response.content for variant in variants], self.profiler
+        )
+        if index is None:
+            return None, variants, error
+        return variants[index], variants[:index] + variants[index + 1 :], None
+
+    def aborted_result(self, error: GenerationAbortedError) -> PhaseResult:
+        """Build a failed PhaseResult for an aborted generation.
+
+        Args:
+            error: Abort error carrying the partial LLM response
+
+        Returns:
+            Failed PhaseResult (the partial response is kept for cost logging)
+
+        """
+        return PhaseResult(
+            phase=self.get_phase_name(),
+            success=False,
+            output_data={"aborted": True},
+            error_message=f"Generation aborted early: {error.reason}",
+            llm_response=error.llm_response,
         )
 
     def track_phase_in_langfuse(
@@ -232,7 +792,11 @@ class BasePhaseHandler(ABC):
     async def run_with_state_tracking(
         self, input_data: Dict[str, Any]
     ) -> PhaseResult:
-        """Run the phase with automatic state tracking.
+        """Run the phase with automatic state tracking and retries.
+
+        Transient errors (see ``get_retry_policy``) are retried with
+        exponential backoff; every attempt gets its own workflow state and
+        LLM logs.
 
         Args:
             input_data: Input data for this phase
@@ -240,23 +804,69 @@ class BasePhaseHandler(ABC):
         Returns:
             PhaseResult
 
+        """
+        policy = self.get_retry_policy()
+        started = time.monotonic()
+        # LLM calls of failed attempts (already logged), counted in the phase cost
+        failed_attempt_responses: List[LLMResponse] = []
+        attempt = 1
+
+        while True:
+            self.llm_responses = []
+            if self.budget_usd is not None:
+                self.logged_cost_usd = await self.load_logged_cost()
+            result, error, workflow_state = await self._run_attempt(input_data, attempt)
+            if error is None:
+                result.additional_llm_responses.extend(failed_attempt_responses)
+                return result
+
+            failed_attempt_responses.extend(self.llm_responses)
+            delay = policy.next_delay(attempt, error, time.monotonic() - started)
+            remaining = self.remaining_time()
+            if delay is not None and remaining is not None and delay >= remaining:
+                # The workflow deadline would pass before the next attempt
+                delay = None
+            if delay is None:
+                # Track error in LangFuse if available
+                if self.tracker:
+                    self.tracker.track_event(
+                        event_name=f"{self.get_phase_name().value}_failed",
+                        metadata={"error": str(error), "attempts": attempt},
+                    )
+                return result
+
+            logger.warning(
+                f"{self.get_phase_name().value} attempt {attempt}/{policy.max_attempts} for project "
+                f"{self.project_id} failed ({type(error).__name__}: {error}), retrying in {delay:.1f}s"
+            )
+            if self.on_retry:
+                await self.on_retry(attempt, policy.max_attempts, delay, error)
+            with self.span("retry_backoff", spans.PHASE, attempt=attempt):
+                await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _run_attempt(
+        self, input_data: Dict[str, Any], attempt: int
+    ) -> Tuple[PhaseResult, Optional[Exception], WorkflowState]:
+        """Run one attempt of the phase with its own workflow state.
+
+        Args:
+            input_data: Input data for this phase
+            attempt: Attempt number (1-based)
+
+        Returns:
+            Tuple of (result, error raised by the attempt or None, workflow state)
+
         """
         # Create workflow state
-        workflow_state = await self.create_workflow_state(input_data)
+        workflow_state = await self.create_workflow_state(input_data, attempt)
 
         try:
             # Execute phase
             result = await self.execute(input_data)
 
-            # Update workflow state
-            await self.update_workflow_state(
-                workflow_state,
-                PhaseStatus.COMPLETED if result.success else PhaseStatus.FAILED,
-                output_data=result.output_data,
-                error_message=result.error_message,
-            )
-
-            # Save LLM log if available
+            # LLM log of the main call, if available
+            llm_logs = []
             if result.llm_response:
                 langfuse_trace_id = None
                 if result.success and self.tracker:
@@ -267,34 +877,56 @@ class BasePhaseHandler(ABC):
                         output_data=result.output_data,
                         llm_response=result.llm_response,
                     )
-
-                await self.save_llm_log(
-                    workflow_state.id,
-                    self.get_phase_name().value,
-                    result.llm_response,
-                    langfuse_trace_id,
+                llm_logs.append(
+                    self.build_llm_log(workflow_state.id, result.llm_response, langfuse_trace_id)
                 )
 
-            return result
+            # LLM logs for the other calls made by the phase (retries, helper calls)
+            result.additional_llm_responses = [
+                response for response in self.llm_responses if response is not result.llm_response
+            ]
+            llm_logs.extend(
+                self.build_llm_log(workflow_state.id, response) for response in result.additional_llm_responses
+            )
+
+            # Update workflow state and save the logs in one transaction
+            await self.update_workflow_state(
+                workflow_state,
+                PhaseStatus.COMPLETED if result.success else PhaseStatus.FAILED,
+                output_data=result.output_data,
+                error_message=result.error_message,
+                llm_logs=llm_logs,
+            )
+
+            return result, None, workflow_state
+
+        except (asyncio.CancelledError, WorkflowCancelledError) as e:
+            # Phase was cancelled (discarded speculation, cancelled workflow or deadline) -
+            # close the state, keeping the calls already billed, then propagate
+            await self.update_workflow_state(
+                workflow_state,
+                PhaseStatus.CANCELLED,
+                error_message=str(e) or "Cancelled",
+                llm_logs=[self.build_llm_log(workflow_state.id, response) for response in self.llm_responses],
+            )
+            raise
 
         except Exception as e:
-            # Update workflow state with error
+            # Update workflow state with error; calls completed before the error were still billed
             await self.update_workflow_state(
                 workflow_state,
                 PhaseStatus.FAILED,
                 error_message=str(e),
+                llm_logs=[self.build_llm_log(workflow_state.id, response) for response in self.llm_responses],
             )
 
-            # Track error in LangFuse if available
-            if self.tracker:
-                self.tracker.track_event(
-                    event_name=f"{self.get_phase_name().value}_failed",
-                    metadata={"error": str(e)},
-                )
-
-            return PhaseResult(
-                phase=self.get_phase_name(),
-                success=False,
-                output_data={},
-                error_message=str(e),
+            return (
+                PhaseResult(
+                    phase=self.get_phase_name(),
+                    success=False,
+                    output_data={},
+                    error_message=str(e),
+                ),
+                e,
+                workflow_state,
             )
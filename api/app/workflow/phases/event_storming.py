@@ -2,8 +2,10 @@
 from typing import Any, Dict
 
 from app.services.prompt_manager import prompt_manager
+from app.workflow import profiler as spans
 from app.workflow.phases.base import BasePhaseHandler, PhaseResult
 from app.workflow.state_machine import WorkflowPhase
+from app.workflow.validators import EVENT_STORMING_CHECK, check_document
 
 
 class EventStormingPhase(BasePhaseHandler):
@@ -26,7 +28,8 @@ class EventStormingPhase(BasePhaseHandler):
         idea = input_data.get("idea", "")
 
         # Get Event Storming prompt
-        base_prompt = prompt_manager.get_event_storming_prompt(idea)
+        with self.span("render_prompt", spans.RENDER):
+            base_prompt = prompt_manager.get_event_storming_prompt(idea)
 
         # Create autonomous version of the prompt for API
         # In the interactive version, the LLM asks questions and waits
@@ -50,9 +53,9 @@ type of project.
 Generate the complete Event Storming Summary Document now with all 10 sections.
 """
 
-        # Call LLM (using Claude for structured thinking)
+        # Call LLM (model from the catalog routing, Claude by default for structured thinking)
         llm_response = await self.call_llm(
-            model="anthropic/claude-3.5-sonnet",
+            model=self.model_for(),
             prompt=autonomous_prompt,
             temperature=0.7,
             max_tokens=4000,
@@ -63,12 +66,13 @@ Generate the complete Event Storming Summary Document now with all 10 sections.
         event_storming_md = llm_response.content
 
         # Validate that it looks like a proper document
-        if len(event_storming_md) < 500:
+        error = check_document(EVENT_STORMING_CHECK, event_storming_md, self.profiler)
+        if error:
             return PhaseResult(
                 phase=self.get_phase_name(),
                 success=False,
                 output_data={},
-                error_message="Event Storming summary too short - likely generation failed",
+                error_message=error,
                 llm_response=llm_response,
             )
 
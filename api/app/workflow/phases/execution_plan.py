@@ -1,10 +1,21 @@
 """Execution Plan phase - generate staged handoff plan."""
-import json
+import logging
 from typing import Any, Dict
 
+from app.schemas.workflow import ApproachDetectionResult
 from app.services.prompt_manager import prompt_manager
-from app.workflow.phases.base import BasePhaseHandler, PhaseResult
+from app.workflow import profiler as spans
+from app.workflow.phases.base import BasePhaseHandler, GenerationAbortedError, PhaseResult
 from app.workflow.state_machine import WorkflowPhase
+from app.workflow.structured_output import StructuredOutputError
+from app.workflow.validators import (
+    EXECUTION_PLAN_CHECK,
+    EXECUTION_PLAN_SECTIONS,
+    MarkdownStreamValidator,
+    score_document,
+)
+
+logger = logging.getLogger(__name__)
 
 
 class ExecutionPlanPhase(BasePhaseHandler):
@@ -25,31 +36,23 @@ class ExecutionPlanPhase(BasePhaseHandler):
 
         """
         # Get approach detection prompt
-        prompt = prompt_manager.get_approach_detection_prompt(prd_md)
-
-        # Call LLM (using GPT-4o-mini for fast decision)
-        llm_response = await self.call_llm(
-            model="openai/gpt-4o-mini",
-            prompt=prompt,
-            temperature=0.3,
-            max_tokens=300,
-            response_format={"type": "json_object"},
-        )
+        with self.span("render_prompt", spans.RENDER):
+            prompt = prompt_manager.get_approach_detection_prompt(prd_md)
 
-        # Parse JSON response
+        # Call LLM in structured output mode (GPT-4o-mini by default for a fast decision)
         try:
-            detection_result = json.loads(llm_response.content)
-            approach = detection_result.get("approach", "HORIZONTAL")
-
-            # Validate approach
-            if approach not in ["HORIZONTAL", "VERTICAL"]:
-                # Default to VERTICAL if invalid
-                approach = "VERTICAL"
-
-            return approach
+            detection_result, _ = await self.call_llm_structured(
+                model=self.model_for("approach_detection"),
+                prompt=prompt,
+                schema=ApproachDetectionResult,
+                temperature=0.3,
+                max_tokens=300,
+            )
+            return detection_result.approach
 
-        except (json.JSONDecodeError, ValueError):
+        except StructuredOutputError as e:
             # Default to VERTICAL on error (safer approach)
+            logger.warning(f"Approach detection failed, defaulting to VERTICAL: {e}")
             return "VERTICAL"
 
     async def execute(self, input_data: Dict[str, Any]) -> PhaseResult:
@@ -58,7 +61,9 @@ class ExecutionPlanPhase(BasePhaseHandler):
         Args:
             input_data: {
                 "prd_md": str,
-                "tech_stack_md": str
+                "tech_stack_md": str,
+                "variants": Optional[int],
+                "variant_models": Optional[List[str]]
             }
 
         Returns:
@@ -80,40 +85,40 @@ class ExecutionPlanPhase(BasePhaseHandler):
         approach = await self._detect_approach(prd_md)
 
         # Get Execution Plan prompt with detected approach
-        prompt = prompt_manager.get_stages_prompt(prd_md, tech_stack_md, approach)
-
-        # Call LLM (using Claude for granular planning)
-        llm_response = await self.call_llm(
-            model="anthropic/claude-3.5-sonnet",
-            prompt=prompt,
-            temperature=0.6,
-            max_tokens=4000,
-            system_message="You are an expert at creating detailed, granular execution plans for AI coding agents.",
-        )
-
-        execution_plan_md = llm_response.content
+        with self.span("render_prompt", spans.RENDER):
+            prompt = prompt_manager.get_stages_prompt(prd_md, tech_stack_md, approach)
 
-        # Validate Execution Plan
-        if len(execution_plan_md) < 1000:
-            return PhaseResult(
-                phase=self.get_phase_name(),
-                success=False,
-                output_data={},
-                error_message="Execution Plan too short - likely generation failed",
-                llm_response=llm_response,
+        # Call LLM (Claude by default for granular planning), ranking variants by task density
+        try:
+            variants = await self.call_llm_variants(
+                model=self.model_for(),
+                prompt=prompt,
+                validator_factory=lambda: MarkdownStreamValidator(expected_sections=EXECUTION_PLAN_SECTIONS),
+                scorer=lambda content, report: score_document(
+                    content, report, target_chars=10000, task_weight=0.4
+                ),
+                count=input_data.get("variants", 1),
+                models=input_data.get("variant_models"),
+                temperature=0.6,
+                max_tokens=4000,
+                system_message="You are an expert at creating detailed, granular execution plans for AI coding agents.",
             )
+        except GenerationAbortedError as e:
+            return self.aborted_result(e)
 
-        # Check for required elements
-        required_keywords = ["Stage", "Task", "[", "]"]  # Check for stages, tasks, and checkboxes
-        missing_elements = [kw for kw in required_keywords if kw not in execution_plan_md]
-        if missing_elements:
+        # Validate Execution Plan (length, stages, tasks and checkboxes),
+        # falling back to the next-best variant when the top-scored one fails
+        winner, others, error = self.select_variant(variants, EXECUTION_PLAN_CHECK)
+        if winner is None:
             return PhaseResult(
                 phase=self.get_phase_name(),
                 success=False,
                 output_data={},
-                error_message=f"Execution Plan missing required elements: {', '.join(missing_elements)}",
-                llm_response=llm_response,
+                error_message=error,
+                llm_response=variants[0].llm_response,
             )
+        llm_response = winner.llm_response
+        execution_plan_md = llm_response.content
 
         return PhaseResult(
             phase=self.get_phase_name(),
@@ -121,6 +126,12 @@ class ExecutionPlanPhase(BasePhaseHandler):
             output_data={
                 "execution_plan_md": execution_plan_md,
                 "approach": approach,
+                "sections": winner.section_report.to_dict() if winner.section_report else {},
+                "score": winner.score,
+                "alternates": [variant.to_dict(include_content=False) for variant in others],
             },
             llm_response=llm_response,
+            alternates=[
+                (variant.llm_response.content, variant.to_dict(include_content=False)) for variant in others
+            ],
         )
@@ -2,8 +2,15 @@
 from typing import Any, Dict, Optional
 
 from app.services.prompt_manager import prompt_manager
-from app.workflow.phases.base import BasePhaseHandler, PhaseResult
+from app.workflow import profiler as spans
+from app.workflow.phases.base import BasePhaseHandler, GenerationAbortedError, PhaseResult
 from app.workflow.state_machine import WorkflowPhase
+from app.workflow.validators import (
+    PRD_CHECK,
+    PRD_SECTIONS,
+    MarkdownStreamValidator,
+    score_document,
+)
 
 
 class PRDGenerationPhase(BasePhaseHandler):
@@ -19,7 +26,9 @@ class PRDGenerationPhase(BasePhaseHandler):
         Args:
             input_data: {
                 "idea": str,
-                "event_storming_summary": Optional[str]
+                "event_storming_summary": Optional[str],
+                "variants": Optional[int],
+                "variant_models": Optional[List[str]]
             }
 
         Returns:
@@ -30,7 +39,8 @@ class PRDGenerationPhase(BasePhaseHandler):
         event_storming_summary = input_data.get("event_storming_summary")
 
         # Get INIT prompt
-        base_prompt = prompt_manager.get_init_prompt(idea, event_storming_summary)
+        with self.span("render_prompt", spans.RENDER):
+            base_prompt = prompt_manager.get_init_prompt(idea, event_storming_summary)
 
         # Make it autonomous for API mode
         autonomous_prompt = base_prompt + """
@@ -62,41 +72,49 @@ The PRD must include these 9 sections:
 Generate the complete PRD markdown document now.
 """
 
-        # Call LLM (using Claude for complex document generation)
-        llm_response = await self.call_llm(
-            model="anthropic/claude-3.5-sonnet",
-            prompt=autonomous_prompt,
-            temperature=0.7,
-            max_tokens=4000,
-            system_message="You are an expert AI software architect and project manager.",
-        )
-
-        prd_md = llm_response.content
-
-        # Validate PRD
-        if len(prd_md) < 1000:
-            return PhaseResult(
-                phase=self.get_phase_name(),
-                success=False,
-                output_data={},
-                error_message="PRD too short - likely generation failed",
-                llm_response=llm_response,
+        # Call LLM (Claude by default for complex document generation)
+        # Streamed so that off-track output is aborted before the full completion;
+        # several variants are generated concurrently and ranked when requested
+        try:
+            variants = await self.call_llm_variants(
+                model=self.model_for(),
+                prompt=autonomous_prompt,
+                validator_factory=lambda: MarkdownStreamValidator(expected_sections=PRD_SECTIONS),
+                scorer=lambda content, report: score_document(content, report, target_chars=8000),
+                count=input_data.get("variants", 1),
+                models=input_data.get("variant_models"),
+                temperature=0.7,
+                max_tokens=4000,
+                system_message="You are an expert AI software architect and project manager.",
             )
+        except GenerationAbortedError as e:
+            return self.aborted_result(e)
 
-        # Check for required sections (at least some of them)
-        required_keywords = ["Overview", "Requirements", "Scope", "Features"]
-        if not any(keyword in prd_md for keyword in required_keywords):
+        # Validate PRD (length and at least some of the required sections),
+        # falling back to the next-best variant when the top-scored one fails
+        winner, others, error = self.select_variant(variants, PRD_CHECK)
+        if winner is None:
             return PhaseResult(
                 phase=self.get_phase_name(),
                 success=False,
                 output_data={},
-                error_message="PRD missing required sections",
-                llm_response=llm_response,
+                error_message=error,
+                llm_response=variants[0].llm_response,
             )
+        llm_response = winner.llm_response
+        prd_md = llm_response.content
 
         return PhaseResult(
             phase=self.get_phase_name(),
             success=True,
-            output_data={"prd_md": prd_md},
+            output_data={
+                "prd_md": prd_md,
+                "sections": winner.section_report.to_dict() if winner.section_report else {},
+                "score": winner.score,
+                "alternates": [variant.to_dict(include_content=False) for variant in others],
+            },
             llm_response=llm_response,
+            alternates=[
+                (variant.llm_response.content, variant.to_dict(include_content=False)) for variant in others
+            ],
         )
@@ -2,8 +2,15 @@
 from typing import Any, Dict
 
 from app.services.prompt_manager import prompt_manager
-from app.workflow.phases.base import BasePhaseHandler, PhaseResult
+from app.workflow import profiler as spans
+from app.workflow.phases.base import BasePhaseHandler, GenerationAbortedError, PhaseResult
 from app.workflow.state_machine import WorkflowPhase
+from app.workflow.validators import (
+    TECH_STACK_CHECK,
+    TECH_STACK_SECTIONS,
+    MarkdownStreamValidator,
+    check_document,
+)
 
 
 class TechStackPhase(BasePhaseHandler):
@@ -34,44 +41,38 @@ class TechStackPhase(BasePhaseHandler):
             )
 
         # Get Tech Stack prompt
-        prompt = prompt_manager.get_tech_stack_prompt(prd_md)
+        with self.span("render_prompt", spans.RENDER):
+            prompt = prompt_manager.get_tech_stack_prompt(prd_md)
 
-        # Call LLM (using GPT-4o for technical decisions)
-        llm_response = await self.call_llm(
-            model="openai/gpt-4o",
-            prompt=prompt,
-            temperature=0.5,  # Slightly lower for more consistent technical choices
-            max_tokens=3000,
-            system_message="You are an expert software architect making technology stack decisions.",
-        )
+        # Call LLM (GPT-4o by default for technical decisions)
+        try:
+            llm_response, section_report = await self.call_llm_streaming(
+                model=self.model_for(),
+                prompt=prompt,
+                validator=MarkdownStreamValidator(expected_sections=TECH_STACK_SECTIONS),
+                temperature=0.5,  # Slightly lower for more consistent technical choices
+                max_tokens=3000,
+                system_message="You are an expert software architect making technology stack decisions.",
+            )
+        except GenerationAbortedError as e:
+            return self.aborted_result(e)
 
         tech_stack_md = llm_response.content
 
-        # Validate Tech Stack
-        if len(tech_stack_md) < 500:
-            return PhaseResult(
-                phase=self.get_phase_name(),
-                success=False,
-                output_data={},
-                error_message="Tech Stack document too short - likely generation failed",
-                llm_response=llm_response,
-            )
-
-        # Check for required sections
-        required_keywords = ["Frontend", "Backend", "Infrastructure"]
-        missing_sections = [kw for kw in required_keywords if kw not in tech_stack_md]
-        if missing_sections:
+        # Validate Tech Stack (length and required sections)
+        error = check_document(TECH_STACK_CHECK, tech_stack_md, self.profiler)
+        if error:
             return PhaseResult(
                 phase=self.get_phase_name(),
                 success=False,
                 output_data={},
-                error_message=f"Tech Stack missing required sections: {', '.join(missing_sections)}",
+                error_message=error,
                 llm_response=llm_response,
             )
 
         return PhaseResult(
             phase=self.get_phase_name(),
             success=True,
-            output_data={"tech_stack_md": tech_stack_md},
+            output_data={"tech_stack_md": tech_stack_md, "sections": section_report.to_dict()},
             llm_response=llm_response,
         )
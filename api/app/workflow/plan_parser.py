@@ -0,0 +1,106 @@
+"""Extraction of stages and checkbox tasks from execution plan markdown."""
+import re
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from app.workflow.markdown import iter_lines, parse_heading
+
+# "Stage 3: Frontend", "**Stage 3 - Frontend**", "Stage 3"
+STAGE_PATTERN = re.compile(r"^\**\s*stage\b\s*(\d+)?", re.IGNORECASE)
+
+# "- [ ] Do something", "* [x] Done"
+CHECKBOX_ITEM_PATTERN = re.compile(r"^\s*(?:[-*+]|\d+[.)])\s+\[([ xX])\]\s+(.+?)\s*$")
+
+# "**Task 1.2: Set up CI**", "- Task 1.2 - Set up CI", "1. **Task:** Set up CI"
+TASK_LABEL_PATTERN = re.compile(r"^\s*(?:[-*+]\s+|\d+[.)]\s+)?(?:\*\*|__)?(task\b.*?)\s*$", re.IGNORECASE)
+
+_EMPHASIS = re.compile(r"(\*\*|__)")
+
+
+@dataclass
+class ParsedTask:
+    """A checkbox task of a plan stage."""
+
+    position: int  # 1-based, within the stage
+    text: str
+    completed: bool
+    group_title: Optional[str] = None  # Task heading/label the checkbox belongs to
+
+
+@dataclass
+class ParsedStage:
+    """A stage of an execution plan with its checkbox tasks."""
+
+    position: int  # 1-based, in document order
+    number: Optional[int]  # Number written in the heading, if any
+    title: str
+    tasks: List[ParsedTask] = field(default_factory=list)
+
+
+def _strip_emphasis(text: str) -> str:
+    """Remove bold markers and trailing colons from a label."""
+    return _EMPHASIS.sub("", text).strip().rstrip(":").strip()
+
+
+def parse_execution_plan(content: str) -> List[ParsedStage]:
+    """Parse an execution plan into stages and checkbox tasks.
+
+    A stage starts at a heading that begins with "Stage" and ends at the next
+    heading of the same or a higher level. Checkboxes inside a stage become
+    tasks, grouped under the closest deeper heading or "Task ..." label.
+    Content inside fenced code blocks is ignored.
+
+    Args:
+        content: Execution plan markdown
+
+    Returns:
+        Stages in document order (stages without checkboxes included)
+
+    """
+    stages: List[ParsedStage] = []
+    stage: Optional[ParsedStage] = None
+    stage_level = 0
+    group_title: Optional[str] = None
+
+    for _, line in iter_lines(content):
+        heading = parse_heading(line)
+        if heading:
+            level, title = heading
+            match = STAGE_PATTERN.match(title)
+            if match:
+                number = match.group(1)
+                stage = ParsedStage(
+                    position=len(stages) + 1,
+                    number=int(number) if number else None,
+                    title=_strip_emphasis(title),
+                )
+                stages.append(stage)
+                stage_level = level
+                group_title = None
+            elif stage and level <= stage_level:
+                stage = None
+            elif stage:
+                group_title = _strip_emphasis(title)
+            continue
+
+        if stage is None:
+            continue
+
+        checkbox = CHECKBOX_ITEM_PATTERN.match(line)
+        if checkbox:
+            mark, text = checkbox.groups()
+            stage.tasks.append(
+                ParsedTask(
+                    position=len(stage.tasks) + 1,
+                    text=text,
+                    completed=mark.lower() == "x",
+                    group_title=group_title,
+                )
+            )
+            continue
+
+        label = TASK_LABEL_PATTERN.match(line)
+        if label:
+            group_title = _strip_emphasis(label.group(1))
+
+    return stages
@@ -0,0 +1,187 @@
+"""Storage of execution plan stages and tasks extracted from the plan document."""
+import uuid
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import and_, case, delete, func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import PlanStage, PlanTask, Project
+from app.db.repository import ProjectNotFoundError
+from app.db.routing import touch_projects
+from app.workflow.plan_parser import parse_execution_plan
+
+
+async def save_plan(db: AsyncSession, project_id: UUID, document_id: UUID, content_md: str) -> int:
+    """Replace the stages and tasks of a project with those of a new plan.
+
+    Runs in the caller's transaction (no commit). Tasks that were completed
+    and still exist with the same text in the same stage stay completed.
+
+    Args:
+        db: Database session
+        project_id: Project UUID
+        document_id: Execution plan document UUID
+        content_md: Execution plan markdown
+
+    Returns:
+        Number of extracted tasks
+
+    """
+    result = await db.execute(
+        select(PlanStage.position, PlanTask.text, PlanTask.completed_at)
+        .join(PlanTask, PlanTask.stage_id == PlanStage.id)
+        .where(PlanTask.project_id == project_id, PlanTask.completed.is_(True))
+    )
+    completed: Dict[Tuple[int, str], Optional[datetime]] = {
+        (position, text): completed_at for position, text, completed_at in result.all()
+    }
+
+    # Tasks are removed by the foreign key cascade
+    await db.execute(delete(PlanStage).where(PlanStage.project_id == project_id))
+
+    now = datetime.utcnow()
+    stage_rows = []
+    task_rows = []
+    for stage in parse_execution_plan(content_md):
+        stage_id = uuid.uuid4()
+        stage_rows.append(
+            {
+                "id": stage_id,
+                "project_id": project_id,
+                "document_id": document_id,
+                "position": stage.position,
+                "number": stage.number,
+                "title": stage.title[:500],
+            }
+        )
+        for task in stage.tasks:
+            key = (stage.position, task.text)
+            is_completed = task.completed or key in completed
+            task_rows.append(
+                {
+                    "stage_id": stage_id,
+                    "project_id": project_id,
+                    "position": task.position,
+                    "group_title": task.group_title[:500] if task.group_title else None,
+                    "text": task.text,
+                    "completed": is_completed,
+                    "completed_at": (completed.get(key) or now) if is_completed else None,
+                }
+            )
+
+    if stage_rows:
+        await db.execute(insert(PlanStage), stage_rows)
+    if task_rows:
+        await db.execute(insert(PlanTask), task_rows)
+    return len(task_rows)
+
+
+async def list_plan_stages(db: AsyncSession, project_id: UUID) -> List[Tuple[PlanStage, int, int]]:
+    """List the plan stages of a project with their task counts.
+
+    Args:
+        db: Database session
+        project_id: Project UUID
+
+    Returns:
+        List of (stage, total tasks, completed tasks), in plan order
+
+    Raises:
+        ProjectNotFoundError: If the project does not exist
+
+    """
+    # Joined from the project: one row without a stage if it has no plan, no rows if it does not exist
+    result = await db.execute(
+        select(
+            Project.id,
+            PlanStage,
+            func.count(PlanTask.id),
+            func.count(PlanTask.id).filter(PlanTask.completed.is_(True)),
+        )
+        .outerjoin(PlanStage, PlanStage.project_id == Project.id)
+        .outerjoin(PlanTask, PlanTask.stage_id == PlanStage.id)
+        .where(Project.id == project_id)
+        .group_by(Project.id, PlanStage.id)
+        .order_by(PlanStage.position)
+    )
+    rows = result.all()
+    if not rows:
+        raise ProjectNotFoundError(project_id)
+    return [(stage, total, completed) for _, stage, total, completed in rows if stage is not None]
+
+
+async def get_stage_tasks(
+    db: AsyncSession, project_id: UUID, position: int
+) -> Optional[Tuple[PlanStage, List[PlanTask]]]:
+    """Get one plan stage and its tasks.
+
+    Args:
+        db: Database session
+        project_id: Project UUID
+        position: Stage position (1-based)
+
+    Returns:
+        Tuple of (stage, tasks in order) or None if the stage does not exist
+
+    Raises:
+        ProjectNotFoundError: If the project does not exist
+
+    """
+    result = await db.execute(
+        select(Project.id, PlanStage)
+        .outerjoin(PlanStage, and_(PlanStage.project_id == Project.id, PlanStage.position == position))
+        .where(Project.id == project_id)
+    )
+    row = result.first()
+    if row is None:
+        raise ProjectNotFoundError(project_id)
+
+    stage = row[1]
+    if stage is None:
+        return None
+
+    result = await db.execute(
+        select(PlanTask).where(PlanTask.stage_id == stage.id).order_by(PlanTask.position)
+    )
+    return stage, list(result.scalars().all())
+
+
+async def set_task_completed(
+    db: AsyncSession, project_id: UUID, task_id: UUID, completed: bool
+) -> Optional[PlanTask]:
+    """Mark a plan task as completed or not with a single-row update.
+
+    The plan document is not re-parsed or rewritten. Marking an already
+    completed task as completed keeps its original completion time.
+
+    Args:
+        db: Database session
+        project_id: Project UUID
+        task_id: Task UUID
+        completed: New completion state
+
+    Returns:
+        Updated task or None if not found
+
+    """
+    now = datetime.utcnow()
+    result = await db.execute(
+        update(PlanTask)
+        .where(PlanTask.id == task_id, PlanTask.project_id == project_id)
+        .values(
+            completed=completed,
+            completed_at=(
+                case((PlanTask.completed.is_(True), PlanTask.completed_at), else_=now) if completed else None
+            ),
+            updated_at=now,
+        )
+        .returning(PlanTask)
+    )
+    task = result.scalar_one_or_none()
+    if task is not None:
+        # Bulk statements bypass the flush that normally marks the project as written
+        await db.execute(touch_projects([project_id]))
+    await db.commit()
+    return task
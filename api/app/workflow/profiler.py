@@ -0,0 +1,225 @@
+"""Span-based wall-clock profiler for workflow executions.
+
+Spans are measured with the monotonic ``time.perf_counter`` clock and stored
+as millisecond offsets from the start of the workflow. Nesting is tracked with
+a context variable, so spans opened in concurrently running tasks get the
+correct parent.
+"""
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Iterator, List, Optional
+
+# Span categories
+WORKFLOW = "workflow"
+PHASE = "phase"
+RENDER = "render"
+LLM = "llm"
+PARSE = "parse"
+VALIDATE = "validate"
+DB = "db"
+BROADCAST = "broadcast"
+
+
+@dataclass
+class Span:
+    """A single timed span."""
+
+    id: int
+    name: str
+    category: str
+    start_ms: float
+    end_ms: Optional[float] = None
+    parent_id: Optional[int] = None
+    phase: Optional[str] = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def duration_ms(self) -> float:
+        """Span duration in milliseconds (0 while still open)."""
+        return (self.end_ms - self.start_ms) if self.end_ms is not None else 0.0
+
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_profiler_span", default=None)
+
+
+class WorkflowProfiler:
+    """Collects spans for one workflow execution."""
+
+    def __init__(self) -> None:
+        """Initialize profiler; the clock origin is the time of creation."""
+        self._origin = time.perf_counter()
+        self.spans: List[Span] = []
+
+    def now_ms(self) -> float:
+        """Milliseconds elapsed since the profiler was created."""
+        return (time.perf_counter() - self._origin) * 1000
+
+    @contextmanager
+    def span(
+        self, name: str, category: str, phase: Optional[str] = None, **attributes: Any
+    ) -> Iterator[Span]:
+        """Time a block of code as a span.
+
+        Args:
+            name: Span name (e.g., "save_document")
+            category: Span category (e.g., DB, LLM)
+            phase: Optional workflow phase (inherited from the parent span if omitted)
+            **attributes: Extra attributes stored with the span
+
+        Yields:
+            The open Span (attributes may be added while it runs)
+
+        """
+        parent = _current_span.get()
+        if parent is not None and not (
+            parent.id < len(self.spans) and self.spans[parent.id] is parent
+        ):
+            parent = None  # Span belongs to another profiler
+
+        span = Span(
+            id=len(self.spans),
+            name=name,
+            category=category,
+            start_ms=self.now_ms(),
+            parent_id=parent.id if parent else None,
+            phase=phase or (parent.phase if parent else None),
+            attributes=dict(attributes),
+        )
+        self.spans.append(span)
+        token = _current_span.set(span)
+        try:
+            yield span
+        finally:
+            span.end_ms = self.now_ms()
+            _current_span.reset(token)
+
+    def record(
+        self,
+        name: str,
+        category: str,
+        start_ms: float,
+        end_ms: float,
+        parent: Optional[Span] = None,
+        **attributes: Any,
+    ) -> Span:
+        """Record an already measured span.
+
+        Args:
+            name: Span name
+            category: Span category
+            start_ms: Start offset in milliseconds
+            end_ms: End offset in milliseconds
+            parent: Optional parent span
+            **attributes: Extra attributes stored with the span
+
+        Returns:
+            Recorded Span
+
+        """
+        span = Span(
+            id=len(self.spans),
+            name=name,
+            category=category,
+            start_ms=start_ms,
+            end_ms=end_ms,
+            parent_id=parent.id if parent else None,
+            phase=parent.phase if parent else None,
+            attributes=dict(attributes),
+        )
+        self.spans.append(span)
+        return span
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        """Serialize closed spans for persistence.
+
+        Returns:
+            List of span dicts with durations rounded to 0.01 ms
+
+        """
+        result = []
+        for span in self.spans:
+            if span.end_ms is None:
+                continue
+            data = asdict(span)
+            data["start_ms"] = round(span.start_ms, 2)
+            data["end_ms"] = round(span.end_ms, 2)
+            data["duration_ms"] = round(span.duration_ms, 2)
+            result.append(data)
+        return result
+
+
+def critical_path(spans: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Compute the critical path through a span tree.
+
+    Walking backwards from the end of each span, the child that finishes last
+    is on the critical path; its start becomes the new cursor. Only leaf spans
+    are returned, since parents are fully described by their children.
+
+    Args:
+        spans: Serialized spans (as produced by ``WorkflowProfiler.to_list``)
+
+    Returns:
+        Leaf spans on the critical path, in chronological order
+
+    """
+    children: Dict[Optional[int], List[Dict[str, Any]]] = {}
+    for span in spans:
+        children.setdefault(span["parent_id"], []).append(span)
+
+    def walk(span: Dict[str, Any]) -> List[Dict[str, Any]]:
+        kids = children.get(span["id"], [])
+        if not kids:
+            return [span]
+
+        path: List[Dict[str, Any]] = []
+        cursor = span["end_ms"]
+        remaining = list(kids)
+        while True:
+            candidates = [kid for kid in remaining if kid["end_ms"] <= cursor + 0.01]
+            if not candidates:
+                break
+            last = max(candidates, key=lambda kid: kid["end_ms"])
+            remaining = [
+                kid
+                for kid in remaining
+                if kid is not last and kid["end_ms"] <= last["start_ms"] + 0.01
+            ]
+            path = walk(last) + path
+            cursor = last["start_ms"]
+        return path
+
+    path: List[Dict[str, Any]] = []
+    for root in sorted(children.get(None, []), key=lambda s: s["start_ms"]):
+        path.extend(walk(root))
+    return path
+
+
+def critical_path_breakdown(spans: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Summarize where wall-clock time on the critical path was spent.
+
+    Args:
+        spans: Serialized spans
+
+    Returns:
+        Dict with total, per-category and unaccounted milliseconds
+
+    """
+    roots = [span for span in spans if span["parent_id"] is None]
+    total_ms = (
+        max(span["end_ms"] for span in roots) - min(span["start_ms"] for span in roots)
+        if roots
+        else 0.0
+    )
+
+    by_category: Dict[str, float] = {}
+    for span in critical_path(spans):
+        by_category[span["category"]] = by_category.get(span["category"], 0.0) + span["duration_ms"]
+
+    accounted = sum(by_category.values())
+    return {
+        "total_ms": round(total_ms, 2),
+        "by_category_ms": {key: round(value, 2) for key, value in by_category.items()},
+        "unaccounted_ms": round(max(total_ms - accounted, 0.0), 2),
+    }
@@ -0,0 +1,172 @@
+"""Retry policy for transient phase failures (timeouts, connection errors, 5xx/429)."""
+import random
+from dataclasses import dataclass, field, replace
+from typing import Any, Callable, Dict, FrozenSet, Mapping, Optional, Tuple, Type
+
+import httpx
+
+from app.config import settings
+
+# Provider responses worth retrying: timeouts, rate limits and gateway/server errors
+RETRYABLE_STATUS_CODES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+# Policy fields that PHASE_RETRY_OVERRIDES may set
+_OVERRIDABLE_FIELDS = ("max_attempts", "base_delay", "max_delay", "jitter", "deadline")
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """How a phase is retried after a transient error.
+
+    Attributes:
+        max_attempts: Attempts in total, including the first one
+        base_delay: Delay after the first failed attempt (seconds), doubled per attempt
+        max_delay: Upper bound of a single delay (seconds)
+        jitter: Fraction of each delay that is randomized (0 = fixed, 1 = full jitter)
+        deadline: Time budget for all attempts (seconds); no attempt starts after it
+        retryable_exceptions: Exception classes that are always transient
+        retryable_status_codes: HTTP status codes that are transient
+
+    """
+
+    max_attempts: int = 3
+    base_delay: float = 1.0
+    max_delay: float = 20.0
+    jitter: float = 0.5
+    deadline: float = 300.0
+    retryable_exceptions: Tuple[Type[BaseException], ...] = (httpx.TransportError,)
+    retryable_status_codes: FrozenSet[int] = field(default=RETRYABLE_STATUS_CODES)
+
+    @classmethod
+    def for_phase(cls, phase: str) -> "RetryPolicy":
+        """Build the policy of a phase from settings (defaults plus per-phase overrides).
+
+        Args:
+            phase: Workflow phase name
+
+        Returns:
+            RetryPolicy
+
+        Raises:
+            ValueError: If the phase overrides contain an unknown key or an invalid value
+
+        """
+        policy = cls(
+            max_attempts=settings.PHASE_RETRY_MAX_ATTEMPTS,
+            base_delay=settings.PHASE_RETRY_BASE_DELAY_SECONDS,
+            max_delay=settings.PHASE_RETRY_MAX_DELAY_SECONDS,
+            deadline=settings.PHASE_RETRY_DEADLINE_SECONDS,
+        )
+        return replace(policy, **_parse_overrides(phase, settings.PHASE_RETRY_OVERRIDES.get(phase, {})))
+
+    def is_retryable(self, error: BaseException) -> bool:
+        """Check whether an error is transient.
+
+        Args:
+            error: Error raised by an attempt
+
+        Returns:
+            True if another attempt may succeed
+
+        """
+        if isinstance(error, httpx.HTTPStatusError):
+            return error.response.status_code in self.retryable_status_codes
+        return isinstance(error, self.retryable_exceptions)
+
+    def backoff(self, attempt: int, rng: Callable[[], float] = random.random) -> float:
+        """Compute the delay after a failed attempt (exponential backoff with jitter).
+
+        Args:
+            attempt: Number of the failed attempt (1-based)
+            rng: Random source returning floats in [0, 1)
+
+        Returns:
+            Delay in seconds
+
+        """
+        delay = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return delay * (1 - self.jitter * rng())
+
+    def next_delay(
+        self,
+        attempt: int,
+        error: BaseException,
+        elapsed: float,
+        rng: Callable[[], float] = random.random,
+    ) -> Optional[float]:
+        """Decide whether to retry after a failed attempt.
+
+        A ``Retry-After`` header of a 429/503 response is honored (up to
+        max_delay) instead of the computed backoff.
+
+        Args:
+            attempt: Number of the failed attempt (1-based)
+            error: Error raised by the attempt
+            elapsed: Seconds since the first attempt started
+            rng: Random source returning floats in [0, 1)
+
+        Returns:
+            Delay before the next attempt, or None if the phase must fail now
+
+        """
+        if attempt >= self.max_attempts or not self.is_retryable(error):
+            return None
+
+        delay = _retry_after(error)
+        if delay is None:
+            delay = self.backoff(attempt, rng)
+        delay = min(delay, self.max_delay)
+
+        if elapsed + delay >= self.deadline:
+            return None
+        return delay
+
+
+def _parse_overrides(phase: str, overrides: Mapping[str, float]) -> Dict[str, Any]:
+    """Convert the numeric per-phase overrides of settings to RetryPolicy field values.
+
+    Only the numeric fields can be overridden; the retryable exceptions and
+    status codes are not configurable per phase.
+
+    Args:
+        phase: Workflow phase name (for error messages)
+        overrides: Overrides from ``PHASE_RETRY_OVERRIDES``
+
+    Returns:
+        Field values for ``dataclasses.replace``
+
+    Raises:
+        ValueError: If a key is not an overridable field or a value is invalid
+
+    """
+    values: Dict[str, Any] = {}
+    for key, value in overrides.items():
+        if key not in _OVERRIDABLE_FIELDS:
+            raise ValueError(
+                f"Unknown retry override {key!r} for phase {phase}; "
+                f"expected one of {', '.join(_OVERRIDABLE_FIELDS)}"
+            )
+        if key == "max_attempts":
+            if float(value) != int(value) or int(value) < 1:
+                raise ValueError(f"Retry override max_attempts for phase {phase} must be a positive integer")
+            values[key] = int(value)
+        elif key == "jitter":
+            if not 0.0 <= float(value) <= 1.0:
+                raise ValueError(f"Retry override jitter for phase {phase} must be between 0 and 1")
+            values[key] = float(value)
+        else:
+            if float(value) < 0:
+                raise ValueError(f"Retry override {key} for phase {phase} must not be negative")
+            values[key] = float(value)
+    return values
+
+
+def _retry_after(error: BaseException) -> Optional[float]:
+    """Get the delay requested by a ``Retry-After`` header (seconds form only)."""
+    if not isinstance(error, httpx.HTTPStatusError):
+        return None
+    value = error.response.headers.get("retry-after")
+    try:
+        return max(float(value), 0.0) if value else None
+    except ValueError:
+        return None
@@ -0,0 +1,240 @@
+"""Weighted fair scheduler for workflow execution across tenants."""
+import asyncio
+import itertools
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, TypeVar
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass
+class _QueuedJob:
+    """Job waiting for an execution slot."""
+
+    tenant_id: str
+    start_tag: float
+    finish_tag: float
+    seq: int
+    admitted: asyncio.Future
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+@dataclass
+class _TenantState:
+    """Per-tenant queue and accounting."""
+
+    tier: str
+    weight: float
+    max_concurrent: int
+    queue: Deque[_QueuedJob] = field(default_factory=deque)
+    running: int = 0
+    last_finish_tag: float = 0.0
+    started_total: int = 0
+    max_wait_ms: int = 0
+    avg_wait_ms: float = 0.0
+
+
+class FairScheduler:
+    """Weighted fair queuing of workflows, keyed by tenant (user ID).
+
+    Every queued job gets a virtual finish tag of ``start + 1 / weight`` where
+    ``start`` is the later of the scheduler's virtual clock and the tenant's
+    previous finish tag. The runnable job with the smallest finish tag is
+    admitted next, so a tenant that bulk-submits hundreds of workflows only
+    gets its weighted share of slots while other tenants keep bounded latency.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int,
+        tenant_max_concurrent: int,
+        tier_weights: Dict[str, int],
+        tenant_tiers: Optional[Dict[str, str]] = None,
+        tenant_concurrency: Optional[Dict[str, int]] = None,
+        default_tier: str = "standard",
+    ):
+        """Initialize scheduler.
+
+        Args:
+            max_concurrent: Global limit of concurrently running workflows
+            tenant_max_concurrent: Default per-tenant concurrency cap
+            tier_weights: Weight per priority tier
+            tenant_tiers: Optional mapping of tenant ID to tier
+            tenant_concurrency: Optional per-tenant concurrency cap overrides
+            default_tier: Tier for tenants not listed in tenant_tiers
+
+        """
+        self.max_concurrent = max_concurrent
+        self.tenant_max_concurrent = tenant_max_concurrent
+        self.tier_weights = tier_weights
+        self.tenant_tiers = tenant_tiers or {}
+        self.tenant_concurrency = tenant_concurrency or {}
+        self.default_tier = default_tier
+
+        self._tenants: Dict[str, _TenantState] = {}
+        self._running = 0
+        self._virtual_time = 0.0
+        self._seq = itertools.count()
+
+    def _get_tenant(self, tenant_id: str) -> _TenantState:
+        """Get or create tenant state."""
+        tenant = self._tenants.get(tenant_id)
+        if tenant is None:
+            tier = self.tenant_tiers.get(tenant_id, self.default_tier)
+            tenant = _TenantState(
+                tier=tier,
+                weight=float(max(self.tier_weights.get(tier, 1), 1)),
+                max_concurrent=self.tenant_concurrency.get(tenant_id, self.tenant_max_concurrent),
+            )
+            self._tenants[tenant_id] = tenant
+        return tenant
+
+    async def run(self, tenant_id: str, job_factory: Callable[[], Awaitable[T]]) -> T:
+        """Wait for a fair execution slot, then run the job.
+
+        Args:
+            tenant_id: Tenant key (user ID)
+            job_factory: Callable returning the awaitable to run once admitted
+
+        Returns:
+            Result of the job
+
+        """
+        await self._acquire(tenant_id)
+        try:
+            return await job_factory()
+        finally:
+            self._release(tenant_id)
+
+    async def _acquire(self, tenant_id: str) -> None:
+        """Enqueue a job for a tenant and wait until it is admitted."""
+        tenant = self._get_tenant(tenant_id)
+        start_tag = max(self._virtual_time, tenant.last_finish_tag)
+        job = _QueuedJob(
+            tenant_id=tenant_id,
+            start_tag=start_tag,
+            finish_tag=start_tag + 1.0 / tenant.weight,
+            seq=next(self._seq),
+            admitted=asyncio.get_running_loop().create_future(),
+        )
+        tenant.last_finish_tag = job.finish_tag
+        tenant.queue.append(job)
+
+        self._dispatch()
+
+        if not job.admitted.done():
+            logger.info(
+                f"Workflow for tenant {tenant_id} queued "
+                f"(tenant queue depth: {len(tenant.queue)}, running: {self._running})"
+            )
+
+        try:
+            await job.admitted
+        except asyncio.CancelledError:
+            if job.admitted.done() and not job.admitted.cancelled():
+                # Admitted at the same time as the caller was cancelled
+                self._release(tenant_id)
+            else:
+                self._remove_queued(job)
+            raise
+
+    def _remove_queued(self, job: _QueuedJob) -> None:
+        """Remove a cancelled job from its tenant queue, if it is still queued."""
+        tenant = self._tenants.get(job.tenant_id)
+        if tenant is not None and job in tenant.queue:
+            tenant.queue.remove(job)
+            self._forget_if_idle(job.tenant_id)
+            self._dispatch()
+
+    def _release(self, tenant_id: str) -> None:
+        """Release an execution slot and admit the next job."""
+        tenant = self._tenants[tenant_id]
+        tenant.running -= 1
+        self._running -= 1
+        self._forget_if_idle(tenant_id)
+        self._dispatch()
+
+    def _forget_if_idle(self, tenant_id: str) -> None:
+        """Drop idle tenants so the table stays bounded by active tenants."""
+        tenant = self._tenants[tenant_id]
+        if not tenant.running and not tenant.queue:
+            del self._tenants[tenant_id]
+
+    def _dispatch(self) -> None:
+        """Admit queued jobs while global and per-tenant capacity allows."""
+        while self._running < self.max_concurrent:
+            candidates = [
+                tenant.queue[0]
+                for tenant in self._tenants.values()
+                if tenant.queue and tenant.running < tenant.max_concurrent
+            ]
+            if not candidates:
+                return
+
+            job = min(candidates, key=lambda j: (j.finish_tag, j.seq))
+            tenant = self._tenants[job.tenant_id]
+            tenant.queue.popleft()
+
+            if job.admitted.cancelled():
+                # The waiting task was cancelled but has not run its cleanup yet
+                self._forget_if_idle(job.tenant_id)
+                continue
+
+            self._virtual_time = max(self._virtual_time, job.start_tag)
+            tenant.running += 1
+            tenant.started_total += 1
+            self._running += 1
+
+            wait_ms = int((time.monotonic() - job.enqueued_at) * 1000)
+            tenant.max_wait_ms = max(tenant.max_wait_ms, wait_ms)
+            tenant.avg_wait_ms = (
+                wait_ms
+                if tenant.started_total == 1
+                else tenant.avg_wait_ms * 0.9 + wait_ms * 0.1  # Exponential moving average
+            )
+
+            job.admitted.set_result(None)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Get scheduler metrics, including per-tenant queue depth.
+
+        Returns:
+            Metrics dict
+
+        """
+        return {
+            "max_concurrent": self.max_concurrent,
+            "running": self._running,
+            "queued": sum(len(tenant.queue) for tenant in self._tenants.values()),
+            "tenants": {
+                tenant_id: {
+                    "tier": tenant.tier,
+                    "weight": tenant.weight,
+                    "max_concurrent": tenant.max_concurrent,
+                    "running": tenant.running,
+                    "queued": len(tenant.queue),
+                    "started_total": tenant.started_total,
+                    "avg_wait_ms": int(tenant.avg_wait_ms),
+                    "max_wait_ms": tenant.max_wait_ms,
+                }
+                for tenant_id, tenant in self._tenants.items()
+            },
+        }
+
+
+# Global instance
+workflow_scheduler = FairScheduler(
+    max_concurrent=settings.WORKFLOW_MAX_CONCURRENT,
+    tenant_max_concurrent=settings.WORKFLOW_TENANT_MAX_CONCURRENT,
+    tier_weights=settings.WORKFLOW_TIER_WEIGHTS,
+    tenant_tiers=settings.WORKFLOW_TENANT_TIERS,
+    tenant_concurrency=settings.WORKFLOW_TENANT_CONCURRENCY,
+    default_tier=settings.WORKFLOW_DEFAULT_TIER,
+)
@@ -0,0 +1,160 @@
+"""MinHash / LSH similarity of project ideas.
+
+Ideas are compared as sets of character shingles. A MinHash signature
+estimates the Jaccard similarity of two shingle sets, and splitting the
+signature into bands gives locality-sensitive hashes: two ideas share at
+least one band hash with high probability when they are similar, so
+candidates can be found with an indexed array overlap instead of a scan.
+"""
+import hashlib
+import heapq
+import random
+import re
+from typing import Iterable, List, Set, Tuple, TypeVar
+
+SHINGLE_SIZE = 5  # Characters per shingle
+NUM_PERM = 64  # MinHash signature length
+BANDS = 16  # LSH bands (NUM_PERM / BANDS rows each)
+
+# Mersenne prime 2^61 - 1: hash values fit into a signed 64-bit column
+_PRIME = (1 << 61) - 1
+_rng = random.Random(0x1DEA)  # Fixed seed: signatures must be stable across processes
+_PERMUTATIONS = [(_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(NUM_PERM)]
+
+_NON_WORD = re.compile(r"[\W_]+", re.UNICODE)
+
+K = TypeVar("K")
+
+
+def normalize_idea(text: str) -> str:
+    """Normalize an idea for comparison (case, punctuation and whitespace).
+
+    Args:
+        text: Idea text
+
+    Returns:
+        Lowercase words separated by single spaces
+
+    """
+    return _NON_WORD.sub(" ", text.lower()).strip()
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> Set[str]:
+    """Split a text into overlapping character shingles.
+
+    Args:
+        text: Text to split
+        size: Characters per shingle
+
+    Returns:
+        Set of shingles of the normalized text
+
+    """
+    normalized = normalize_idea(text)
+    if len(normalized) <= size:
+        return {normalized} if normalized else set()
+    return {normalized[i : i + size] for i in range(len(normalized) - size + 1)}
+
+
+def jaccard(a: Set[str], b: Set[str]) -> float:
+    """Compute the exact Jaccard similarity of two sets.
+
+    Args:
+        a: First set
+        b: Second set
+
+    Returns:
+        Similarity between 0 and 1
+
+    """
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+def text_similarity(a: str, b: str) -> float:
+    """Compute the shingle Jaccard similarity of two texts."""
+    return jaccard(shingles(a), shingles(b))
+
+
+def _shingle_hash(shingle: str) -> int:
+    """Hash a shingle to a 64-bit integer (stable across processes)."""
+    return int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def minhash_signature(text: str) -> List[int]:
+    """Compute the MinHash signature of a text.
+
+    Args:
+        text: Text to sign
+
+    Returns:
+        NUM_PERM minimum hash values
+
+    """
+    hashes = [_shingle_hash(shingle) for shingle in shingles(text)] or [0]
+    return [min((a * h + b) % _PRIME for h in hashes) for a, b in _PERMUTATIONS]
+
+
+def lsh_bands(signature: List[int], bands: int = BANDS) -> List[int]:
+    """Hash the bands of a signature for candidate lookup.
+
+    The band index is part of each hash, so equal rows in different bands do
+    not collide.
+
+    Args:
+        signature: MinHash signature
+        bands: Number of bands
+
+    Returns:
+        One signed 64-bit hash per band
+
+    """
+    rows = len(signature) // bands
+    return [
+        int.from_bytes(
+            hashlib.blake2b(
+                f"{band}:{','.join(map(str, signature[band * rows : (band + 1) * rows]))}".encode(),
+                digest_size=8,
+            ).digest(),
+            "big",
+            signed=True,
+        )
+        for band in range(bands)
+    ]
+
+
+def estimate_similarity(a: List[int], b: List[int]) -> float:
+    """Estimate the Jaccard similarity of two texts from their signatures.
+
+    Args:
+        a: First signature
+        b: Second signature
+
+    Returns:
+        Fraction of equal signature values
+
+    """
+    if not a or len(a) != len(b):
+        return 0.0
+    return sum(1 for x, y in zip(a, b, strict=True) if x == y) / len(a)
+
+
+def shortlist(
+    signature: List[int], candidates: Iterable[Tuple[K, List[int]]], min_estimate: float, size: int
+) -> List[K]:
+    """Pick the candidates whose signatures estimate the highest similarities.
+
+    Args:
+        signature: MinHash signature of the text being matched
+        candidates: (key, stored signature) pairs, e.g. the LSH band matches
+        min_estimate: Lowest estimated similarity kept
+        size: Maximum number of candidates returned
+
+    Returns:
+        Keys of the best candidates, highest estimate first
+
+    """
+    estimates = [(estimate_similarity(signature, candidate), key) for key, candidate in candidates]
+    best = heapq.nlargest(size, (item for item in estimates if item[0] >= min_estimate), key=lambda item: item[0])
+    return [key for _, key in best]
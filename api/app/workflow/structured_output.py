@@ -0,0 +1,178 @@
+"""Schema-validated parsing of structured (JSON) LLM output with local repair."""
+import json
+import re
+from typing import Any, Dict, List, Tuple, Type, TypeVar
+
+from pydantic import BaseModel, ValidationError
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+CODE_FENCE_PATTERN = re.compile(r"```(?:json)?\s*(.*?)(?:```|$)", re.DOTALL | re.IGNORECASE)
+TRAILING_COMMA_PATTERN = re.compile(r",\s*([}\]])")
+
+
+class StructuredOutputError(ValueError):
+    """Raised when LLM output cannot be parsed into the expected schema."""
+
+    def __init__(self, message: str, raw_output: str):
+        super().__init__(message)
+        self.raw_output = raw_output
+
+
+def _strip_code_fence(text: str) -> str:
+    """Return the content of the first markdown code fence, or the text itself."""
+    fenced = CODE_FENCE_PATTERN.search(text)
+    return fenced.group(1) if fenced else text
+
+
+def _scan_json_value(text: str) -> Tuple[int, List[str], bool]:
+    """Scan a JSON value, tracking open brackets and string state.
+
+    Args:
+        text: Text starting with ``{`` or ``[``
+
+    Returns:
+        Tuple of (end of the value, closing brackets still open, inside a string)
+
+    """
+    stack: List[str] = []
+    in_string = False
+    escaped = False
+    for index, char in enumerate(text):
+        if in_string:
+            # An unescaped quote ends the string; a backslash escapes the next character
+            in_string = escaped or char != '"'
+            escaped = not escaped and char == "\\"
+        elif char == '"':
+            in_string = True
+        elif char in "{[":
+            stack.append("}" if char == "{" else "]")
+        elif char in "}]":
+            if stack:
+                stack.pop()
+            if not stack:
+                return index + 1, stack, False
+    return len(text), stack, in_string
+
+
+def _close_truncated(text: str, stack: List[str], in_string: bool) -> str:
+    """Close an unterminated string, a dangling key and unclosed brackets."""
+    if in_string:
+        text += '"'
+    if not stack:
+        return text
+
+    stripped = text.rstrip()
+    if stripped.endswith(":"):
+        text = stripped + " null"
+    elif stripped.endswith(","):
+        text = stripped[:-1]
+    return text + "".join(reversed(stack))
+
+
+def _remove_trailing_commas(text: str) -> str:
+    """Remove commas directly before a closing bracket."""
+    return TRAILING_COMMA_PATTERN.sub(r"\1", text)
+
+
+def repair_json(text: str) -> str:
+    """Cheap local repair of common JSON defects in LLM output.
+
+    Handles markdown code fences, prose around the JSON value, trailing commas
+    and truncation (unterminated strings, dangling keys, unclosed brackets).
+
+    Args:
+        text: Raw LLM output
+
+    Returns:
+        Repaired JSON text (may still be invalid if the damage is too severe)
+
+    """
+    text = _strip_code_fence(text)
+
+    # Drop any prose before the JSON value
+    starts = [index for index in (text.find("{"), text.find("[")) if index != -1]
+    if not starts:
+        return text.strip()
+    text = text[min(starts):]
+
+    # Cut at the end of the value, then close it if it was truncated
+    end, stack, in_string = _scan_json_value(text)
+    text = _close_truncated(text[:end], stack, in_string)
+
+    return _remove_trailing_commas(text)
+
+
+def parse_structured(text: str, schema: Type[ModelT]) -> ModelT:
+    """Parse LLM output into a Pydantic model, repairing it locally if needed.
+
+    Args:
+        text: Raw LLM output
+        schema: Pydantic model class
+
+    Returns:
+        Validated model instance
+
+    Raises:
+        StructuredOutputError: If the output cannot be parsed or validated
+
+    """
+    try:
+        return schema.model_validate_json(text)
+    except ValidationError:
+        pass
+
+    repaired = repair_json(text)
+    try:
+        return schema.model_validate_json(repaired)
+    except ValidationError as e:
+        errors = "; ".join(
+            f"{'.'.join(str(part) for part in error['loc']) or 'root'}: {error['msg']}"
+            for error in e.errors()
+        )
+        raise StructuredOutputError(f"Invalid {schema.__name__} output: {errors}", text) from e
+
+
+def json_schema_response_format(schema: Type[BaseModel]) -> Dict[str, Any]:
+    """Build an OpenAI-style ``json_schema`` response format for a model.
+
+    Args:
+        schema: Pydantic model class
+
+    Returns:
+        Response format dict for the chat completions API
+
+    """
+    json_schema = schema.model_json_schema()
+    json_schema["additionalProperties"] = False
+    json_schema["required"] = list(json_schema.get("properties", {}))
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": re.sub(r"(?<!^)(?=[A-Z])", "_", schema.__name__).lower(),
+            "strict": True,
+            "schema": json_schema,
+        },
+    }
+
+
+def build_repair_prompt(prompt: str, schema: Type[BaseModel], error: str, raw_output: str) -> str:
+    """Build a targeted retry prompt after a failed parse.
+
+    Args:
+        prompt: Original prompt
+        schema: Expected Pydantic model class
+        error: Parse/validation error
+        raw_output: Previous (invalid) output
+
+    Returns:
+        Retry prompt
+
+    """
+    return (
+        f"{prompt}\n\n---\n\n"
+        f"Your previous response could not be used: {error}\n\n"
+        f"Previous response:\n{raw_output[:2000]}\n\n"
+        "Respond again with a single valid JSON object only (no markdown, no prose) "
+        f"matching this JSON schema:\n{json.dumps(schema.model_json_schema())}"
+    )
@@ -0,0 +1,426 @@
+"""Streaming validators for phase output.
+
+Validators are fed the LLM output as it streams in. They track the markdown
+headings seen so far and raise ``OffTrackOutputError`` as soon as the output is
+clearly unusable, so the generation can be aborted before paying for the rest
+of the completion. Document checks run on the finished output.
+"""
+import re
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from typing import Any, List, Optional, Sequence, Tuple
+
+from app.workflow import profiler as spans
+from app.workflow.markdown import parse_heading
+from app.workflow.profiler import WorkflowProfiler
+
+# Phrases that indicate the model refused or could not complete the task
+REFUSAL_PATTERN = re.compile(
+    r"^\W*(i'?m sorry|i am sorry|i can(?:no|')t|i am unable|i'?m unable|"
+    r"as an ai|unfortunately,? i)",
+    re.IGNORECASE,
+)
+
+# Start of a JSON value or of a markdown code fence
+JSON_START_PATTERN = re.compile(r"[{\[]|```")
+
+
+class OffTrackOutputError(Exception):
+    """Raised by a validator when streamed output is clearly off-track."""
+
+    def __init__(self, reason: str):
+        super().__init__(reason)
+        self.reason = reason
+
+
+@dataclass(frozen=True)
+class SectionSpec:
+    """Expected document section, matched against headings by keyword."""
+
+    name: str
+    keywords: Tuple[str, ...]
+    # Titles containing any of these belong to another section, despite a keyword match
+    excludes: Tuple[str, ...] = ()
+
+    def matches(self, title: str) -> bool:
+        """Check whether a heading title satisfies this section."""
+        title_lower = title.lower()
+        if any(exclude.lower() in title_lower for exclude in self.excludes):
+            return False
+        return any(keyword.lower() in title_lower for keyword in self.keywords)
+
+
+@dataclass
+class SectionReport:
+    """Summary of the sections found in a streamed document."""
+
+    found: List[str] = field(default_factory=list)
+    missing: List[str] = field(default_factory=list)
+    headings: int = 0
+
+    def to_dict(self) -> dict:
+        """Convert report to a JSON-serializable dict."""
+        return {"found": self.found, "missing": self.missing, "headings": self.headings}
+
+
+class StreamValidator:
+    """Base class for incremental validators of streamed output."""
+
+    def feed(self, delta: str) -> None:
+        """Feed a streamed chunk of output.
+
+        Args:
+            delta: Newly received text
+
+        Raises:
+            OffTrackOutputError: If the output is clearly off-track
+
+        """
+
+    def finish(self) -> Optional[SectionReport]:
+        """Finish validation once the stream has ended.
+
+        Returns:
+            Optional SectionReport
+
+        Raises:
+            OffTrackOutputError: If the output is off-track
+
+        """
+        return None
+
+
+class JsonStreamValidator(StreamValidator):
+    """Incremental validator for streamed JSON output.
+
+    A short prose lead-in ("Here is the JSON:") is allowed, since the output is
+    repaired before parsing. Aborts on a refusal, or when no JSON value (or
+    code fence) starts within the first ``max_prose_chars`` characters.
+    """
+
+    def __init__(self, max_prose_chars: int = 200) -> None:
+        """Initialize validator.
+
+        Args:
+            max_prose_chars: Characters of prose allowed before the JSON value
+
+        """
+        self.max_prose_chars = max_prose_chars
+        self._prefix = ""
+        self._checked = False
+
+    def feed(self, delta: str) -> None:
+        """Check the start of the output until the JSON value begins."""
+        if self._checked:
+            return
+
+        self._prefix = (self._prefix + delta).lstrip()
+        json_start = JSON_START_PATTERN.search(self._prefix)
+        if json_start and json_start.start() <= self.max_prose_chars:
+            self._checked = True
+        elif REFUSAL_PATTERN.match(self._prefix):
+            self._checked = True
+            raise OffTrackOutputError("Model refused to produce JSON")
+        elif len(self._prefix) > self.max_prose_chars:
+            self._checked = True
+            raise OffTrackOutputError(f"No JSON in the first {self.max_prose_chars} characters")
+
+    def finish(self) -> Optional[SectionReport]:
+        """Check short outputs when the stream ends."""
+        if not self._checked and self._prefix:
+            raise OffTrackOutputError("Output is not JSON")
+        return None
+
+
+class MarkdownStreamValidator(StreamValidator):
+    """Incremental validator for streamed markdown documents."""
+
+    def __init__(
+        self,
+        expected_sections: Sequence[SectionSpec] = (),
+        probe_chars: int = 300,
+        min_latin_ratio: float = 0.6,
+        max_chars_without_heading: Optional[int] = None,
+    ):
+        """Initialize validator.
+
+        Args:
+            expected_sections: Sections the document should contain
+            probe_chars: Characters to collect before running the early checks
+            min_latin_ratio: Minimum share of Latin letters (wrong-language check)
+            max_chars_without_heading: Abort if no heading appears within this many
+                characters (None disables the check)
+
+        """
+        self.expected_sections = list(expected_sections)
+        self.probe_chars = probe_chars
+        self.min_latin_ratio = min_latin_ratio
+        self.max_chars_without_heading = max_chars_without_heading
+
+        self._buffer = ""  # Incomplete trailing line
+        self._length = 0
+        self._probe = ""
+        self._probed = False
+        self._headings = 0
+        self._found: List[str] = []
+
+    def feed(self, delta: str) -> None:
+        """Feed a streamed chunk of output.
+
+        Args:
+            delta: Newly received text
+
+        Raises:
+            OffTrackOutputError: If the output is clearly off-track
+
+        """
+        self._length += len(delta)
+
+        if not self._probed:
+            self._probe += delta
+            if len(self._probe.strip()) >= self.probe_chars:
+                self._run_probe_checks()
+
+        self._buffer += delta
+        *lines, self._buffer = self._buffer.split("\n")
+        for line in lines:
+            self._handle_line(line)
+
+        if (
+            self.max_chars_without_heading is not None
+            and self._headings == 0
+            and self._length > self.max_chars_without_heading
+        ):
+            raise OffTrackOutputError(
+                f"No markdown heading in the first {self.max_chars_without_heading} characters"
+            )
+
+    def finish(self) -> SectionReport:
+        """Finish validation once the stream has ended.
+
+        Returns:
+            SectionReport with found and missing sections
+
+        Raises:
+            OffTrackOutputError: If the (short) output failed the early checks
+
+        """
+        if self._buffer:
+            self._handle_line(self._buffer)
+            self._buffer = ""
+        if not self._probed:
+            self._run_probe_checks()
+
+        missing = [spec.name for spec in self.expected_sections if spec.name not in self._found]
+        return SectionReport(found=list(self._found), missing=missing, headings=self._headings)
+
+    def _handle_line(self, line: str) -> None:
+        """Record a complete line of output."""
+        heading = parse_heading(line)
+        if not heading:
+            return
+
+        self._headings += 1
+        _, title = heading
+        for spec in self.expected_sections:
+            if spec.name not in self._found and spec.matches(title):
+                self._found.append(spec.name)
+
+    def _run_probe_checks(self) -> None:
+        """Run the early checks on the beginning of the output."""
+        self._probed = True
+        probe = self._probe.lstrip()
+        self._probe = ""
+
+        if not probe:
+            return
+
+        if probe.startswith(("{", "[", "```json")):
+            raise OffTrackOutputError("Output is JSON instead of markdown")
+
+        if REFUSAL_PATTERN.match(probe):
+            raise OffTrackOutputError("Model refused to generate the document")
+
+        letters = [ch for ch in probe if ch.isalpha()]
+        if letters:
+            latin = sum(1 for ch in letters if ch.isascii() or "À" <= ch <= "ɏ")
+            if latin / len(letters) < self.min_latin_ratio:
+                raise OffTrackOutputError("Output is not in the expected language")
+
+
+# Expected sections per document type
+PRD_SECTIONS = (
+    SectionSpec("Project Overview & Vision", ("overview", "vision")),
+    SectionSpec("Strategic Alignment & Success Metrics", ("strategic", "success metrics")),
+    SectionSpec("Target Users & Personas", ("target users", "personas")),
+    SectionSpec("User Stories & Acceptance Criteria", ("user stories", "acceptance criteria")),
+    SectionSpec(
+        "Functional Requirements",
+        ("functional requirements",),
+        excludes=("non-functional", "nonfunctional", "non functional"),
+    ),
+    SectionSpec("Scope & In-Scope Features", ("in-scope", "in scope")),
+    SectionSpec("Out-of-Scope", ("out-of-scope", "out of scope", "post-mvp")),
+    SectionSpec("Non-Functional Requirements", ("non-functional", "nonfunctional")),
+    SectionSpec("Assumptions, Dependencies, Risks", ("assumptions", "dependencies", "risks")),
+)
+
+TECH_STACK_SECTIONS = (
+    SectionSpec("Frontend", ("frontend", "front-end")),
+    SectionSpec("Backend", ("backend", "back-end")),
+    SectionSpec("Infrastructure", ("infrastructure", "devops")),
+)
+
+EXECUTION_PLAN_SECTIONS = (SectionSpec("Stage", ("stage",)),)
+
+# Markdown task checkbox ("- [ ] ..." / "- [x] ...")
+CHECKBOX_PATTERN = re.compile(r"^\s*[-*+]\s+\[[ xX]\]", re.MULTILINE)
+
+
+def score_document(
+    content: str,
+    report: Optional[SectionReport],
+    target_chars: int = 6000,
+    task_weight: float = 0.0,
+) -> float:
+    """Score a generated document locally for ranking variants.
+
+    Combines section coverage, length (saturating at ``target_chars``) and,
+    for plans, the density of task checkboxes.
+
+    Args:
+        content: Document markdown
+        report: Section report from the streaming validator
+        target_chars: Length at which the length score saturates
+        task_weight: Weight of checkbox density (0 for non-plan documents)
+
+    Returns:
+        Score in the range [0.0, 1.0]
+
+    """
+    if report is not None and (report.found or report.missing):
+        coverage = len(report.found) / (len(report.found) + len(report.missing))
+    else:
+        coverage = 1.0
+
+    length_score = min(len(content) / target_chars, 1.0)
+
+    # About two tasks per 1000 characters is a well-broken-down plan
+    checkboxes = len(CHECKBOX_PATTERN.findall(content))
+    task_score = min(checkboxes / max(len(content) / 500, 1.0), 1.0)
+
+    score = (0.6 - task_weight / 2) * coverage + (0.4 - task_weight / 2) * length_score
+    score += task_weight * task_score
+    return round(score, 4)
+
+
+@dataclass(frozen=True)
+class DocumentCheck:
+    """Sanity check of a finished phase document: minimum length and required keywords."""
+
+    name: str
+    min_chars: int
+    too_short_error: str
+    required_keywords: Tuple[str, ...] = ()
+    # With require_all, every keyword must appear (the missing ones are listed); otherwise any one
+    require_all: bool = True
+    missing_error: str = ""
+
+    def failure(self, content: str) -> Optional[str]:
+        """Check a document.
+
+        Args:
+            content: Document markdown
+
+        Returns:
+            Why the document fails the check, or None if it passes
+
+        """
+        if len(content) < self.min_chars:
+            return self.too_short_error
+
+        missing = [keyword for keyword in self.required_keywords if keyword not in content]
+        if self.require_all and missing:
+            return f"{self.missing_error}: {', '.join(missing)}"
+        if not self.require_all and self.required_keywords and len(missing) == len(self.required_keywords):
+            return self.missing_error
+        return None
+
+
+def check_document(
+    check: DocumentCheck, content: str, profiler: Optional[WorkflowProfiler] = None, **attributes: Any
+) -> Optional[str]:
+    """Run a document check, timed as a validation span of the workflow profiler.
+
+    Args:
+        check: Check to run
+        content: Document markdown
+        profiler: Optional workflow profiler
+        **attributes: Extra span attributes (e.g., the variant)
+
+    Returns:
+        Why the document fails the check, or None if it passes
+
+    """
+    with profiler.span(check.name, spans.VALIDATE, **attributes) if profiler else nullcontext() as span:
+        error = check.failure(content)
+        if span is not None:
+            span.attributes["passed"] = error is None
+    return error
+
+
+def first_passing_document(
+    check: DocumentCheck, contents: Sequence[str], profiler: Optional[WorkflowProfiler] = None
+) -> Tuple[Optional[int], Optional[str]]:
+    """Find the first document, in ranking order, that passes a check.
+
+    Args:
+        check: Check to run
+        contents: Candidate documents, best first
+        profiler: Optional workflow profiler
+
+    Returns:
+        Tuple of (index of the first passing document, None), or
+        (None, failure of the best document) if none passes
+
+    """
+    first_error: Optional[str] = None
+    for index, content in enumerate(contents):
+        error = check_document(check, content, profiler, variant=index)
+        if error is None:
+            return index, None
+        first_error = first_error or error
+    return None, first_error
+
+
+EVENT_STORMING_CHECK = DocumentCheck(
+    name="check_event_storming",
+    min_chars=500,
+    too_short_error="Event Storming summary too short - likely generation failed",
+)
+
+PRD_CHECK = DocumentCheck(
+    name="check_prd",
+    min_chars=1000,
+    too_short_error="PRD too short - likely generation failed",
+    required_keywords=("Overview", "Requirements", "Scope", "Features"),
+    require_all=False,
+    missing_error="PRD missing required sections",
+)
+
+TECH_STACK_CHECK = DocumentCheck(
+    name="check_tech_stack",
+    min_chars=500,
+    too_short_error="Tech Stack document too short - likely generation failed",
+    required_keywords=("Frontend", "Backend", "Infrastructure"),
+    missing_error="Tech Stack missing required sections",
+)
+
+EXECUTION_PLAN_CHECK = DocumentCheck(
+    name="check_execution_plan",
+    min_chars=1000,
+    too_short_error="Execution Plan too short - likely generation failed",
+    # Stages, tasks and checkboxes
+    required_keywords=("Stage", "Task", "[", "]"),
+    missing_error="Execution Plan missing required elements",
+)
@@ -0,0 +1,75 @@
+"""Microbenchmark of document response and WebSocket message encoding.
+
+Compares, for a document of ``--size-kb`` of markdown:
+
+- ``pydantic``: the default path, validating into DocumentResponse,
+  converting it to a dict and rendering it with the standard JSONResponse
+- ``bypass``: document_payload() rendered with FastJSONResponse
+- ``ws per socket``: a message encoded for each of ``--sockets`` connections
+- ``ws once``: a message encoded once and reused for every connection
+
+Usage:
+    python benchmarks/json_encoding.py --size-kb 50
+"""
+import argparse
+import json
+import os
+import sys
+import timeit
+from datetime import datetime
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DEBUG", "true")
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+
+from app.core import json_encoding  # noqa: E402
+from app.core.json_encoding import FastJSONResponse, dumps  # noqa: E402
+from app.schemas.document import DocumentResponse, document_payload  # noqa: E402
+
+
+def make_document(size_kb: int) -> SimpleNamespace:
+    """Create a document-like object with about ``size_kb`` of markdown."""
+    paragraph = "## Section\n\nThe system shall support **multi-tenant** workflows – zażółć.\n\n"
+    content = paragraph * (size_kb * 1024 // len(paragraph.encode("utf-8")) + 1)
+    return SimpleNamespace(
+        type="PRD",
+        content_md=content,
+        metadata={"sections": [{"slug": f"section-{i}", "start": i * 80} for i in range(200)]},
+        created_at=datetime.utcnow(),
+        updated_at=datetime.utcnow(),
+    )
+
+
+def main(args: argparse.Namespace) -> None:
+    """Time each encoding path and print microseconds per operation."""
+    document = make_document(args.size_kb)
+    message = {"type": "phase_completed", "phase": "PRD", "document": document_payload(document)}
+    message["document"]["created_at"] = message["document"]["created_at"].isoformat()
+    message["document"]["updated_at"] = message["document"]["updated_at"].isoformat()
+
+    cases = {
+        "pydantic": lambda: JSONResponse(jsonable_encoder(DocumentResponse.model_validate(document))),
+        "bypass": lambda: FastJSONResponse(document_payload(document)),
+        # What WebSocket.send_json does for every connection
+        "ws per socket": lambda: [
+            json.dumps(message, separators=(",", ":"), ensure_ascii=False) for _ in range(args.sockets)
+        ],
+        "ws once": lambda: dumps(message).decode("utf-8"),
+    }
+
+    encoder = "orjson" if json_encoding.orjson is not None else "json (orjson not installed)"
+    print(f"{args.size_kb}KB document, {args.sockets} sockets, encoder: {encoder}")
+    for name, case in cases.items():
+        seconds = min(timeit.repeat(case, number=args.number, repeat=5)) / args.number
+        print(f"{name:<15}{seconds * 1e6:>10.1f} us")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size-kb", type=int, default=50, help="Document size")
+    parser.add_argument("--sockets", type=int, default=10, help="Connections per broadcast")
+    parser.add_argument("--number", type=int, default=200, help="Operations per measurement")
+    main(parser.parse_args())
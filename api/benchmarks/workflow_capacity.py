@@ -0,0 +1,127 @@
+"""Concurrent workflow capacity per connection pool size.
+
+Simulates workflows (phases of one long LLM call plus a few short
+persistence steps) against a pool modelled as a semaphore, comparing two
+ways of using connections:
+
+- ``held``: one session checked out for the whole workflow, as the engine
+  and phase handlers used to do, so a connection idles during every LLM call
+- ``per-step``: a connection checked out only around each persistence step
+
+No database or LLM provider is needed; durations are scaled down by
+``--time-scale`` so a run takes a few seconds.
+
+Usage:
+    python benchmarks/workflow_capacity.py --workflows 100 --pool-sizes 5 10 30
+"""
+import argparse
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import List
+
+
+@dataclass
+class Result:
+    """Outcome of one simulated run."""
+
+    mode: str
+    pool_size: int
+    peak_llm_concurrency: int
+    makespan: float
+    mean_wait: float
+
+
+class Pool:
+    """Connection pool stand-in that records how long checkouts wait."""
+
+    def __init__(self, size: int):
+        self._semaphore = asyncio.Semaphore(size)
+        self.waits: List[float] = []
+
+    async def __aenter__(self) -> "Pool":
+        started = time.perf_counter()
+        await self._semaphore.acquire()
+        self.waits.append(time.perf_counter() - started)
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self._semaphore.release()
+
+
+async def run(mode: str, pool_size: int, args: argparse.Namespace) -> Result:
+    """Run all workflows concurrently in one mode.
+
+    Args:
+        mode: "held" or "per-step"
+        pool_size: Connections in the pool
+        args: Command line arguments
+
+    Returns:
+        Result
+
+    """
+    pool = Pool(pool_size)
+    llm_seconds = args.llm_seconds * args.time_scale
+    db_seconds = args.db_ms / 1000 * args.time_scale
+    in_llm = 0
+    peak = 0
+
+    async def llm_call() -> None:
+        nonlocal in_llm, peak
+        in_llm += 1
+        peak = max(peak, in_llm)
+        await asyncio.sleep(llm_seconds)
+        in_llm -= 1
+
+    async def persist() -> None:
+        if mode == "per-step":
+            async with pool:
+                await asyncio.sleep(db_seconds)
+        else:
+            await asyncio.sleep(db_seconds)
+
+    async def phase() -> None:
+        await persist()  # create workflow state
+        await persist()  # load logged cost
+        await llm_call()
+        await persist()  # save state, output and LLM logs
+
+    async def workflow() -> None:
+        if mode == "held":
+            async with pool:
+                for _ in range(args.phases):
+                    await phase()
+        else:
+            for _ in range(args.phases):
+                await phase()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(workflow() for _ in range(args.workflows)))
+    makespan = (time.perf_counter() - started) / args.time_scale
+    mean_wait = sum(pool.waits) / len(pool.waits) / args.time_scale if pool.waits else 0.0
+    return Result(mode, pool_size, peak, makespan, mean_wait)
+
+
+async def main(args: argparse.Namespace) -> None:
+    """Run every mode for every pool size and print a table."""
+    print(f"{args.workflows} workflows x {args.phases} phases, LLM call {args.llm_seconds}s, DB step {args.db_ms}ms")
+    print(f"{'mode':<10}{'pool':>6}{'in LLM I/O':>12}{'makespan (s)':>15}{'mean wait (s)':>15}")
+    for pool_size in args.pool_sizes:
+        for mode in ("held", "per-step"):
+            result = await run(mode, pool_size, args)
+            print(
+                f"{result.mode:<10}{result.pool_size:>6}{result.peak_llm_concurrency:>12}"
+                f"{result.makespan:>15.1f}{result.mean_wait:>15.2f}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workflows", type=int, default=100, help="Workflows started at once")
+    parser.add_argument("--phases", type=int, default=5, help="Phases per workflow")
+    parser.add_argument("--llm-seconds", type=float, default=30.0, help="Duration of an LLM call")
+    parser.add_argument("--db-ms", type=float, default=20.0, help="Duration of a persistence step")
+    parser.add_argument("--pool-sizes", type=int, nargs="+", default=[5, 10, 30], help="Pool sizes to compare")
+    parser.add_argument("--time-scale", type=float, default=0.001, help="Real seconds per simulated second")
+    asyncio.run(main(parser.parse_args()))
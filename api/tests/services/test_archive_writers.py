@@ -0,0 +1,76 @@
+"""Tests for streaming archive writers."""
+import io
+import tarfile
+import zipfile
+from datetime import datetime
+
+import pytest
+
+from app.services.archive_writers import ArchiveWriter, create_archive_writer
+
+FILES = {
+    "project/prd.md": ("# PRD\n\n" + "Zażółć gęślą jaźń. " * 2000).encode("utf-8"),
+    "project/manifest.json": b'{"documents": []}',
+}
+MODIFIED = datetime(2025, 11, 9, 12, 0, 0)
+
+
+def build_archive(export_format: str, chunk_size: int = 1000) -> bytes:
+    """Write FILES in small chunks, draining output after every write."""
+    writer = create_archive_writer(export_format)
+    output = []
+    for name, data in FILES.items():
+        writer.start_file(name, len(data), MODIFIED)
+        for i in range(0, len(data), chunk_size):
+            writer.write(data[i : i + chunk_size])
+            output.append(writer.drain())
+        writer.end_file()
+    writer.close()
+    output.append(writer.drain())
+    return b"".join(output)
+
+
+def test_zip_archive_is_readable():
+    """Test a zip streamed to a non-seekable sink can be read back."""
+    with zipfile.ZipFile(io.BytesIO(build_archive("zip"))) as archive:
+        assert archive.testzip() is None
+        for name, data in FILES.items():
+            assert archive.read(name) == data
+
+
+def test_tar_gz_archive_is_readable():
+    """Test a tar.gz with hand-written headers can be read back."""
+    with tarfile.open(fileobj=io.BytesIO(build_archive("tar.gz")), mode="r:gz") as archive:
+        for name, data in FILES.items():
+            member = archive.getmember(name)
+            assert member.size == len(data)
+            assert archive.extractfile(member).read() == data
+
+
+def test_tar_rejects_size_mismatch():
+    """Test writing more data than declared in the tar header fails."""
+    writer = create_archive_writer("tar.gz")
+    writer.start_file("a.md", 3, MODIFIED)
+    with pytest.raises(ValueError):
+        writer.write(b"four")
+
+
+def test_markdown_bundle_and_unknown_format():
+    """Test the markdown bundle concatenates files and unknown formats are rejected."""
+    bundle = build_archive("md").decode("utf-8")
+    assert bundle.startswith("<!-- project/prd.md -->")
+    assert "\n\n---\n\n<!-- project/manifest.json -->" in bundle
+
+    with pytest.raises(ValueError):
+        create_archive_writer("rar")
+
+
+def test_incomplete_writer_cannot_be_created():
+    """Test a writer that does not implement start_file and write fails at construction."""
+
+    class IncompleteWriter(ArchiveWriter):
+        def start_file(self, name: str, size_bytes: int, modified: datetime) -> None:
+            pass
+
+    with pytest.raises(TypeError):
+        IncompleteWriter()
@@ -0,0 +1,72 @@
+"""Tests for import cost: heavy optional dependencies must load lazily."""
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict
+
+import pytest
+
+from app.services.llm_service import LLMService
+
+API_ROOT = Path(__file__).resolve().parents[2]
+
+# Generous ceiling for the cumulative import time of the service modules (seconds)
+IMPORT_BUDGET_SECONDS = 3.0
+
+
+def import_profile(statement: str) -> Dict[str, int]:
+    """Run a statement in a fresh interpreter under ``python -X importtime``.
+
+    Args:
+        statement: Python code to run
+
+    Returns:
+        Cumulative import time in microseconds per imported module
+
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=API_ROOT,
+        env={**os.environ, "DEBUG": "true"},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    profile = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line[len("import time:"):].split("|")
+        profile[module.strip()] = int(cumulative)
+    return profile
+
+
+def test_langfuse_is_not_imported_with_services():
+    """Test importing the LLM and LangFuse services does not import langfuse."""
+    profile = import_profile("import app.services.langfuse_service, app.services.llm_service")
+
+    assert "app.services.langfuse_service" in profile
+    assert not [module for module in profile if module.split(".")[0] == "langfuse"]
+
+
+def test_service_import_time_within_budget():
+    """Test the service modules import within the regression budget."""
+    profile = import_profile("import app.services.langfuse_service, app.services.llm_service")
+
+    total = profile["app.services.llm_service"] + profile["app.services.langfuse_service"]
+    assert total / 1_000_000 < IMPORT_BUDGET_SECONDS
+
+
+@pytest.mark.asyncio
+async def test_llm_service_opens_client_lazily():
+    """Test the HTTP client is created on first use, not at construction."""
+    service = LLMService()
+    assert service._client is None
+
+    client = service.client
+    assert client is service.client
+
+    await service.close()
+    assert client.is_closed
+    assert service._client is None
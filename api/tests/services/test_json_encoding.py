@@ -0,0 +1,71 @@
+"""Tests for fast JSON encoding of responses and WebSocket messages."""
+import json
+from datetime import datetime
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from app.core import json_encoding
+from app.core.json_encoding import FastJSONResponse, dumps
+from app.core.websocket_manager import ConnectionManager
+from app.schemas.document import DocumentResponse, document_payload
+
+
+def make_document() -> SimpleNamespace:
+    """Create a document-like object with non-ASCII content."""
+    return SimpleNamespace(
+        type="PRD",
+        content_md="# Wymagania – zażółć gęślą jaźń\n" * 100,
+        metadata={"sections": [{"slug": "wymagania", "start": 0}]},
+        created_at=datetime(2024, 5, 1, 12, 30, 15, 123456),
+        updated_at=datetime(2024, 5, 2, 8, 0),
+    )
+
+
+@pytest.mark.parametrize("fast", [True, False])
+def test_document_payload_matches_pydantic_response(monkeypatch, fast):
+    """Test the bypass encodes a document exactly like DocumentResponse does."""
+    if not fast:
+        monkeypatch.setattr(json_encoding, "orjson", None)
+    document = make_document()
+
+    encoded = json.loads(dumps(document_payload(document)))
+
+    assert encoded == json.loads(DocumentResponse.model_validate(document).model_dump_json())
+
+
+@pytest.mark.parametrize("fast", [True, False])
+def test_dumps_encodes_uuids_and_decimals(monkeypatch, fast):
+    """Test UUIDs, datetimes and decimals are encoded with or without orjson."""
+    if not fast:
+        monkeypatch.setattr(json_encoding, "orjson", None)
+    project_id = uuid4()
+
+    encoded = json.loads(dumps({"id": project_id, "cost": Decimal("0.25"), "at": datetime(2024, 1, 1)}))
+
+    assert encoded == {"id": str(project_id), "cost": 0.25, "at": "2024-01-01T00:00:00"}
+
+
+def test_fast_json_response_renders_compact_utf8():
+    """Test the response class renders compact, non-escaped UTF-8."""
+    response = FastJSONResponse({"title": "zażółć", "ok": True})
+
+    assert response.body == '{"title":"zażółć","ok":true}'.encode("utf-8")
+
+
+@pytest.mark.asyncio
+async def test_broadcast_encodes_once_for_all_connections():
+    """Test a broadcast message is encoded once and sent as the same text frame."""
+    manager = ConnectionManager()
+    project_id = uuid4()
+    sockets = [MagicMock(send_text=AsyncMock()) for _ in range(3)]
+    manager.active_connections[str(project_id)] = list(sockets)
+
+    await manager.broadcast(project_id, {"type": "phase_started", "project_id": project_id})
+
+    payloads = [socket.send_text.await_args.args[0] for socket in sockets]
+    assert payloads[0] is payloads[1] is payloads[2]
+    assert json.loads(payloads[0])["project_id"] == str(project_id)
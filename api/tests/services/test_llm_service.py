@@ -1,4 +1,8 @@
 """Tests for LLM service."""
+import asyncio
+import json
+
+import httpx
 import pytest
 from unittest.mock import AsyncMock, Mock, patch
 
@@ -158,3 +162,91 @@ async def test_llm_service_close():
     with patch.object(service.client, "aclose") as mock_close:
         await service.close()
         mock_close.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_llm_call_streaming():
+    """Test streaming LLM call collects deltas and usage."""
+    service = LLMService()
+    events = [
+        'data: {"choices": [{"delta": {"content": "# Title"}}]}',
+        ": OPENROUTER PROCESSING",
+        'data: {"choices": [{"delta": {"content": "\\nBody"}}]}',
+        'data: {"choices": [], "usage": {"prompt_tokens": 10, "completion_tokens": 4, "total_tokens": 14}}',
+        "data: [DONE]",
+    ]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert json.loads(request.content)["stream"] is True
+        return httpx.Response(200, text="\n\n".join(events))
+
+    service.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    deltas = []
+
+    result = await service.call_streaming(
+        model="openai/gpt-4o-mini",
+        prompt="Test prompt",
+        on_delta=deltas.append,
+    )
+
+    assert deltas == ["# Title", "\nBody"]
+    assert result.content == "# Title\nBody"
+    assert result.usage["total_tokens"] == 14
+    assert result.cost_usd > 0
+
+
+@pytest.mark.asyncio
+async def test_llm_call_streaming_abort():
+    """Test an exception from the delta callback stops the stream."""
+    service = LLMService()
+    events = [f'data: {{"choices": [{{"delta": {{"content": "chunk{i}"}}}}]}}' for i in range(5)]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, text="\n\n".join(events))
+
+    service.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    deltas = []
+
+    def on_delta(delta: str) -> None:
+        deltas.append(delta)
+        if len(deltas) == 2:
+            raise RuntimeError("off-track")
+
+    with pytest.raises(RuntimeError):
+        await service.call_streaming(model="openai/gpt-4o-mini", prompt="Test", on_delta=on_delta)
+
+    assert deltas == ["chunk0", "chunk1"]
+
+
+def test_estimate_usage():
+    """Test token usage estimate for partial completions."""
+    service = LLMService()
+    usage = service.estimate_usage("a" * 400, "b" * 40)
+
+    assert usage["prompt_tokens"] == 100
+    assert usage["completion_tokens"] == 10
+    assert usage["total_tokens"] == 110
+
+
+@pytest.mark.asyncio
+async def test_llm_call_timeout_aborts_request():
+    """Test a call is aborted when its time limit expires."""
+    service = LLMService()
+
+    async def slow_post(*args, **kwargs):
+        await asyncio.sleep(10)
+
+    with patch.object(service.client, "post", side_effect=slow_post) as mock_post:
+        with pytest.raises(TimeoutError):
+            await service.call(model="openai/gpt-4o-mini", prompt="Test prompt", timeout=0.05)
+
+    # The HTTP timeout is shortened to the time limit as well
+    assert mock_post.call_args.kwargs["timeout"].read == 0.05
+
+
+def test_estimate_cost_assumes_full_completion():
+    """Test the pre-flight estimate bills max_tokens of output."""
+    service = LLMService()
+    cost = service.estimate_cost("openai/gpt-4o-mini", "x" * 4000, max_tokens=1000)
+    # 1000 prompt tokens at $0.15/1M + 1000 completion tokens at $0.60/1M
+    assert cost == pytest.approx(0.00075)
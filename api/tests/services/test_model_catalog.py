@@ -0,0 +1,113 @@
+"""Tests for the model catalog."""
+import json
+import os
+
+import pytest
+
+from app.services.model_catalog import (
+    DEFAULT_CATALOG_PATH,
+    ModelCatalog,
+    ModelCatalogError,
+    parse_catalog,
+)
+from app.workflow.state_machine import WorkflowPhase
+
+
+def catalog_data(**routing_overrides) -> dict:
+    """Build a valid catalog routing every phase to one model."""
+    routing = {phase.value: {"default": "cheap/model"} for phase in WorkflowPhase}
+    routing.update(routing_overrides)
+    return {
+        "models": {
+            "cheap/model": {"input_price": 0.1, "output_price": 0.4, "context_window": 128000, "json_schema": True},
+            "big/model": {"input_price": 3.0, "output_price": 15.0, "context_window": 200000},
+        },
+        "routing": routing,
+    }
+
+
+def write_catalog(path, data: dict, mtime: float) -> None:
+    """Write a catalog file with a fixed modification time."""
+    path.write_text(json.dumps(data), encoding="utf-8")
+    os.utime(path, (mtime, mtime))
+
+
+def test_bundled_catalog_is_valid():
+    """Test the bundled catalog routes every phase."""
+    catalog = ModelCatalog(DEFAULT_CATALOG_PATH)
+    for phase in WorkflowPhase:
+        assert catalog.model_for(phase.value) in catalog
+
+
+def test_model_for_falls_back_to_default_role(tmp_path):
+    """Test routing by role, falling back to the phase default."""
+    path = tmp_path / "models.json"
+    write_catalog(path, catalog_data(PRD={"default": "cheap/model", "review": "big/model"}), mtime=1000)
+    catalog = ModelCatalog(path)
+    assert catalog.model_for("PRD", "review") == "big/model"
+    assert catalog.model_for("PRD", "unknown_role") == "cheap/model"
+
+
+@pytest.mark.parametrize(
+    "data, message",
+    [
+        (catalog_data(PRD={"default": "missing/model"}), "unknown model"),
+        (catalog_data(PRD={"review": "cheap/model"}), "no 'default' model"),
+        (catalog_data(UNKNOWN_PHASE={"default": "cheap/model"}), "Unknown phases"),
+        ({**catalog_data(), "models": {}}, "Invalid model catalog"),
+    ],
+)
+def test_invalid_catalog_rejected(data, message):
+    """Test catalogs with unrouted phases or unknown models are rejected."""
+    with pytest.raises(ModelCatalogError, match=message):
+        parse_catalog(json.dumps(data))
+
+
+def test_negative_price_rejected():
+    """Test model specs are validated."""
+    data = catalog_data()
+    data["models"]["cheap/model"]["input_price"] = -1
+    with pytest.raises(ModelCatalogError):
+        parse_catalog(json.dumps(data))
+
+
+def test_yaml_catalog():
+    """Test YAML catalogs are parsed when PyYAML is installed."""
+    yaml = pytest.importorskip("yaml")
+    definition = parse_catalog(yaml.safe_dump(catalog_data()), ".yaml")
+    assert definition.models["big/model"].context_window == 200000
+
+
+def test_reloads_when_file_changes(tmp_path):
+    """Test the catalog is reloaded after the file is modified."""
+    path = tmp_path / "models.json"
+    write_catalog(path, catalog_data(), mtime=1000)
+    catalog = ModelCatalog(path, check_interval=0.001)
+    assert catalog.model_for("PRD") == "cheap/model"
+
+    write_catalog(path, catalog_data(PRD={"default": "big/model"}), mtime=2000)
+    catalog._checked_at = 0
+    assert catalog.model_for("PRD") == "big/model"
+
+
+def test_invalid_reload_keeps_previous_catalog(tmp_path):
+    """Test an invalid edit does not replace the active catalog."""
+    path = tmp_path / "models.json"
+    write_catalog(path, catalog_data(), mtime=1000)
+    catalog = ModelCatalog(path, check_interval=0.001)
+    catalog.load()
+
+    write_catalog(path, catalog_data(PRD={"default": "missing/model"}), mtime=2000)
+    catalog._checked_at = 0
+    assert catalog.model_for("PRD") == "cheap/model"
+    with pytest.raises(ModelCatalogError):
+        catalog.load()
+
+
+def test_unknown_model_priced_as_most_expensive(tmp_path):
+    """Test unknown models are never priced below the catalog maximum."""
+    path = tmp_path / "models.json"
+    write_catalog(path, catalog_data(), mtime=1000)
+    catalog = ModelCatalog(path)
+    assert catalog.pricing("unknown/model").output_price == 15.0
+    assert catalog.pricing("cheap/model").output_price == 0.4
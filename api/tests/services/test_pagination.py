@@ -0,0 +1,19 @@
+"""Tests for keyset pagination cursors."""
+import pytest
+
+from app.core.pagination import decode_cursor, encode_cursor
+
+
+def test_cursor_roundtrip_preserves_float_exactly():
+    """Test cursors round-trip sort keys, including float ranks, exactly."""
+    values = {"rank": 0.1000000014901161, "id": "6f1c9a0e-0000-4000-8000-000000000001"}
+    cursor = encode_cursor(values)
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == values
+
+
+@pytest.mark.parametrize("cursor", ["not base64!", "W10", "e30x"])
+def test_invalid_cursor_raises(cursor):
+    """Test malformed cursors raise ValueError."""
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
@@ -0,0 +1,65 @@
+"""Tests for connection pool configuration and metrics."""
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, QueuePool
+
+from app.config import Settings
+from app.db.pool import PoolMetrics, engine_options, instrumented_pool_class
+
+
+def test_engine_options_use_pool_settings():
+    """Test pool size, overflow and timeouts come from settings."""
+    config = Settings(DEBUG=True, DB_POOL_SIZE=5, DB_MAX_OVERFLOW=2, DB_POOL_TIMEOUT_SECONDS=3)
+
+    options = engine_options(config, PoolMetrics())
+
+    assert issubclass(options["poolclass"], AsyncAdaptedQueuePool)
+    assert options["pool_size"] == 5
+    assert options["max_overflow"] == 2
+    assert options["pool_timeout"] == 3
+    assert "statement_cache_size" not in options["connect_args"]
+
+
+def test_engine_options_pgbouncer_mode():
+    """Test PgBouncer mode drops the app-side pool and the statement caches."""
+    config = Settings(DEBUG=True, DB_PGBOUNCER=True, DB_POOL_SIZE=5)
+
+    options = engine_options(config, PoolMetrics())
+
+    assert issubclass(options["poolclass"], NullPool)
+    assert "pool_size" not in options
+    assert options["connect_args"]["statement_cache_size"] == 0
+    assert options["connect_args"]["prepared_statement_cache_size"] == 0
+
+
+def test_metrics_track_checkouts_and_overflow():
+    """Test checked-out connections, overflow and waits are reported."""
+    metrics = PoolMetrics()
+    engine = create_engine(
+        "sqlite://",
+        poolclass=instrumented_pool_class(QueuePool, metrics),
+        pool_size=1,
+        max_overflow=1,
+        pool_timeout=0.05,
+    )
+    event.listen(engine, "checkout", metrics.on_checkout)
+    event.listen(engine, "checkin", metrics.on_checkin)
+
+    first = engine.connect()
+    second = engine.connect()
+    snapshot = metrics.snapshot(engine.pool)
+    assert snapshot["checked_out"] == 2
+    assert snapshot["overflow"] == 1
+
+    with pytest.raises(PoolTimeoutError):
+        engine.connect()
+
+    first.close()
+    second.close()
+    snapshot = metrics.snapshot(engine.pool)
+    assert snapshot["checked_out"] == 0
+    assert snapshot["peak_checked_out"] == 2
+    assert snapshot["checkouts"] == 3
+    assert snapshot["timeouts"] == 1
+    assert snapshot["max_wait_ms"] >= 50
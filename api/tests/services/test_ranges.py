@@ -0,0 +1,27 @@
+"""Tests for HTTP byte range parsing."""
+import pytest
+
+from app.core.ranges import RangeNotSatisfiableError, content_range, parse_byte_range
+
+
+def test_parse_byte_range_forms():
+    """Test closed, open-ended and suffix ranges are clamped to the resource."""
+    assert parse_byte_range("bytes=0-99", 1000) == (0, 99)
+    assert parse_byte_range("bytes=900-", 1000) == (900, 999)
+    assert parse_byte_range("bytes=990-2000", 1000) == (990, 999)
+    assert parse_byte_range("bytes=-100", 1000) == (900, 999)
+    assert parse_byte_range("bytes=-5000", 1000) == (0, 999)
+    assert content_range(0, 99, 1000) == "bytes 0-99/1000"
+
+
+def test_unsupported_ranges_are_ignored():
+    """Test missing, malformed and multi-range headers serve the full resource."""
+    for header in (None, "", "items=0-10", "bytes=10-5", "bytes=0-10,20-30", "bytes=-"):
+        assert parse_byte_range(header, 1000) is None
+
+
+def test_unsatisfiable_ranges_raise():
+    """Test ranges outside the resource are rejected."""
+    for header, size in (("bytes=1000-", 1000), ("bytes=-0", 1000), ("bytes=-10", 0)):
+        with pytest.raises(RangeNotSatisfiableError):
+            parse_byte_range(header, size)
@@ -0,0 +1,51 @@
+"""Tests for read-replica routing."""
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+from app.db.routing import after_flush, written_project_ids, written_recently
+
+
+def test_written_recently_within_window():
+    """Test a project stays on the primary only within the window after its update."""
+    now = datetime(2025, 1, 1, 12, 0, 0)
+
+    assert written_recently(now - timedelta(seconds=9.9), 10, now=now)
+    assert not written_recently(now - timedelta(seconds=10), 10, now=now)
+    # Unknown projects are looked up on the primary (which answers the 404)
+    assert written_recently(None, 10, now=now)
+
+
+def test_written_project_ids_from_projects_and_child_rows():
+    """Test both projects and rows with a project_id are attributed to their project."""
+    project = SimpleNamespace(__tablename__="projects", id=uuid4())
+    document = SimpleNamespace(__tablename__="documents", id=uuid4(), project_id=uuid4())
+    blob = SimpleNamespace(__tablename__="document_blobs", sha256="abc")
+
+    assert written_project_ids([project, document, blob]) == {project.id, document.project_id}
+
+
+def test_after_flush_touches_projects_of_child_rows():
+    """Test the after_flush listener bumps updated_at of projects whose rows changed."""
+    new_log = SimpleNamespace(project_id=uuid4())
+    changed_project = SimpleNamespace(__tablename__="projects", id=uuid4())
+    child_of_changed = SimpleNamespace(project_id=changed_project.id)
+    session = SimpleNamespace(new=[new_log, child_of_changed], dirty=[changed_project], deleted=[])
+    session.connection = MagicMock()
+
+    after_flush(session, None)
+
+    statement = session.connection.return_value.execute.call_args.args[0]
+    assert statement.table.name == "projects"
+    assert statement.compile().params["id_1"] == [new_log.project_id]
+
+
+def test_after_flush_without_child_rows_does_nothing():
+    """Test a flush of projects only issues no extra statement."""
+    session = SimpleNamespace(new=[SimpleNamespace(__tablename__="projects", id=uuid4())], dirty=[], deleted=[])
+    session.connection = MagicMock()
+
+    after_flush(session, None)
+
+    session.connection.assert_not_called()
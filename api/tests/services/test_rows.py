@@ -0,0 +1,65 @@
+"""Tests for JSON row encoding."""
+import json
+import uuid
+from datetime import datetime
+from decimal import Decimal
+
+from sqlalchemy import Column, DateTime, Integer, LargeBinary, MetaData, Numeric, String, Table
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+
+from app.db.rows import decode_row, encode_row, rows_to_csv, rows_to_ndjson
+
+table = Table(
+    "sample",
+    MetaData(),
+    Column("id", UUID(as_uuid=True), primary_key=True),
+    Column("name", String(50)),
+    Column("count", Integer),
+    Column("cost_usd", Numeric(10, 6)),
+    Column("data", LargeBinary),
+    Column("attributes", JSONB),
+    Column("created_at", DateTime),
+)
+
+
+def test_row_roundtrip_through_json():
+    """Test encoded rows survive JSON and decode to the original values."""
+    row = {
+        "id": uuid.uuid4(),
+        "name": "PRD",
+        "count": 3,
+        "cost_usd": Decimal("0.001234"),
+        "data": b"\x00\x01binary",
+        "attributes": {"nested": [1, "two"]},
+        "created_at": datetime(2025, 11, 9, 12, 30, 15, 123456),
+    }
+    encoded = json.loads(json.dumps(encode_row(row)))
+    assert decode_row(table, encoded) == row
+
+
+def test_encode_excludes_and_decode_ignores_unknown_columns():
+    """Test excluded columns are skipped and unknown keys dropped on decode."""
+    encoded = encode_row({"name": "x", "search_vector": "'x':1"}, exclude={"search_vector"})
+    assert encoded == {"name": "x"}
+    assert decode_row(table, {"name": "x", "removed_column": 1, "count": None}) == {
+        "name": "x",
+        "count": None,
+    }
+
+
+def test_rows_to_ndjson_and_csv():
+    """Test rows serialize to NDJSON lines and CSV with JSON-encoded nested values."""
+    rows = [
+        {"name": "a", "cost_usd": Decimal("0.5"), "attributes": {"k": 1}},
+        {"name": "b,c", "cost_usd": None, "attributes": None},
+    ]
+
+    lines = rows_to_ndjson(rows).splitlines()
+    assert [json.loads(line)["name"] for line in lines] == ["a", "b,c"]
+
+    csv_text = rows_to_csv(rows, ["name", "cost_usd", "attributes"], include_header=True)
+    assert csv_text.splitlines() == [
+        "name,cost_usd,attributes",
+        'a,0.5,"{""k"": 1}"',
+        '"b,c",,',
+    ]
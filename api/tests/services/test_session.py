@@ -0,0 +1,44 @@
+"""Tests for database session scopes."""
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.db.session import session_scope
+
+
+def make_factory() -> tuple:
+    """Create a session factory returning one mock session."""
+    session = MagicMock()
+    session.commit = AsyncMock()
+    session.rollback = AsyncMock()
+    context = MagicMock()
+    context.__aenter__ = AsyncMock(return_value=session)
+    context.__aexit__ = AsyncMock(return_value=False)
+    return MagicMock(return_value=context), session, context
+
+
+@pytest.mark.asyncio
+async def test_session_scope_commits_and_closes():
+    """Test a successful unit of work is committed and its session closed."""
+    factory, session, context = make_factory()
+
+    async with session_scope(factory) as db:
+        assert db is session
+
+    session.commit.assert_awaited_once()
+    session.rollback.assert_not_awaited()
+    context.__aexit__.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_session_scope_rolls_back_on_error():
+    """Test a failed unit of work is rolled back and its session closed."""
+    factory, session, context = make_factory()
+
+    with pytest.raises(RuntimeError):
+        async with session_scope(factory):
+            raise RuntimeError("boom")
+
+    session.commit.assert_not_awaited()
+    session.rollback.assert_awaited_once()
+    context.__aexit__.assert_awaited_once()
@@ -0,0 +1,72 @@
+"""Tests for workflow cost budgets."""
+from unittest.mock import patch
+
+import pytest
+
+from app.workflow.budget import BudgetExceededError, choose_model, downgrade_chain, resolve_budget
+
+MODELS = {"big", "medium", "small"}
+DOWNGRADES = {"big": "medium", "medium": "small"}
+ESTIMATES = {"big": 0.30, "medium": 0.10, "small": 0.02}
+
+
+def test_downgrade_chain_follows_map():
+    """Test the chain lists successively cheaper models."""
+    assert downgrade_chain("big", DOWNGRADES, MODELS) == ["big", "medium", "small"]
+    assert downgrade_chain("small", DOWNGRADES, MODELS) == ["small"]
+
+
+def test_downgrade_chain_stops_at_cycles_and_unknown_models():
+    """Test cycles and replacements without pricing end the chain."""
+    assert downgrade_chain("big", {"big": "medium", "medium": "big"}, MODELS) == ["big", "medium"]
+    assert downgrade_chain("big", {"big": "unknown"}, MODELS) == ["big"]
+
+
+def test_choose_model_keeps_model_within_budget():
+    """Test no downgrade happens while the call fits the budget."""
+    choice = choose_model("big", 0.5, 1.0, ESTIMATES.get, DOWNGRADES, MODELS)
+    assert choice.model == "big"
+    assert not choice.downgraded
+    assert choice.projected_cost_usd == pytest.approx(0.8)
+
+
+def test_choose_model_downgrades_until_call_fits():
+    """Test the first candidate that fits the budget is selected."""
+    choice = choose_model("big", 0.95, 1.0, ESTIMATES.get, DOWNGRADES, MODELS)
+    assert choice.model == "small"
+    assert choice.requested_model == "big"
+    assert choice.downgraded
+    assert choice.projected_cost_usd == pytest.approx(0.97)
+
+
+def test_choose_model_uses_cheapest_when_nothing_fits():
+    """Test the cheapest candidate is used when no model fits the remaining budget."""
+    choice = choose_model("big", 0.99, 1.0, ESTIMATES.get, DOWNGRADES, MODELS)
+    assert choice.model == "small"
+
+
+def test_choose_model_refuses_spent_budget():
+    """Test calls are refused once the budget is spent."""
+    with pytest.raises(BudgetExceededError):
+        choose_model("big", 1.0, 1.0, ESTIMATES.get, DOWNGRADES, MODELS)
+
+
+def test_resolve_budget_precedence():
+    """Test the project budget wins over the tier budget, which wins over the default."""
+    with (
+        patch("app.workflow.budget.settings.WORKFLOW_BUDGET_USD", 2.0),
+        patch("app.workflow.budget.settings.WORKFLOW_TIER_BUDGETS_USD", {"free": 0.5}),
+        patch("app.workflow.budget.settings.WORKFLOW_TENANT_TIERS", {"user-1": "free"}),
+    ):
+        assert resolve_budget({"budget_usd": 0.75}, "user-1") == 0.75
+        assert resolve_budget({}, "user-1") == 0.5
+        assert resolve_budget({}, "user-2") == 2.0
+
+
+def test_resolve_budget_unlimited_by_default():
+    """Test a zero budget means unlimited."""
+    with (
+        patch("app.workflow.budget.settings.WORKFLOW_BUDGET_USD", 0.0),
+        patch("app.workflow.budget.settings.WORKFLOW_TIER_BUDGETS_USD", {}),
+    ):
+        assert resolve_budget({}, "user-1") is None
@@ -0,0 +1,82 @@
+"""Tests for cooperative workflow cancellation."""
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from app.workflow.cancellation import CancellationRegistry
+
+
+@pytest.mark.asyncio
+async def test_cancel_interrupts_registered_task():
+    """Test cancelling a workflow cancels its task and records the reason."""
+    registry = CancellationRegistry()
+    project_id = uuid4()
+    started = asyncio.Event()
+
+    async def workflow() -> None:
+        registry.register(project_id)
+        started.set()
+        await asyncio.sleep(10)
+
+    task = asyncio.create_task(workflow())
+    await started.wait()
+
+    assert project_id in registry
+    assert registry.cancel(project_id, "Stopped by user") is True
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert registry.cancel_reason(project_id) == "Stopped by user"
+
+
+@pytest.mark.asyncio
+async def test_cancel_unknown_or_finished_workflow():
+    """Test cancelling a workflow that is not running in this process."""
+    registry = CancellationRegistry()
+    project_id = uuid4()
+    assert registry.cancel(project_id, "reason") is False
+
+    task = asyncio.create_task(asyncio.sleep(0))
+    registry.register(project_id, task)
+    await task
+    assert registry.cancel(project_id, "reason") is False
+    assert registry.cancel_reason(project_id) is None
+
+
+@pytest.mark.asyncio
+async def test_unregister_forgets_reason():
+    """Test unregistering a workflow clears its task and cancellation reason."""
+    registry = CancellationRegistry()
+    project_id = uuid4()
+    task = asyncio.create_task(asyncio.sleep(10))
+    registry.register(project_id, task)
+    registry.cancel(project_id, "reason")
+    registry.unregister(project_id)
+
+    assert project_id not in registry
+    assert registry.cancel_reason(project_id) is None
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+
+
+@pytest.mark.asyncio
+async def test_register_outside_a_task_fails():
+    """Test registering from a loop callback (no current task) raises instead of storing None."""
+    registry = CancellationRegistry()
+    project_id = uuid4()
+    loop = asyncio.get_running_loop()
+    outcome = loop.create_future()
+
+    def callback() -> None:
+        try:
+            registry.register(project_id)
+        except RuntimeError as e:
+            outcome.set_result(e)
+        else:
+            outcome.set_result(None)
+
+    loop.call_soon(callback)
+
+    assert isinstance(await outcome, RuntimeError)
+    assert project_id not in registry
@@ -0,0 +1,45 @@
+"""Tests for document delta encoding."""
+import pytest
+
+from app.workflow.deltas import (
+    apply_delta,
+    compute_delta,
+    content_hash,
+    diff_documents,
+    pack,
+    unpack,
+)
+
+BASE = "".join(f"## Section {i}\nLine of content number {i}.\n" for i in range(200))
+
+
+def test_delta_roundtrip():
+    """Test applying a delta rebuilds the target exactly."""
+    target = BASE.replace("Section 50\n", "Section 50 (revised)\n") + "## Appendix\nNo newline"
+    ops = compute_delta(BASE, target)
+    assert apply_delta(BASE, ops) == target
+    assert apply_delta(BASE, compute_delta(BASE, "")) == ""
+    assert apply_delta("", compute_delta("", target)) == target
+
+
+def test_delta_size_grows_with_change_not_document():
+    """Test a small edit stores far less than the full document."""
+    target = BASE.replace("number 120.", "number 120, edited.")
+    delta = pack(compute_delta(BASE, target))
+    assert len(delta) < len(pack(target)) / 5
+    assert unpack(delta) == compute_delta(BASE, target)
+
+
+def test_apply_delta_rejects_unknown_op():
+    """Test malformed delta operations raise ValueError."""
+    with pytest.raises(ValueError):
+        apply_delta(BASE, [["?", 0, 1]])
+
+
+def test_diff_documents_counts_lines():
+    """Test the server-side diff reports changed lines."""
+    diff = diff_documents("a\nb\nc\n", "a\nB\nc\nd\n", "PRD@v1", "PRD@v2")
+    assert diff["added_lines"] == 2
+    assert diff["removed_lines"] == 1
+    assert diff["unified_diff"].startswith("--- PRD@v1\n+++ PRD@v2\n")
+    assert content_hash("a") != content_hash("b")
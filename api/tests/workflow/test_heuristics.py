@@ -0,0 +1,24 @@
+"""Tests for local idea heuristics."""
+from app.workflow.heuristics import estimate_idea_complexity
+
+
+def test_simple_idea_scores_low():
+    """Test a simple CRUD idea gets a low complexity score."""
+    assert estimate_idea_complexity("A personal todo list app") < 0.3
+
+
+def test_complex_idea_scores_high():
+    """Test a multi-role marketplace idea gets a high complexity score."""
+    idea = (
+        "A marketplace where sellers list products and buyers place orders, with "
+        "payment processing, inventory tracking, refund approval workflow, admin "
+        "moderation, subscription plans for sellers and monthly reporting."
+    )
+    assert estimate_idea_complexity(idea) >= 0.5
+
+
+def test_score_is_bounded():
+    """Test the score stays within [0, 1]."""
+    idea = ", ".join(["payment, order, role, workflow, admin, customer, vendor"] * 50)
+    assert 0.0 <= estimate_idea_complexity(idea) <= 1.0
+    assert estimate_idea_complexity("") == 0.0
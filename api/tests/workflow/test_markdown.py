@@ -0,0 +1,55 @@
+"""Tests for markdown section indexing."""
+from app.workflow.markdown import build_section_index, slugify
+
+DOCUMENT = """# Execution Plan
+
+Intro – with a multi-byte dash.
+
+## Stage 1: Foundation
+
+- [ ] Set up repo
+
+```bash
+# not a heading
+```
+
+### Tasks
+
+Details.
+
+## Stage 2: Features
+
+### Tasks
+
+More details.
+"""
+
+
+def _section(content: str, section: dict) -> str:
+    return content.encode("utf-8")[section["start"] : section["end"]].decode("utf-8")
+
+
+def test_slugify():
+    """Test headings become GitHub-style slugs."""
+    assert slugify("Stage 3: Launch & Growth") == "stage-3-launch-growth"
+    assert slugify("`User Stories`") == "user-stories"
+    assert slugify("!!!") == "section"
+
+
+def test_section_offsets_are_utf8_bytes():
+    """Test sections are sliced by byte offsets and include subsections."""
+    sections = {section["slug"]: section for section in build_section_index(DOCUMENT)}
+
+    stage_1 = _section(DOCUMENT, sections["stage-1-foundation"])
+    assert stage_1.startswith("## Stage 1: Foundation\n")
+    assert "### Tasks" in stage_1
+    assert "Stage 2" not in stage_1
+
+    assert sections["execution-plan"]["end"] == len(DOCUMENT.encode("utf-8"))
+    assert _section(DOCUMENT, sections["tasks-1"]) == "### Tasks\n\nMore details.\n"
+
+
+def test_code_fences_and_duplicate_titles():
+    """Test headings inside code fences are skipped and repeated titles get numbered slugs."""
+    slugs = [section["slug"] for section in build_section_index(DOCUMENT)]
+    assert slugs == ["execution-plan", "stage-1-foundation", "tasks", "stage-2-features", "tasks-1"]
@@ -0,0 +1,62 @@
+"""Tests for execution plan stage and task extraction."""
+from app.workflow.plan_parser import parse_execution_plan
+
+PLAN = """# HANDOFF_STAGES_PLAN
+
+## Overview
+
+- [ ] Not part of any stage
+
+## Stage 1: Project Setup
+
+### Task 1.1: Initialize repository
+
+- [ ] Create the repository
+- [x] Add a README
+
+**Task 1.2: Continuous integration**
+  - [ ] Add a lint workflow
+
+```markdown
+- [ ] Example inside a code fence
+```
+
+## **Stage 2 - Backend**
+
+1. [ ] Create the models
+
+## Stage Gates
+
+## Notes
+
+- [ ] Not part of any stage either
+"""
+
+
+def test_stages_in_document_order():
+    """Test stage headings become stages with their numbers and titles."""
+    stages = parse_execution_plan(PLAN)
+
+    assert [(stage.position, stage.number, stage.title) for stage in stages] == [
+        (1, 1, "Stage 1: Project Setup"),
+        (2, 2, "Stage 2 - Backend"),
+        (3, None, "Stage Gates"),
+    ]
+    assert stages[2].tasks == []
+
+
+def test_checkboxes_grouped_under_task_labels():
+    """Test checkboxes become tasks grouped by task headings and bold labels."""
+    tasks = parse_execution_plan(PLAN)[0].tasks
+
+    assert [(task.position, task.text, task.completed, task.group_title) for task in tasks] == [
+        (1, "Create the repository", False, "Task 1.1: Initialize repository"),
+        (2, "Add a README", True, "Task 1.1: Initialize repository"),
+        (3, "Add a lint workflow", False, "Task 1.2: Continuous integration"),
+    ]
+
+
+def test_checkboxes_outside_stages_and_fences_are_ignored():
+    """Test only checkboxes inside stage sections and outside code fences are extracted."""
+    texts = [task.text for stage in parse_execution_plan(PLAN) for task in stage.tasks]
+    assert texts == ["Create the repository", "Add a README", "Add a lint workflow", "Create the models"]
@@ -0,0 +1,124 @@
+"""Tests for the workflow profiler."""
+import asyncio
+
+import pytest
+
+from app.workflow import profiler as spans
+from app.workflow.profiler import WorkflowProfiler, critical_path, critical_path_breakdown
+from app.workflow.validators import PRD_CHECK, check_document
+
+
+def make_span(span_id, name, category, start, end, parent=None):
+    """Build a serialized span."""
+    return {
+        "id": span_id,
+        "name": name,
+        "category": category,
+        "start_ms": start,
+        "end_ms": end,
+        "duration_ms": end - start,
+        "parent_id": parent,
+        "phase": None,
+        "attributes": {},
+    }
+
+
+def test_nested_spans_record_parent_and_phase():
+    """Test nested spans inherit the parent and phase."""
+    profiler = WorkflowProfiler()
+
+    with profiler.span("workflow", spans.WORKFLOW):
+        with profiler.span("PRD", spans.PHASE, phase="PRD"):
+            with profiler.span("llm_request", spans.LLM):
+                pass
+
+    data = profiler.to_list()
+    assert [span["name"] for span in data] == ["workflow", "PRD", "llm_request"]
+    assert data[2]["parent_id"] == 1
+    assert data[2]["phase"] == "PRD"
+    assert all(span["end_ms"] >= span["start_ms"] for span in data)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_tasks_get_own_parents():
+    """Test spans opened in concurrent tasks are attached to their own parent."""
+    profiler = WorkflowProfiler()
+
+    async def phase(name: str) -> None:
+        with profiler.span(name, spans.PHASE, phase=name):
+            await asyncio.sleep(0)
+            with profiler.span("llm_request", spans.LLM):
+                await asyncio.sleep(0)
+
+    with profiler.span("workflow", spans.WORKFLOW):
+        await asyncio.gather(phase("A"), phase("B"))
+
+    by_id = {span["id"]: span for span in profiler.to_list()}
+    for span in by_id.values():
+        if span["name"] == "llm_request":
+            assert by_id[span["parent_id"]]["phase"] == span["phase"]
+
+
+def test_critical_path_skips_overlapped_work():
+    """Test work fully overlapped by a longer parallel span is off the critical path."""
+    data = [
+        make_span(0, "workflow", spans.WORKFLOW, 0, 100),
+        make_span(1, "detect", spans.LLM, 0, 20, parent=0),
+        make_span(2, "speculative", spans.LLM, 0, 60, parent=0),
+        make_span(3, "save", spans.DB, 60, 70, parent=0),
+        make_span(4, "prd", spans.LLM, 70, 100, parent=0),
+    ]
+
+    path = critical_path(data)
+
+    assert [span["name"] for span in path] == ["speculative", "save", "prd"]
+
+
+def test_breakdown_reports_unaccounted_time():
+    """Test breakdown sums categories and reports gaps as unaccounted."""
+    data = [
+        make_span(0, "workflow", spans.WORKFLOW, 0, 100),
+        make_span(1, "llm", spans.LLM, 0, 80, parent=0),
+        make_span(2, "commit", spans.DB, 85, 95, parent=0),
+    ]
+
+    breakdown = critical_path_breakdown(data)
+
+    assert breakdown["total_ms"] == 100
+    assert breakdown["by_category_ms"] == {"llm": 80, "db": 10}
+    assert breakdown["unaccounted_ms"] == 10
+
+
+def test_zero_duration_spans_terminate():
+    """Test zero-length spans do not stall the critical path walk."""
+    data = [
+        make_span(0, "workflow", spans.WORKFLOW, 0, 10),
+        make_span(1, "a", spans.DB, 5, 5, parent=0),
+        make_span(2, "b", spans.DB, 5, 5, parent=0),
+    ]
+
+    assert len(critical_path(data)) == 2
+
+
+def test_document_checks_recorded_as_validation_spans():
+    """Test document checks appear in the timeline as validate spans of their phase."""
+    profiler = WorkflowProfiler()
+    prd_md = "# Overview\n" + "Requirement details. " * 60
+
+    with profiler.span("workflow", spans.WORKFLOW):
+        with profiler.span("PRD", spans.PHASE, phase="PRD"):
+            passed = check_document(PRD_CHECK, prd_md, profiler, variant=0)
+            failed = check_document(PRD_CHECK, "# Overview", profiler, variant=1)
+
+    data = profiler.to_list()
+    validations = [span for span in data if span["category"] == spans.VALIDATE]
+
+    assert passed is None
+    assert failed == PRD_CHECK.too_short_error
+    assert [span["name"] for span in validations] == ["check_prd", "check_prd"]
+    assert [span["attributes"] for span in validations] == [
+        {"variant": 0, "passed": True},
+        {"variant": 1, "passed": False},
+    ]
+    assert all(span["phase"] == "PRD" for span in validations)
+    assert spans.VALIDATE in critical_path_breakdown(data)["by_category_ms"]
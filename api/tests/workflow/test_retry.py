@@ -0,0 +1,83 @@
+"""Tests for the phase retry policy."""
+import httpx
+import pytest
+
+from app.workflow.retry import RetryPolicy
+
+
+def _status_error(status_code: int, headers: dict = None) -> httpx.HTTPStatusError:
+    request = httpx.Request("POST", "https://openrouter.ai/api/v1/chat/completions")
+    response = httpx.Response(status_code, headers=headers, request=request)
+    return httpx.HTTPStatusError(f"{status_code}", request=request, response=response)
+
+
+def test_transient_errors_are_retryable():
+    """Test timeouts, connection errors, 429 and 5xx are retried, other errors are not."""
+    policy = RetryPolicy()
+    request = httpx.Request("POST", "https://openrouter.ai")
+
+    assert policy.is_retryable(httpx.ReadTimeout("timed out", request=request))
+    assert policy.is_retryable(httpx.ConnectError("refused", request=request))
+    assert policy.is_retryable(_status_error(502))
+    assert policy.is_retryable(_status_error(429))
+    assert not policy.is_retryable(_status_error(401))
+    assert not policy.is_retryable(ValueError("Invalid PRD output"))
+
+
+def test_backoff_is_exponential_with_bounded_jitter():
+    """Test delays double per attempt, are capped and jitter only shortens them."""
+    policy = RetryPolicy(base_delay=1.0, max_delay=5.0, jitter=0.5)
+
+    assert [policy.backoff(attempt, rng=lambda: 0.0) for attempt in (1, 2, 3, 4)] == [1.0, 2.0, 4.0, 5.0]
+    assert policy.backoff(2, rng=lambda: 0.999) > 1.0
+
+
+def test_next_delay_respects_attempts_and_deadline():
+    """Test no retry after the last attempt, past the deadline or for permanent errors."""
+    policy = RetryPolicy(max_attempts=3, base_delay=2.0, jitter=0.0, deadline=30.0)
+    error = _status_error(503)
+
+    assert policy.next_delay(1, error, elapsed=0.0) == 2.0
+    assert policy.next_delay(2, error, elapsed=0.0) == 4.0
+    assert policy.next_delay(3, error, elapsed=0.0) is None
+    assert policy.next_delay(1, error, elapsed=29.0) is None
+    assert policy.next_delay(1, _status_error(400), elapsed=0.0) is None
+
+
+def test_retry_after_header_is_honored():
+    """Test a Retry-After delay replaces the backoff, capped at max_delay."""
+    policy = RetryPolicy(max_delay=10.0, jitter=0.0)
+
+    assert policy.next_delay(1, _status_error(429, {"Retry-After": "7"}), elapsed=0.0) == 7.0
+    assert policy.next_delay(1, _status_error(429, {"Retry-After": "120"}), elapsed=0.0) == 10.0
+
+
+def test_for_phase_applies_overrides(monkeypatch):
+    """Test per-phase overrides from settings replace the defaults."""
+    from app.config import settings
+
+    monkeypatch.setattr(settings, "PHASE_RETRY_OVERRIDES", {"PRD": {"max_attempts": 5.0, "base_delay": 0.5}})
+
+    assert RetryPolicy.for_phase("PRD").max_attempts == 5
+    assert RetryPolicy.for_phase("PRD").base_delay == 0.5
+    assert RetryPolicy.for_phase("TECH_STACK").max_attempts == settings.PHASE_RETRY_MAX_ATTEMPTS
+
+
+@pytest.mark.parametrize(
+    "overrides, match",
+    [
+        ({"max_attemps": 2}, "Unknown retry override"),
+        ({"retryable_status_codes": 500}, "Unknown retry override"),
+        ({"max_attempts": 2.5}, "positive integer"),
+        ({"jitter": 1.5}, "between 0 and 1"),
+        ({"base_delay": -1}, "must not be negative"),
+    ],
+)
+def test_for_phase_rejects_invalid_overrides(monkeypatch, overrides, match):
+    """Test unknown override keys and out-of-range values are rejected."""
+    from app.config import settings
+
+    monkeypatch.setattr(settings, "PHASE_RETRY_OVERRIDES", {"PRD": overrides})
+
+    with pytest.raises(ValueError, match=match):
+        RetryPolicy.for_phase("PRD")
@@ -0,0 +1,146 @@
+"""Tests for the weighted fair workflow scheduler."""
+import asyncio
+
+import pytest
+
+from app.workflow.scheduler import FairScheduler
+
+
+def make_scheduler(**overrides) -> FairScheduler:
+    """Create a scheduler with small limits for tests."""
+    options = {
+        "max_concurrent": 1,
+        "tenant_max_concurrent": 5,
+        "tier_weights": {"standard": 1, "premium": 3},
+    }
+    options.update(overrides)
+    return FairScheduler(**options)
+
+
+async def run_jobs(scheduler: FairScheduler, submissions: list) -> list:
+    """Submit jobs in order and return the order in which they ran."""
+    order = []
+    release = asyncio.Event()
+
+    async def job(name: str) -> str:
+        order.append(name)
+        await release.wait()
+        return name
+
+    # Occupy the only slot so every submission below is queued first
+    blocker = asyncio.create_task(scheduler.run("blocker", lambda: job("blocker")))
+    await asyncio.sleep(0)
+
+    tasks = []
+    for tenant, name in submissions:
+        tasks.append(asyncio.create_task(scheduler.run(tenant, lambda n=name: job(n))))
+        await asyncio.sleep(0)
+
+    release.set()
+    await asyncio.gather(blocker, *tasks)
+    return order[1:]
+
+
+@pytest.mark.asyncio
+async def test_small_tenant_not_starved_by_bulk_tenant():
+    """Test a tenant submitting after a bulk tenant is interleaved, not queued last."""
+    scheduler = make_scheduler()
+    submissions = [("bulk", f"bulk-{i}") for i in range(5)] + [("small", "small-0")]
+
+    order = await run_jobs(scheduler, submissions)
+
+    assert order.index("small-0") <= 1
+
+
+@pytest.mark.asyncio
+async def test_weights_give_premium_larger_share():
+    """Test a higher-weight tier is admitted more often."""
+    scheduler = make_scheduler(tenant_tiers={"vip": "premium"})
+    submissions = [("std", f"std-{i}") for i in range(4)] + [("vip", f"vip-{i}") for i in range(4)]
+
+    order = await run_jobs(scheduler, submissions)
+
+    first_five = order[:5]
+    assert sum(name.startswith("vip") for name in first_five) >= 3
+
+
+@pytest.mark.asyncio
+async def test_tenant_concurrency_cap():
+    """Test a tenant never exceeds its concurrency cap."""
+    scheduler = make_scheduler(max_concurrent=10, tenant_max_concurrent=2)
+    running = 0
+    peak = 0
+
+    async def job() -> None:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+    await asyncio.gather(*(scheduler.run("bulk", job) for _ in range(6)))
+
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_metrics_report_queue_depth():
+    """Test metrics expose per-tenant queued and running counts."""
+    scheduler = make_scheduler()
+    release = asyncio.Event()
+
+    tasks = [asyncio.create_task(scheduler.run("t1", release.wait)) for _ in range(3)]
+    await asyncio.sleep(0)
+
+    metrics = scheduler.metrics()
+    assert metrics["running"] == 1
+    assert metrics["queued"] == 2
+    assert metrics["tenants"]["t1"]["queued"] == 2
+
+    release.set()
+    await asyncio.gather(*tasks)
+    assert scheduler.metrics()["tenants"] == {}
+
+
+@pytest.mark.asyncio
+async def test_cancelled_while_queued_frees_position():
+    """Test cancelling a queued job removes it from the queue."""
+    scheduler = make_scheduler()
+    release = asyncio.Event()
+
+    first = asyncio.create_task(scheduler.run("t1", release.wait))
+    second = asyncio.create_task(scheduler.run("t2", release.wait))
+    await asyncio.sleep(0)
+
+    second.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await second
+
+    assert scheduler.metrics()["queued"] == 0
+    release.set()
+    await first
+
+
+@pytest.mark.asyncio
+async def test_waiter_cancelled_while_slot_is_released():
+    """Test a waiter cancelled in the same tick as a release does not leak the slot."""
+    scheduler = make_scheduler()
+    release = asyncio.Event()
+
+    first = asyncio.create_task(scheduler.run("a", release.wait))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(scheduler.run("b", release.wait))
+    third = asyncio.create_task(scheduler.run("c", release.wait))
+    await asyncio.sleep(0)
+
+    # The slot is released before the cancelled waiter gets to run its cleanup
+    release.set()
+    second.cancel()
+    # A leaked slot would leave the third job queued forever
+    results = await asyncio.wait_for(asyncio.gather(first, second, third, return_exceptions=True), 2)
+
+    assert results[0] is True and results[2] is True
+    assert isinstance(results[1], asyncio.CancelledError)
+    metrics = scheduler.metrics()
+    assert metrics["running"] == 0
+    assert metrics["tenants"] == {}
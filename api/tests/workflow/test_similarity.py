@@ -0,0 +1,66 @@
+"""Tests for MinHash / LSH idea similarity."""
+from app.workflow.similarity import (
+    BANDS,
+    NUM_PERM,
+    estimate_similarity,
+    lsh_bands,
+    minhash_signature,
+    normalize_idea,
+    shortlist,
+    text_similarity,
+)
+
+IDEA = "A task management app for small teams with kanban boards, due dates and Slack notifications"
+
+
+def test_normalize_ignores_case_and_punctuation():
+    """Test normalization drops case, punctuation and extra whitespace."""
+    assert normalize_idea("  Build a TODO-app,  with React!! ") == "build a todo app with react"
+
+
+def test_near_duplicates_are_similar():
+    """Test a reworded idea scores high and an unrelated idea scores low."""
+    reworded = "A task-management app for small teams, with Kanban boards, due dates & Slack notifications."
+    unrelated = "Inventory tracking for a chain of bakeries with barcode scanning and supplier orders"
+
+    assert text_similarity(IDEA, reworded) > 0.8
+    assert text_similarity(IDEA, unrelated) < 0.2
+
+
+def test_signature_is_deterministic():
+    """Test signatures are stable and have one value per permutation."""
+    signature = minhash_signature(IDEA)
+    assert signature == minhash_signature(IDEA.upper())
+    assert len(signature) == NUM_PERM
+    assert all(0 <= value < 2**63 for value in signature)
+
+
+def test_estimate_tracks_exact_similarity():
+    """Test the signature estimate is close to the exact similarity."""
+    other = IDEA.replace("Slack notifications", "email reminders")
+    estimate = estimate_similarity(minhash_signature(IDEA), minhash_signature(other))
+    assert abs(estimate - text_similarity(IDEA, other)) < 0.2
+
+
+def test_similar_ideas_share_a_band():
+    """Test near-duplicates collide in at least one LSH band and unrelated ideas do not."""
+    bands = lsh_bands(minhash_signature(IDEA))
+    similar = lsh_bands(minhash_signature(IDEA + " and a calendar view"))
+    unrelated = lsh_bands(minhash_signature("Recipe sharing site with meal plans and shopping lists"))
+
+    assert len(bands) == BANDS
+    assert all(-(2**63) <= value < 2**63 for value in bands)
+    assert set(bands) & set(similar)
+    assert not set(bands) & set(unrelated)
+
+
+def test_shortlist_orders_by_estimate_and_drops_distant_candidates():
+    """Test band matches are narrowed by their signatures before ideas are compared."""
+    signature = minhash_signature(IDEA)
+    reworded = minhash_signature(IDEA.replace("small teams", "small remote teams"))
+    unrelated = minhash_signature("Inventory tracking for a chain of bakeries with barcode scanning")
+    candidates = [("unrelated", unrelated), ("reworded", reworded), ("same", list(signature))]
+
+    assert shortlist(signature, candidates, min_estimate=0.5, size=5) == ["same", "reworded"]
+    assert shortlist(signature, candidates, min_estimate=0.5, size=1) == ["same"]
+    assert shortlist(signature, [], min_estimate=0.5, size=5) == []
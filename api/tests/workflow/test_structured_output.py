@@ -0,0 +1,83 @@
+"""Tests for structured output parsing and repair."""
+import pytest
+
+from app.schemas.workflow import ApproachDetectionResult, SmartDetectionResult
+from app.workflow.structured_output import (
+    StructuredOutputError,
+    json_schema_response_format,
+    parse_structured,
+    repair_json,
+)
+from app.workflow.validators import JsonStreamValidator, OffTrackOutputError
+
+
+def test_parse_valid_json():
+    """Test valid output is parsed without repair."""
+    result = parse_structured(
+        '{"approach": "HORIZONTAL", "reasoning": "Shared data model"}', ApproachDetectionResult
+    )
+    assert result.approach == "HORIZONTAL"
+
+
+def test_repair_code_fence_and_trailing_comma():
+    """Test fenced output with a trailing comma is repaired locally."""
+    text = 'Here you go:\n```json\n{"approach": "VERTICAL", "reasoning": "Features",}\n```'
+    result = parse_structured(text, ApproachDetectionResult)
+    assert result.approach == "VERTICAL"
+
+
+def test_repair_truncated_output():
+    """Test truncated output gets its string and brackets closed."""
+    assert repair_json('{"a": [1, 2], "b": "unfinish') == '{"a": [1, 2], "b": "unfinish"}'
+    assert repair_json('{"a": 1, "b":') == '{"a": 1, "b": null}'
+
+
+def test_schema_violation_raises():
+    """Test output not matching the schema raises StructuredOutputError."""
+    with pytest.raises(StructuredOutputError) as exc_info:
+        parse_structured('{"approach": "DIAGONAL", "reasoning": "x"}', ApproachDetectionResult)
+    assert "approach" in str(exc_info.value)
+    assert exc_info.value.raw_output
+
+
+def test_json_schema_response_format_is_strict():
+    """Test the response format requires every field and forbids extras."""
+    response_format = json_schema_response_format(SmartDetectionResult)
+    schema = response_format["json_schema"]["schema"]
+
+    assert response_format["json_schema"]["name"] == "smart_detection_result"
+    assert response_format["json_schema"]["strict"] is True
+    assert schema["additionalProperties"] is False
+    assert set(schema["required"]) == set(SmartDetectionResult.model_fields)
+
+
+def test_json_stream_validator_aborts_prose():
+    """Test the JSON stream validator aborts output that is not JSON."""
+    validator = JsonStreamValidator()
+    with pytest.raises(OffTrackOutputError):
+        validator.feed("I'm sorry, but I can't help with that request.")
+
+    validator = JsonStreamValidator()
+    validator.feed('  {"use_event_storming": true')
+    assert validator.finish() is None
+
+
+def test_json_stream_validator_allows_short_prose_prefix():
+    """Test a short lead-in before the JSON value is allowed, but endless prose is not."""
+    validator = JsonStreamValidator()
+    for delta in ("Here is ", "the JSON:\n", '{"use_event_storming": ', "true}"):
+        validator.feed(delta)
+    assert validator.finish() is None
+
+    validator = JsonStreamValidator(max_prose_chars=50)
+    with pytest.raises(OffTrackOutputError):
+        for _ in range(10):
+            validator.feed("This project would benefit from a careful look. ")
+
+
+def test_json_stream_validator_rejects_short_prose_at_finish():
+    """Test a short output without any JSON fails when the stream ends."""
+    validator = JsonStreamValidator()
+    validator.feed("No JSON here.")
+    with pytest.raises(OffTrackOutputError):
+        validator.finish()
@@ -0,0 +1,136 @@
+"""Tests for streaming output validators."""
+import pytest
+
+from app.workflow.validators import (
+    EXECUTION_PLAN_CHECK,
+    PRD_CHECK,
+    PRD_SECTIONS,
+    TECH_STACK_SECTIONS,
+    MarkdownStreamValidator,
+    OffTrackOutputError,
+    SectionReport,
+    first_passing_document,
+    score_document,
+)
+
+
+def feed_in_chunks(validator: MarkdownStreamValidator, text: str, size: int = 7) -> None:
+    """Feed text to a validator in small chunks, like a token stream."""
+    for i in range(0, len(text), size):
+        validator.feed(text[i : i + size])
+
+
+def test_tech_stack_sections_found():
+    """Test headings split across chunks are matched to expected sections."""
+    validator = MarkdownStreamValidator(expected_sections=TECH_STACK_SECTIONS)
+    document = (
+        "# Tech Stack Definition\n\n"
+        "## Frontend\n| Tech | Why |\n\n"
+        "## Backend\nFastAPI\n\n"
+        "## Infrastructure / DevOps\nDocker\n"
+    )
+
+    feed_in_chunks(validator, document)
+    report = validator.finish()
+
+    assert report.found == ["Frontend", "Backend", "Infrastructure"]
+    assert report.missing == []
+    assert report.headings == 4
+
+
+def test_missing_sections_reported():
+    """Test missing sections are reported without aborting."""
+    validator = MarkdownStreamValidator(expected_sections=PRD_SECTIONS)
+    feed_in_chunks(validator, "# PRD\n\n## 1. Project Overview & Vision\nA blog platform.\n")
+    report = validator.finish()
+
+    assert report.found == ["Project Overview & Vision"]
+    assert "Non-Functional Requirements" in report.missing
+
+
+def test_non_functional_heading_does_not_satisfy_functional_requirements():
+    """Test a Non-Functional Requirements heading is not taken for Functional Requirements."""
+    validator = MarkdownStreamValidator(expected_sections=PRD_SECTIONS)
+    feed_in_chunks(validator, "# PRD\n\n## 8. Non-Functional Requirements\nLatency under 200 ms.\n")
+    report = validator.finish()
+
+    assert report.found == ["Non-Functional Requirements"]
+    assert "Functional Requirements" in report.missing
+
+
+def test_json_output_aborts_early():
+    """Test JSON output is rejected once the probe window is filled."""
+    validator = MarkdownStreamValidator(probe_chars=20)
+
+    with pytest.raises(OffTrackOutputError, match="JSON"):
+        feed_in_chunks(validator, '{"prd": "# Product Requirements Document", "sections": []}')
+
+
+def test_refusal_aborts_early():
+    """Test a refusal is detected at the start of the output."""
+    validator = MarkdownStreamValidator(probe_chars=20)
+
+    with pytest.raises(OffTrackOutputError, match="refused"):
+        feed_in_chunks(validator, "I'm sorry, but I can't help with generating this document.")
+
+
+def test_wrong_language_aborts_early():
+    """Test output in a non-Latin script is rejected."""
+    validator = MarkdownStreamValidator(probe_chars=20)
+
+    with pytest.raises(OffTrackOutputError, match="language"):
+        feed_in_chunks(validator, "# 产品需求文档\n\n这是一个博客平台的产品需求文档，包含所有功能。")
+
+
+def test_short_output_checked_on_finish():
+    """Test early checks still run when the output is shorter than the probe."""
+    validator = MarkdownStreamValidator()
+    validator.feed("[]")
+
+    with pytest.raises(OffTrackOutputError):
+        validator.finish()
+
+
+def test_no_heading_limit():
+    """Test the optional no-heading limit aborts plain-text output."""
+    validator = MarkdownStreamValidator(probe_chars=10, max_chars_without_heading=50)
+
+    with pytest.raises(OffTrackOutputError, match="heading"):
+        feed_in_chunks(validator, "This is a long answer without any markdown structure at all. " * 2)
+
+
+def test_score_document_prefers_coverage_and_tasks():
+    """Test scoring ranks complete, task-dense plans higher."""
+    full = SectionReport(found=["Stage"], missing=[])
+    empty = SectionReport(found=[], missing=["Stage"])
+    plan = "## Stage 1\n" + "- [ ] Task\n" * 20
+
+    assert score_document(plan, full, target_chars=200) > score_document(plan, empty, target_chars=200)
+    assert score_document(plan, full, task_weight=0.4) > score_document(
+        "## Stage 1\nProse only.", full, task_weight=0.4
+    )
+    assert 0.0 <= score_document(plan * 50, full, task_weight=0.4) <= 1.0
+
+
+def test_document_checks_require_all_or_any_keyword():
+    """Test plans need every required element while a PRD needs any section keyword."""
+    plan = "## Stage 1\n" + "Some text. " * 100
+
+    assert EXECUTION_PLAN_CHECK.failure(plan) == "Execution Plan missing required elements: Task, [, ]"
+    assert EXECUTION_PLAN_CHECK.failure(plan + "\n- [ ] Task 1.1") is None
+    assert PRD_CHECK.failure("# Scope\n" + "x" * 1000) is None
+    assert PRD_CHECK.failure("# Intro\n" + "x" * 1000) == "PRD missing required sections"
+
+
+def test_first_passing_document_falls_back_to_next_variant():
+    """Test the best-ranked document that passes is picked, else the top document's failure."""
+    too_short = "# Scope\nshort"
+    no_sections = "# Intro\n" + "x" * 1000
+    valid = "# Scope\n" + "x" * 1000
+
+    assert first_passing_document(PRD_CHECK, [too_short, valid, valid]) == (1, None)
+    assert first_passing_document(PRD_CHECK, [valid]) == (0, None)
+    assert first_passing_document(PRD_CHECK, [no_sections, too_short]) == (
+        None,
+        "PRD missing required sections",
+    )